@@ -4,27 +4,203 @@ For more details about this component, please refer to the documentation at
 https://github.com/maorcc/citymind_water_meter
 """
 
+from datetime import datetime, timedelta
 import logging
 import sys
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_START
-from homeassistant.core import HomeAssistant
-
-from .common.consts import DEFAULT_NAME, DOMAIN
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .common.consts import (
+    BACKFILL_DEFAULT_DAYS,
+    DEFAULT_NAME,
+    DOMAIN,
+    METER_CONFIG_MAX_VALUES,
+    METER_CONFIG_MIN_VALUES,
+    PROFILE_DEFAULT_TOP,
+    SERVICE_ATTR_ENTRY_ID,
+    SERVICE_ATTR_METER_IDS,
+    SERVICE_ATTR_START_DATE,
+    SERVICE_ATTR_TOP,
+    SERVICE_ATTR_USE_YAPPI,
+    SERVICE_BACKFILL_STATISTICS,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_SET_TARIFFS,
+    STORAGE_DATA_METER_LOW_RATE_COST,
+    STORAGE_DATA_METER_TIERS,
+    TARIFF_TIER_COST,
+    TARIFF_TIER_LIMIT,
+)
 from .common.entity_descriptions import PLATFORMS
 from .managers.config_manager import ConfigManager
 from .managers.coordinator import Coordinator
 from .managers.password_manager import PasswordManager
+from .managers.refresh_profiler import RefreshProfiler
+from .managers.snapshot_manager import SnapshotManager
+from .managers.statistics_backfill import StatisticsBackfill
 from .models.exceptions import LoginError
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(SERVICE_ATTR_ENTRY_ID): cv.string,
+        vol.Optional(SERVICE_ATTR_TOP, default=PROFILE_DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+        vol.Optional(SERVICE_ATTR_USE_YAPPI, default=False): cv.boolean,
+    }
+)
+
+SERVICE_BACKFILL_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(SERVICE_ATTR_ENTRY_ID): cv.string,
+        vol.Optional(SERVICE_ATTR_START_DATE): cv.date,
+        vol.Optional(SERVICE_ATTR_METER_IDS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SERVICE_SET_TARIFFS_KEYS = [*METER_CONFIG_MAX_VALUES, STORAGE_DATA_METER_TIERS]
+
+TARIFF_TIER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(TARIFF_TIER_LIMIT): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),
+        vol.Required(TARIFF_TIER_COST): vol.All(
+            vol.Coerce(float),
+            vol.Range(
+                min=0, max=METER_CONFIG_MAX_VALUES[STORAGE_DATA_METER_LOW_RATE_COST]
+            ),
+        ),
+    }
+)
+
+SERVICE_SET_TARIFFS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(SERVICE_ATTR_ENTRY_ID): cv.string,
+            vol.Optional(SERVICE_ATTR_METER_IDS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(STORAGE_DATA_METER_TIERS): [TARIFF_TIER_SCHEMA],
+            **{
+                vol.Optional(key): vol.All(
+                    vol.Coerce(float),
+                    vol.Range(min=METER_CONFIG_MIN_VALUES.get(key, 0), max=max_value),
+                )
+                for key, max_value in METER_CONFIG_MAX_VALUES.items()
+            },
+        }
+    ),
+    cv.has_at_least_one_key(*SERVICE_SET_TARIFFS_KEYS),
+)
+
+
+async def async_setup(hass: HomeAssistant, _config):
+    async def _async_profile_refresh(service_call: ServiceCall) -> ServiceResponse:
+        entry_id = service_call.data.get(SERVICE_ATTR_ENTRY_ID)
+        coordinator = _get_coordinator(hass, entry_id)
+
+        profiler = RefreshProfiler(hass, coordinator)
+
+        result = await profiler.profile(
+            service_call.data[SERVICE_ATTR_TOP],
+            service_call.data[SERVICE_ATTR_USE_YAPPI],
+        )
+
+        return result
+
+    async def _async_backfill_statistics(
+        service_call: ServiceCall,
+    ) -> ServiceResponse:
+        entry_id = service_call.data.get(SERVICE_ATTR_ENTRY_ID)
+        coordinator = _get_coordinator(hass, entry_id)
+
+        start_date = service_call.data.get(
+            SERVICE_ATTR_START_DATE,
+            datetime.now().date() - timedelta(days=BACKFILL_DEFAULT_DAYS),
+        )
+
+        result = await coordinator.backfill_statistics(
+            start_date, service_call.data.get(SERVICE_ATTR_METER_IDS)
+        )
+
+        return result
+
+    async def _async_set_tariffs(service_call: ServiceCall) -> ServiceResponse:
+        entry_id = service_call.data.get(SERVICE_ATTR_ENTRY_ID)
+        coordinator = _get_coordinator(hass, entry_id)
+
+        tariffs = {
+            key: service_call.data[key]
+            for key in SERVICE_SET_TARIFFS_KEYS
+            if key in service_call.data
+        }
+
+        result = await coordinator.set_tariffs(
+            tariffs, service_call.data.get(SERVICE_ATTR_METER_IDS)
+        )
+
+        return result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        _async_profile_refresh,
+        schema=SERVICE_PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_STATISTICS,
+        _async_backfill_statistics,
+        schema=SERVICE_BACKFILL_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TARIFFS,
+        _async_set_tariffs,
+        schema=SERVICE_SET_TARIFFS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
-async def async_setup(_hass, _config):
     return True
 
 
+def _get_coordinator(hass: HomeAssistant, entry_id: str | None) -> Coordinator:
+    """Coordinator of the entry, entry ID is optional with a single entry."""
+    coordinators = {
+        key: value
+        for key, value in hass.data.get(DOMAIN, {}).items()
+        if isinstance(value, Coordinator)
+    }
+
+    if entry_id is None and len(coordinators) == 1:
+        entry_id = list(coordinators.keys())[0]
+
+    coordinator = coordinators.get(entry_id)
+
+    if coordinator is None:
+        raise HomeAssistantError(
+            f"{DEFAULT_NAME} entry not found, "
+            "entry ID is required with multiple entries"
+        )
+
+    return coordinator
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a EdgeOS component."""
     initialized = False
@@ -85,21 +261,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     for platform in PLATFORMS:
         await hass.config_entries.async_forward_entry_unload(entry, platform)
 
-    del hass.data[DOMAIN][entry.entry_id]
+    coordinator: Coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+
+    await coordinator.api.terminate()
+    await coordinator.config_manager.flush()
 
     return True
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
-    """Unload a config entry."""
+    """Remove stored data of a config entry, called after it was unloaded."""
     _LOGGER.info(f"Removing {DOMAIN} integration, Entry ID: {entry.entry_id}")
 
     entry_id = entry.entry_id
 
-    coordinator: Coordinator = hass.data[DOMAIN][entry_id]
-
-    await coordinator.config_manager.remove(entry_id)
-
-    result = await async_unload_entry(hass, entry)
+    config_manager = ConfigManager(hass, entry)
+    snapshot_manager = SnapshotManager(hass, entry_id)
 
-    return result
+    await config_manager.remove(entry_id)
+    await snapshot_manager.remove()
+    await StatisticsBackfill.async_remove(hass, entry_id)
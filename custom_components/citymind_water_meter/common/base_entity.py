@@ -124,6 +124,7 @@ class IntegrationBaseEntity(CoordinatorEntity):
         return self._data
 
     async def async_execute_device_action(self, key: str, *kwargs: Any):
+        """Run the action, actions changing portal data request a refresh."""
         async_device_action = self._local_coordinator.get_device_action(
             self._entity_description, self._meter_id, key
         )
@@ -134,12 +135,25 @@ class IntegrationBaseEntity(CoordinatorEntity):
         else:
             await async_device_action(self._entity_description, self._meter_id, *kwargs)
 
-        await self.coordinator.async_request_refresh()
+    async def async_added_to_hass(self) -> None:
+        """Load the state available in the coordinator when entity is added."""
+        await super().async_added_to_hass()
+
+        self._load_coordinator_data()
 
     def update_component(self, data):
         pass
 
     def _handle_coordinator_update(self) -> None:
+        """Load data only for items changed since the last coordinator update."""
+        is_changed = self._local_coordinator.is_changed(
+            self._entity_type, self._meter_id
+        )
+
+        if is_changed or self._entity_description.always_update:
+            self._load_coordinator_data()
+
+    def _load_coordinator_data(self) -> None:
         """Fetch new state parameters for the sensor."""
         try:
             new_data = self._local_coordinator.get_data(
@@ -4,10 +4,15 @@ constants.
 
 from datetime import timedelta
 
+from aiohttp import ClientTimeout
+
 from custom_components.citymind_water_meter.common.enums import (
     AlertChannel,
     AlertType,
+    EndpointClass,
     EntityKeys,
+    ErrorClass,
+    RequestPriority,
 )
 
 ATTR_ACTIONS = "actions"
@@ -22,18 +27,21 @@ DEFAULT_NAME = "CityMind"
 PROVIDER = "Read Your Meter Pro"
 
 CONFIGURATION_FILE = f"{DOMAIN}.config.json"
+CONFIGURATION_SAVE_DELAY = 5
+SNAPSHOT_FILE = f"{DOMAIN}.{{entry_id}}.snapshot.json"
+SNAPSHOT_SAVE_DELAY = 10
+BACKFILL_FILE = f"{DOMAIN}.{{entry_id}}.backfill.json"
+BACKFILL_SAVE_DELAY = 5
 INVALID_TOKEN_SECTION = "https://github.com/maorcc/citymind_water_meter#invalid-token"
 STORAGE_DATA_KEY = "key"
 
 SIGNAL_METER_ADDED = f"{DOMAIN}_METER_ADDED_SIGNAL"
 SIGNAL_ACCOUNT_ADDED = f"{DOMAIN}_ACCOUNT_ADDED_SIGNAL"
-SIGNAL_DATA_CHANGED = f"{DOMAIN}_DATA_CHANGED_SIGNAL"
 
 SIGNAL_API_STATUS = f"{DOMAIN}_API_STATUS_SIGNAL"
 
 ADD_COMPONENT_SIGNALS = [SIGNAL_METER_ADDED, SIGNAL_ACCOUNT_ADDED]
 
-RECONNECT_INTERVAL = timedelta(minutes=1)
 WEEKDAY_UPDATE_DATA_INTERVAL = timedelta(minutes=10)
 WEEKEND_UPDATE_DATA_INTERVAL = timedelta(hours=3)
 UPDATE_ENTITIES_INTERVAL = timedelta(minutes=1)
@@ -43,6 +51,33 @@ UPDATE_DATA_INTERVALS: dict[bool | None, timedelta] = {
     False: WEEKDAY_UPDATE_DATA_INTERVAL,
 }
 
+DEFAULT_MIN_UPDATE_INTERVAL = timedelta(minutes=5)
+DEFAULT_MAX_UPDATE_INTERVAL = timedelta(hours=3)
+LAST_READ_CADENCE_SAMPLES = 8
+LAST_READ_CADENCE_WINDOW_RATIO = 0.1
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+DATA_CLIENT_HUB = "client_hub"
+DATA_CONFIG_STORE = "config_store"
+DATA_PASSWORD_MANAGER = "password_manager"
+HUB_MAX_CONCURRENT_REQUESTS = 8
+HUB_REFRESH_STAGGER = timedelta(seconds=15)
+
+API_RATE_LIMIT = 10.0
+API_RATE_BURST = 20
+
+RETRY_BASE_DELAY = timedelta(minutes=1)
+RETRY_MAX_DELAY = timedelta(hours=1)
+CIRCUIT_FAILURE_THRESHOLD = 5
+
+RETRY_TRANSIENT_ERRORS = [
+    ErrorClass.TIMEOUT,
+    ErrorClass.SERVER_ERROR,
+    ErrorClass.RATE_LIMITED,
+    ErrorClass.CONNECTION,
+]
+
 API_URL = "https://eu-customerportal-api.harmonyencoremdm.com"
 
 CITY_MIND_WEBSITE = "https://rym-pro.com"
@@ -153,6 +188,77 @@ ENDPOINT_DATA_UPDATE_PER_METER = {
 
 ENDPOINT_DATA_RELOAD = {API_DATA_SECTION_SETTINGS: ENDPOINT_MY_ALERTS_SETTINGS}
 
+API_ENDPOINT_CLASSES: dict[str, EndpointClass] = {
+    API_DATA_SECTION_CONSUMPTION_DAILY: EndpointClass.CONSUMPTION,
+    API_DATA_SECTION_CONSUMPTION_MONTHLY: EndpointClass.CONSUMPTION,
+    API_DATA_SECTION_CONSUMPTION_FORECAST: EndpointClass.CONSUMPTION,
+}
+
+API_TIMEOUTS: dict[EndpointClass, ClientTimeout] = {
+    EndpointClass.LOGIN: ClientTimeout(total=30, connect=10, sock_read=20),
+    EndpointClass.ACCOUNT: ClientTimeout(total=30, connect=10, sock_read=20),
+    EndpointClass.CONSUMPTION: ClientTimeout(total=60, connect=10, sock_read=45),
+    EndpointClass.SETTINGS_UPDATE: ClientTimeout(total=20, connect=10, sock_read=15),
+}
+
+API_REQUEST_PRIORITIES: dict[EndpointClass, RequestPriority] = {
+    EndpointClass.LOGIN: RequestPriority.LOGIN,
+    EndpointClass.ACCOUNT: RequestPriority.POLLING,
+    EndpointClass.CONSUMPTION: RequestPriority.POLLING,
+    EndpointClass.SETTINGS_UPDATE: RequestPriority.USER_WRITE,
+}
+
+REQUEST_LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+
+PROFILE_FILE = f"{DOMAIN}.{{entry_id}}.{{timestamp}}.prof"
+PROFILE_DEFAULT_TOP = 20
+PROFILE_NETWORK_WAIT_FUNCTIONS = [
+    "select.epoll",
+    "select.kqueue",
+    "select.poll",
+    "select.select",
+]
+PROFILE_CATEGORIES = {
+    "json_decode": ("json/decoder.py", "decode"),
+    "processors": ("data_processors/base_processor.py", "update"),
+    "entity_state_writes": ("helpers/entity.py", "async_write_ha_state"),
+}
+
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_BACKFILL_STATISTICS = "backfill_statistics"
+SERVICE_SET_TARIFFS = "set_tariffs"
+SERVICE_ATTR_ENTRY_ID = "entry_id"
+SERVICE_ATTR_TOP = "top"
+SERVICE_ATTR_USE_YAPPI = "use_yappi"
+SERVICE_ATTR_START_DATE = "start_date"
+SERVICE_ATTR_METER_IDS = "meter_ids"
+
+BACKFILL_MAX_CONCURRENT_REQUESTS = 2
+BACKFILL_BATCH_SIZE = 500
+BACKFILL_DEFAULT_DAYS = 365
+BACKFILL_CHECKPOINT_FIRST = "first"
+BACKFILL_CHECKPOINT_LAST = "last"
+BACKFILL_CHECKPOINT_SUM = "sum"
+BACKFILL_PAGE_DAYS = 31
+BACKFILL_PAGE_MONTHS = 12
+BACKFILL_PERIODS = {
+    API_DATA_SECTION_CONSUMPTION_DAILY: "daily",
+    API_DATA_SECTION_CONSUMPTION_MONTHLY: "monthly",
+}
+STATISTIC_ID_CONSUMPTION = f"{DOMAIN}:meter_{{meter_id}}_{{period}}_consumption"
+STATISTIC_NAME_CONSUMPTION = "Meter {meter_id} {period} consumption"
+
+API_KEEPALIVE_TIMEOUT = 60
+API_DNS_CACHE_TTL = 300
+
+API_CACHE_TTL: dict[str, timedelta] = {
+    API_DATA_SECTION_CUSTOMER_SERVICE: timedelta(hours=24),
+    API_DATA_SECTION_VACATIONS: timedelta(hours=1),
+    API_DATA_SECTION_SETTINGS: timedelta(hours=1),
+    API_DATA_SECTION_CONSUMPTION_FORECAST: timedelta(hours=6),
+    API_DATA_SECTION_CONSUMPTION_MONTHLY: timedelta(hours=1),
+}
+
 PH_TODAY = "[PH_TODAY]"
 PH_YESTERDAY = "[PH_YESTERDAY]"
 PH_CURRENT_MONTH = "[PH_CURRENT_MONTH]"
@@ -176,6 +282,7 @@ API_DATA_LAST_UPDATE = "last-update"
 ERROR_REASON_INVALID_CREDENTIALS = 5060
 
 API_HEADER_TOKEN = "x-access-token"
+API_TOKEN_REFRESH_INTERVAL = timedelta(hours=12)
 
 ICON_ALERT_MODES = {}
 
@@ -205,12 +312,48 @@ STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD = "low_rate_consumption_thresh
 STORAGE_DATA_METER_LOW_RATE_COST = "low_rate_cost"
 STORAGE_DATA_METER_HIGH_RATE_COST = "high_rate_cost"
 STORAGE_DATA_METER_SEWAGE_COST = "sewage_cost"
+STORAGE_DATA_METER_TIERS = "tiers"
+STORAGE_DATA_METER_FIXED_CHARGE = "fixed_charge"
+STORAGE_DATA_METER_VAT = "vat"
+STORAGE_DATA_METER_HOUSEHOLD_SIZE = "household_size"
+STORAGE_DATA_MIN_UPDATE_INTERVAL = "min-update-interval"
+STORAGE_DATA_MAX_UPDATE_INTERVAL = "max-update-interval"
+STORAGE_DATA_REQUEST_METRICS = "request-metrics"
+SNAPSHOT_DATA_DATE = "date"
+SNAPSHOT_DATA_ACCOUNT = "account"
+SNAPSHOT_DATA_METERS = "meters"
+
+STORAGE_DATA_API_TOKEN = "api-token"
+STORAGE_DATA_API_TOKEN_VALUE = "token"
+STORAGE_DATA_API_TOKEN_ISSUED_AT = "issued_at"
+STORAGE_DATA_API_TOKEN_EMAIL = "email"
 
 DEFAULT_USE_UNIQUE_DEVICE_NAMES = True
+DEFAULT_REQUEST_METRICS = False
 DEFAULT_LOW_RATE_CONSUMPTION_THRESHOLD = 3.5
 DEFAULT_LOW_RATE_COST = 7.955
 DEFAULT_HIGH_RATE_COST = 14.6
 DEFAULT_SEWAGE_COST = 0
+DEFAULT_FIXED_CHARGE = 0
+DEFAULT_VAT = 0
+DEFAULT_HOUSEHOLD_SIZE = 1
+
+TARIFF_TIER_LIMIT = "limit"
+TARIFF_TIER_COST = "cost"
+
+METER_CONFIG_MAX_VALUES = {
+    STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD: 100,
+    STORAGE_DATA_METER_LOW_RATE_COST: 30,
+    STORAGE_DATA_METER_HIGH_RATE_COST: 30,
+    STORAGE_DATA_METER_SEWAGE_COST: 30,
+    STORAGE_DATA_METER_FIXED_CHARGE: 1000,
+    STORAGE_DATA_METER_VAT: 100,
+    STORAGE_DATA_METER_HOUSEHOLD_SIZE: 20,
+}
+
+METER_CONFIG_MIN_VALUES = {
+    STORAGE_DATA_METER_HOUSEHOLD_SIZE: 1,
+}
 
 DEFAULT_METER_CONFIG = {
     STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD: DEFAULT_LOW_RATE_CONSUMPTION_THRESHOLD,
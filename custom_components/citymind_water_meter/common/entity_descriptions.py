@@ -9,11 +9,11 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.components.switch import SwitchEntityDescription
-from homeassistant.const import EntityCategory, Platform, UnitOfVolume
+from homeassistant.const import EntityCategory, Platform, UnitOfTime, UnitOfVolume
 from homeassistant.helpers.entity import EntityDescription
 
 from .consts import UNIT_COST
-from .enums import EntityKeys, EntityType, ResetPolicy
+from .enums import CircuitState, EntityKeys, EntityType, ResetPolicy
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -21,6 +21,7 @@ class IntegrationEntityDescription(EntityDescription):
     platform: Platform | None = None
     entity_type: EntityType | None
     reset_policy: ResetPolicy = ResetPolicy.NONE
+    always_update: bool = False
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -164,6 +165,14 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:currency-ils",
         reset_policy=ResetPolicy.MONTHLY,
     ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.TOTAL_COST,
+        entity_type=EntityType.METER,
+        state_class=SensorStateClass.TOTAL,
+        native_unit_of_measurement=UNIT_COST,
+        icon="mdi:currency-ils",
+        reset_policy=ResetPolicy.MONTHLY,
+    ),
     IntegrationNumberEntityDescription(
         key=EntityKeys.SEWAGE_COST,
         entity_type=EntityType.METER,
@@ -191,6 +200,43 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         entity_type=EntityType.ACCOUNT,
         state_class=SensorStateClass.MEASUREMENT,
     ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.API_CIRCUIT_STATE,
+        entity_type=EntityType.ACCOUNT,
+        device_class=SensorDeviceClass.ENUM,
+        options=[str(circuit_state) for circuit_state in CircuitState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:electric-switch",
+        always_update=True,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.LAST_REFRESH_DURATION,
+        entity_type=EntityType.ACCOUNT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_update=True,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.P95_REQUEST_LATENCY,
+        entity_type=EntityType.ACCOUNT,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        always_update=True,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.REQUEST_ERRORS,
+        entity_type=EntityType.ACCOUNT,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:alert-circle-outline",
+        always_update=True,
+    ),
     IntegrationSwitchEntityDescription(
         key=EntityKeys.ALERT_EXCEEDED_THRESHOLD_SMS,
         entity_category=EntityCategory.CONFIG,
@@ -226,6 +272,34 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         entity_category=EntityCategory.CONFIG,
         entity_type=EntityType.ACCOUNT,
     ),
+    IntegrationSwitchEntityDescription(
+        key=EntityKeys.REQUEST_METRICS,
+        entity_category=EntityCategory.CONFIG,
+        entity_type=EntityType.ACCOUNT,
+        icon="mdi:chart-timeline-variant",
+    ),
+    IntegrationNumberEntityDescription(
+        key=EntityKeys.MIN_UPDATE_INTERVAL,
+        entity_type=EntityType.ACCOUNT,
+        mode=NumberMode.BOX,
+        native_step=1,
+        native_min_value=1,
+        native_max_value=1440,
+        entity_category=EntityCategory.CONFIG,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        icon="mdi:timer-sand",
+    ),
+    IntegrationNumberEntityDescription(
+        key=EntityKeys.MAX_UPDATE_INTERVAL,
+        entity_type=EntityType.ACCOUNT,
+        mode=NumberMode.BOX,
+        native_step=1,
+        native_min_value=1,
+        native_max_value=1440,
+        entity_category=EntityCategory.CONFIG,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        icon="mdi:timer-sand-complete",
+    ),
 ]
 
 
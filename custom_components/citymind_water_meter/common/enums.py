@@ -17,6 +17,34 @@ class EntityType(StrEnum):
     ACCOUNT = "Account"
 
 
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ErrorClass(StrEnum):
+    TIMEOUT = "timeout"
+    SERVER_ERROR = "server_error"
+    RATE_LIMITED = "rate_limited"
+    UNAUTHORIZED = "unauthorized"
+    CLIENT_ERROR = "client_error"
+    CONNECTION = "connection"
+
+
+class EndpointClass(StrEnum):
+    LOGIN = "login"
+    ACCOUNT = "account"
+    CONSUMPTION = "consumption"
+    SETTINGS_UPDATE = "settings_update"
+
+
+class RequestPriority(Enum):
+    USER_WRITE = 0
+    LOGIN = 1
+    POLLING = 2
+
+
 class ResetPolicy(Enum):
     NONE = 0
     DAILY = 1
@@ -37,6 +65,7 @@ class EntityKeys(StrEnum):
     HIGH_RATE_COST = "high_rate_cost"
     SEWAGE_COST = "sewage_cost"
     SEWAGE_TOTAL_COST = "sewage_total_cost"
+    TOTAL_COST = "total_cost"
     LOW_RATE_CONSUMPTION_THRESHOLD = "low_rate_consumption_threshold"
     ALERTS = "alerts"
     ALERT_LEAK_WHILE_AWAY_SMS = "alert_leak_while_away_sms"
@@ -46,3 +75,10 @@ class EntityKeys(StrEnum):
     ALERT_EXCEEDED_THRESHOLD_SMS = "alert_exceeded_threshold_sms"
     ALERT_EXCEEDED_THRESHOLD_EMAIL = "alert_exceeded_threshold_email"
     USE_UNIQUE_DEVICE_NAMES = "use_unique_device_name"
+    MIN_UPDATE_INTERVAL = "min_update_interval"
+    MAX_UPDATE_INTERVAL = "max_update_interval"
+    API_CIRCUIT_STATE = "api_circuit_state"
+    REQUEST_METRICS = "request_metrics"
+    LAST_REFRESH_DURATION = "last_refresh_duration"
+    P95_REQUEST_LATENCY = "p95_request_latency"
+    REQUEST_ERRORS = "request_errors"
@@ -6,6 +6,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from ..common.consts import (
     ALERT_MAPPING,
     API_DATA_SECTION_CUSTOMER_SERVICE,
+    API_DATA_SECTION_ME,
     API_DATA_SECTION_MY_ALERTS,
     API_DATA_SECTION_MY_MESSAGES,
     API_DATA_SECTION_SETTINGS,
@@ -31,6 +32,13 @@ _LOGGER = logging.getLogger(__name__)
 
 class AccountProcessor(BaseProcessor):
     _account: AccountData | None = None
+    _sections: list[str] = [
+        API_DATA_SECTION_ME,
+        API_DATA_SECTION_CUSTOMER_SERVICE,
+        API_DATA_SECTION_MY_ALERTS,
+        API_DATA_SECTION_MY_MESSAGES,
+        API_DATA_SECTION_SETTINGS,
+    ]
 
     def __init__(self, config_manager: ConfigManager):
         super().__init__(config_manager)
@@ -44,6 +52,15 @@ class AccountProcessor(BaseProcessor):
     def get(self) -> AccountData | None:
         return self._account
 
+    def restore(self, data: dict):
+        account = AccountData.from_dict(data)
+
+        self._account_number = account.account_number
+        self._first_name = account.first_name
+        self._last_name = account.last_name
+
+        self._account = account
+
     def get_device_info(self, identifier: str | None = None) -> DeviceInfo:
         if self._config_manager.use_unique_device_names:
             device_name = self._account.unique_name
@@ -102,6 +119,15 @@ class AccountProcessor(BaseProcessor):
 
             account.alert_settings = self._get_alert_settings(settings_section)
 
+            is_changed = (
+                self._is_forced
+                or self._account is None
+                or self._account.to_dict() != account.to_dict()
+            )
+
+            if is_changed:
+                self._changed_items.add(None)
+
             self._account = account
 
         except Exception as ex:
@@ -27,6 +27,12 @@ class BaseProcessor:
     _config_manager: ConfigManager | None = None
     _config_data: ConfigData | None = None
     _unique_messages: list[str] | None = None
+    _sections: list[str] = [API_DATA_SECTION_ME]
+    _revisions: dict[tuple[str, str | None], int] | None = None
+    _processed_revisions: dict[tuple[str, str | None], int] | None = None
+    _config_revision: int | None = None
+    _is_forced: bool = True
+    _changed_items: set[str | None] | None = None
 
     def __init__(self, config_manager: ConfigManager):
         self._config_manager = config_manager
@@ -38,20 +44,66 @@ class BaseProcessor:
 
         self._unique_messages = []
 
+        self._revisions = None
+        self._processed_revisions = {}
+        self._config_revision = None
+        self._is_forced = True
+        self._changed_items = set()
+
     @property
     def processor_type(self) -> EntityType | None:
         return None
 
-    def update(self, api_data: dict):
+    @property
+    def changed_items(self) -> set[str | None]:
+        """Items (meter ID, None for account) changed by the last update."""
+        return self._changed_items
+
+    def update(
+        self, api_data: dict, revisions: dict[tuple[str, str | None], int] | None = None
+    ):
+        """Process API data, skipped when relevant sections did not change.
+
+        Without revisions (or on day / configuration change) all data is processed.
+        """
         self._api_data = api_data
+        self._revisions = revisions
+        self._changed_items = set()
 
         analytic_periods = self._config_manager.analytic_periods
+        config_revision = self._config_manager.revision
+
+        self._is_forced = (
+            revisions is None
+            or self._today_iso != analytic_periods.today_iso
+            or self._config_revision != config_revision
+        )
 
         self._today_iso = analytic_periods.today_iso
         self._yesterday_iso = analytic_periods.yesterday_iso
         self._current_month_iso = analytic_periods.current_month_iso
+        self._config_revision = config_revision
+
+        if self._should_process():
+            self._process_api_data()
 
-        self._process_api_data()
+        self._processed_revisions = {} if revisions is None else dict(revisions)
+
+    def _should_process(self) -> bool:
+        should_process = self._is_forced or any(
+            self._is_changed(section) for section in self._sections
+        )
+
+        return should_process
+
+    def _is_changed(self, section: str, item_id: str | None = None) -> bool:
+        if self._is_forced:
+            return True
+
+        key = (section, item_id)
+        is_changed = self._revisions.get(key) != self._processed_revisions.get(key)
+
+        return is_changed
 
     def _process_api_data(self):
         me_section = self._api_data.get(API_DATA_SECTION_ME)
@@ -91,9 +143,6 @@ class BaseProcessor:
 
         name = " ".join(relevant_parts)
 
-        _LOGGER.debug(f"Processor type: {str(process_type)}")
-        _LOGGER.debug(f"Default device name: {name}")
-
         return name
 
     def _get_device_info_unique_id(self, item_id: str | None = None) -> str:
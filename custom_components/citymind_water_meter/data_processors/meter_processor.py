@@ -8,6 +8,7 @@ from ..common.consts import (
     API_DATA_SECTION_CONSUMPTION_FORECAST,
     API_DATA_SECTION_CONSUMPTION_MONTHLY,
     API_DATA_SECTION_LAST_READ,
+    API_DATA_SECTION_ME,
     API_DATA_SECTION_METERS,
     CONSUMPTION_DATA,
     CONSUMPTION_DATE,
@@ -32,6 +33,21 @@ _LOGGER = logging.getLogger(__name__)
 class MeterProcessor(BaseProcessor):
     _meters: dict[str, MeterData]
     _account_device_id: str | None = None
+    _meters_signature: tuple | None = None
+    _meters_version: int = 0
+    _device_infos: dict[str, DeviceInfo]
+    _device_index: dict[str, str]
+    _device_index_key: tuple | None = None
+    _sections: list[str] = [
+        API_DATA_SECTION_ME,
+        API_DATA_SECTION_METERS,
+        API_DATA_SECTION_LAST_READ,
+    ]
+    _meter_sections: list[str] = [
+        API_DATA_SECTION_CONSUMPTION_DAILY,
+        API_DATA_SECTION_CONSUMPTION_MONTHLY,
+        API_DATA_SECTION_CONSUMPTION_FORECAST,
+    ]
 
     def __init__(self, config_manager: ConfigManager):
         super().__init__(config_manager)
@@ -39,6 +55,12 @@ class MeterProcessor(BaseProcessor):
         self._meters = {}
         self._account_device_id = None
 
+        self._meters_signature = None
+        self._meters_version = 0
+        self._device_infos = {}
+        self._device_index = {}
+        self._device_index_key = None
+
     @property
     def processor_type(self) -> EntityType | None:
         return EntityType.METER
@@ -54,15 +76,25 @@ class MeterProcessor(BaseProcessor):
     def set_account_device_id(self, account_device_id: str):
         self._account_device_id = account_device_id
 
+    def restore(self, items: list[dict]):
+        for item in items:
+            meter = MeterData.from_dict(item)
+
+            self._load_meter_config(meter)
+
+            self._meters[meter.meter_id] = meter
+
+        self._update_meters_signature()
+
     def get_meter(self, identifiers: set[tuple[str, str]]) -> dict | None:
         device: dict | None = None
         device_identifier = list(identifiers)[0][1]
 
-        for meter_id in self._meters:
-            unique_id = self._get_device_info_unique_id(meter_id)
+        device_index = self._get_device_index()
+        meter_id = device_index.get(device_identifier)
 
-            if unique_id == device_identifier:
-                device = self._meters[meter_id].to_dict()
+        if meter_id is not None:
+            device = self._meters[meter_id].to_dict()
 
         return device
 
@@ -72,7 +104,39 @@ class MeterProcessor(BaseProcessor):
         return meter
 
     def get_device_info(self, identifier: str | None = None) -> DeviceInfo:
-        device = self.get_data(identifier)
+        self._get_device_index()
+
+        device_info = self._device_infos.get(identifier)
+
+        return device_info
+
+    def _get_device_index(self) -> dict[str, str]:
+        """Device identifier to meter ID, rebuilt when meters or naming change."""
+        device_index_key = (
+            self._meters_version,
+            self._config_manager.use_unique_device_names,
+            self._account_device_id,
+        )
+
+        if device_index_key != self._device_index_key:
+            device_infos = {}
+            device_index = {}
+
+            for meter_id in self._meters:
+                device_info = self._create_device_info(meter_id)
+                device_identifier = list(device_info["identifiers"])[0][1]
+
+                device_infos[meter_id] = device_info
+                device_index[device_identifier] = meter_id
+
+            self._device_infos = device_infos
+            self._device_index = device_index
+            self._device_index_key = device_index_key
+
+        return self._device_index
+
+    def _create_device_info(self, meter_id: str) -> DeviceInfo:
+        device = self.get_data(meter_id)
 
         if self._config_manager.use_unique_device_names:
             device_name = device.unique_name
@@ -96,6 +160,37 @@ class MeterProcessor(BaseProcessor):
 
         return device_info
 
+    def _update_meters_signature(self):
+        meters_signature = tuple(
+            (meter.meter_id, meter.meter_serial_number, meter.address)
+            for meter in self._meters.values()
+        )
+
+        if meters_signature != self._meters_signature:
+            self._meters_signature = meters_signature
+            self._meters_version += 1
+
+    def _should_process(self) -> bool:
+        should_process = super()._should_process() or any(
+            self._is_meter_changed(meter_id) for meter_id in self._get_api_meter_ids()
+        )
+
+        return should_process
+
+    def _is_meter_changed(self, meter_id: str) -> bool:
+        is_changed = any(
+            self._is_changed(section, meter_id) for section in self._meter_sections
+        )
+
+        return is_changed
+
+    def _get_api_meter_ids(self) -> list[str]:
+        meters = self._api_data.get(API_DATA_SECTION_METERS, [])
+
+        meter_ids = [str(meter.get(METER_COUNT)) for meter in meters]
+
+        return meter_ids
+
     def _process_api_data(self):
         super()._process_api_data()
 
@@ -112,6 +207,19 @@ class MeterProcessor(BaseProcessor):
                 API_DATA_SECTION_CONSUMPTION_FORECAST
             )
 
+            is_all_changed = any(
+                self._is_changed(section) for section in self._sections
+            )
+
+            changed_meters = [
+                meter
+                for meter in meters
+                if is_all_changed or self._is_meter_changed(str(meter.get(METER_COUNT)))
+            ]
+            changed_meter_ids = [
+                str(meter.get(METER_COUNT)) for meter in changed_meters
+            ]
+
             last_read_details = {
                 str(last_read_item.get(LAST_READ_METER_COUNT)): last_read_item.get(
                     LAST_READ_VALUE
@@ -119,15 +227,26 @@ class MeterProcessor(BaseProcessor):
                 for last_read_item in last_read_section
             }
 
-            for meter in meters:
+            daily_consumption = self._get_consumption_index(
+                daily_consumption_section, len(self._today_iso), changed_meter_ids
+            )
+            monthly_consumption = self._get_consumption_index(
+                monthly_consumption_section,
+                len(self._current_month_iso),
+                changed_meter_ids,
+            )
+
+            for meter in changed_meters:
                 self._load_meter(
                     meter,
                     last_read_details,
-                    daily_consumption_section,
-                    monthly_consumption_section,
+                    daily_consumption,
+                    monthly_consumption,
                     consumption_forecast_section,
                 )
 
+            self._update_meters_signature()
+
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -140,8 +259,8 @@ class MeterProcessor(BaseProcessor):
         self,
         meter_details: dict,
         last_read_details: dict,
-        daily_consumption_section: dict,
-        monthly_consumption_section: dict,
+        daily_consumption: dict[str, dict],
+        monthly_consumption: dict[str, dict],
         consumption_forecast_section: dict,
     ):
         meter_serial_number = meter_details.get(METER_SERIAL_NUMBER)
@@ -152,13 +271,13 @@ class MeterProcessor(BaseProcessor):
         last_read = self._format_number(last_read_value, 3)
 
         yesterday_consumption = self._get_consumption(
-            daily_consumption_section, meter_id, self._yesterday_iso
+            daily_consumption, meter_id, self._yesterday_iso
         )
         today_consumption = self._get_consumption(
-            daily_consumption_section, meter_id, self._today_iso
+            daily_consumption, meter_id, self._today_iso
         )
-        monthly_consumption = self._get_consumption(
-            monthly_consumption_section, meter_id, self._current_month_iso
+        current_month_consumption = self._get_consumption(
+            monthly_consumption, meter_id, self._current_month_iso
         )
 
         consumption_forecast_data = consumption_forecast_section.get(str(meter_id))
@@ -175,18 +294,43 @@ class MeterProcessor(BaseProcessor):
         meter.last_read = last_read
         meter.today_consumption = today_consumption
         meter.yesterday_consumption = yesterday_consumption
-        meter.monthly_consumption = monthly_consumption
+        meter.monthly_consumption = current_month_consumption
         meter.consumption_forecast = consumption_forecast
 
-        meter.low_rate_consumption_threshold = (
-            self._config_manager.get_low_rate_consumption_threshold(meter_id)
+        self._load_meter_config(meter)
+
+        previous_meter = self._meters.get(meter_id)
+
+        is_changed = (
+            self._is_forced
+            or previous_meter is None
+            or previous_meter.to_dict() != meter.to_dict()
         )
-        meter.low_rate_cost = self._config_manager.get_low_rate_cost(meter_id)
-        meter.high_rate_cost = self._config_manager.get_high_rate_cost(meter_id)
-        meter.sewage_cost = self._config_manager.get_sewage_cost(meter_id)
+
+        if is_changed:
+            self._changed_items.add(meter_id)
 
         self._meters[meter_id] = meter
 
+    def reload_meter_config(self, meter_ids: list[str]):
+        """Apply configuration (tariffs) to already processed meters."""
+        for meter_id in meter_ids:
+            meter = self._meters.get(meter_id)
+
+            if meter is not None:
+                self._load_meter_config(meter)
+
+    def _load_meter_config(self, meter: MeterData):
+        meter_id = meter.meter_id
+        config_manager = self._config_manager
+
+        meter.low_rate_consumption_threshold = (
+            config_manager.get_low_rate_consumption_threshold(meter_id)
+        )
+        meter.low_rate_cost = config_manager.get_low_rate_cost(meter_id)
+        meter.high_rate_cost = config_manager.get_high_rate_cost(meter_id)
+        meter.sewage_cost = config_manager.get_sewage_cost(meter_id)
+
     def _set_meter(
         self,
         meter_id: str,
@@ -216,44 +360,83 @@ class MeterProcessor(BaseProcessor):
 
         return result
 
+    def _get_consumption_index(
+        self, data: dict | None, date_length: int, meter_ids: list[str] | None = None
+    ) -> dict[str, dict[str, int | float | None]]:
+        """Parse consumption section once, {meter_id: {date: value}}.
+
+        Dates are normalized to the first date_length characters, first item
+        of a date wins, items of other meters are ignored.
+        """
+        index = {}
+
+        if data is None:
+            return index
+
+        if meter_ids is None:
+            meter_ids = list(data.keys())
+
+        for meter_id in meter_ids:
+            if meter_id not in data:
+                continue
+
+            meter_index = {}
+
+            try:
+                meter_index = self.parse_consumption(
+                    data.get(meter_id), meter_id, date_length
+                )
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(
+                    f"Failed to parse consumption details, "
+                    f"Meter {meter_id}, Error: {ex}, Line: {line_number}"
+                )
+
+            index[meter_id] = meter_index
+
+        return index
+
+    @staticmethod
+    def parse_consumption(
+        consumption_info: dict | list, meter_id: str, date_length: int
+    ) -> dict[str, int | float | None]:
+        """Consumption response of a meter as {date: value}, first item wins."""
+        meter_index = {}
+
+        if isinstance(consumption_info, dict) and consumption_info.get(
+            CONSUMPTION_DATA
+        ):
+            consumption_info = consumption_info.get(CONSUMPTION_DATA)
+
+        for consumption_item in consumption_info:
+            if consumption_item is not None:
+                consumption_meter_count = consumption_item.get(CONSUMPTION_METER_COUNT)
+
+                if str(consumption_meter_count) != meter_id:
+                    continue
+
+                consumption_date = consumption_item.get(CONSUMPTION_DATE)
+                consumption_value = consumption_item.get(CONSUMPTION_VALUE, 0)
+
+                date_key = consumption_date[:date_length]
+
+                if date_key not in meter_index:
+                    meter_index[date_key] = consumption_value
+
+        return meter_index
+
     def _get_consumption(
-        self, data: dict, meter_id: str, date_iso: str
+        self, index: dict[str, dict], meter_id: str, date_iso: str
     ) -> int | float | None:
         state = None
 
-        try:
-            if data is not None:
-                consumption_info = data.get(meter_id)
-                if isinstance(consumption_info, dict) and consumption_info.get(
-                    CONSUMPTION_DATA
-                ):
-                    consumption_info = consumption_info.get(CONSUMPTION_DATA)
-                for consumption_item in consumption_info:
-                    if consumption_item is not None:
-                        consumption_meter_count = consumption_item.get(
-                            CONSUMPTION_METER_COUNT
-                        )
-                        consumption_date = consumption_item.get(CONSUMPTION_DATE)
-                        consumption_value = consumption_item.get(CONSUMPTION_VALUE, 0)
-
-                        is_meter_relevant = str(consumption_meter_count) == meter_id
-                        is_date_relevant = consumption_date.startswith(date_iso)
-
-                        if is_meter_relevant and is_date_relevant:
-                            if consumption_value is not None:
-                                consumption = float(consumption_value)
-
-                                state = self._format_number(consumption, 3)
-
-                            break
+        consumption_value = index.get(meter_id, {}).get(date_iso)
 
-        except Exception as ex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
-
-            _LOGGER.error(
-                f"Failed to load extract consumption ({date_iso}) details, "
-                f"Meter {meter_id}, Error: {ex}, Line: {line_number}"
-            )
+        if consumption_value is not None:
+            state = self._format_number(float(consumption_value), 3)
 
         return state
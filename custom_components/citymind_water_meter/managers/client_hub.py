@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+import logging
+
+from aiohttp import ClientSession, TCPConnector
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.ssl import get_default_no_verify_context
+
+from ..common.consts import (
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_REQUEST_PRIORITIES,
+    API_TIMEOUTS,
+    DATA_CLIENT_HUB,
+    DOMAIN,
+    HUB_MAX_CONCURRENT_REQUESTS,
+    HUB_REFRESH_STAGGER,
+)
+from ..common.enums import EndpointClass
+from .connection_stats import ConnectionStats
+from .rate_limiter import RateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ClientHub:
+    """HTTP client shared by all config entries (accounts) of the domain.
+
+    Owns a single pooled session, bounds the request rate (token bucket) and
+    concurrent requests of all entries with one budget and staggers the
+    refresh times of the entries.
+    """
+
+    _max_concurrent_requests: int
+    _stagger: timedelta
+    _semaphore: asyncio.Semaphore
+    _rate_limiter: RateLimiter | None
+    _session: ClientSession | None
+    _connection_stats: ConnectionStats
+    _clients: set
+    _refresh_times: dict[str, datetime]
+    _in_flight: int
+    _peak_in_flight: int
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = HUB_MAX_CONCURRENT_REQUESTS,
+        stagger: timedelta = HUB_REFRESH_STAGGER,
+        rate: float | None = API_RATE_LIMIT,
+        burst: int = API_RATE_BURST,
+    ):
+        """Rate of None disables the rate limit."""
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        self._stagger = stagger
+        self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        self._rate_limiter = None if rate is None else RateLimiter(rate, burst)
+        self._session = None
+        self._connection_stats = ConnectionStats()
+        self._clients = set()
+        self._refresh_times = {}
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @staticmethod
+    def get_instance(hass: HomeAssistant) -> ClientHub:
+        """Domain wide hub, created by the first entry asking for it."""
+        domain_data = hass.data.setdefault(DOMAIN, {})
+
+        client_hub = domain_data.get(DATA_CLIENT_HUB)
+
+        if client_hub is None:
+            client_hub = ClientHub()
+
+            domain_data[DATA_CLIENT_HUB] = client_hub
+
+        return client_hub
+
+    @property
+    def clients(self) -> int:
+        clients = len(self._clients)
+
+        return clients
+
+    @property
+    def peak_in_flight(self) -> int:
+        peak_in_flight = self._peak_in_flight
+
+        return peak_in_flight
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        connection_stats = self._connection_stats
+
+        return connection_stats
+
+    def get_session(self, client) -> ClientSession:
+        """Pooled session, the hub keeps it open while any client is registered."""
+        self._clients.add(client)
+
+        if self._session is None or self._session.closed:
+            # Certificate is not verified, context is built once and shared
+            connector = TCPConnector(
+                limit=self._max_concurrent_requests,
+                limit_per_host=self._max_concurrent_requests,
+                ttl_dns_cache=API_DNS_CACHE_TTL,
+                keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+                ssl=get_default_no_verify_context(),
+            )
+
+            self._session = ClientSession(
+                connector=connector,
+                timeout=API_TIMEOUTS[EndpointClass.ACCOUNT],
+                trace_configs=[self._connection_stats.trace_config],
+            )
+
+        return self._session
+
+    async def release(self, client, refresh_key: str | None = None):
+        """Unregister client, closes the session once no client is left."""
+        self._clients.discard(client)
+
+        if refresh_key is not None:
+            self._refresh_times.pop(refresh_key, None)
+
+        if not self._clients and self._session is not None:
+            await self._session.close()
+
+            self._session = None
+
+    @asynccontextmanager
+    async def request_slot(
+        self, endpoint_class: EndpointClass = EndpointClass.ACCOUNT
+    ) -> AsyncIterator[None]:
+        """Take a rate limit token and hold one of the concurrent requests."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(API_REQUEST_PRIORITIES[endpoint_class])
+
+        async with self._semaphore:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+            try:
+                yield
+
+            finally:
+                self._in_flight -= 1
+
+    def stagger(
+        self, refresh_key: str, interval: timedelta, now: datetime | None = None
+    ) -> timedelta:
+        """Delay next refresh of an entry so it is apart from other entries."""
+        now = now or datetime.now()
+        refresh_time = now + interval
+
+        other_refresh_times = sorted(
+            other_refresh_time
+            for key, other_refresh_time in self._refresh_times.items()
+            if key != refresh_key
+        )
+
+        for other_refresh_time in other_refresh_times:
+            if abs(refresh_time - other_refresh_time) < self._stagger:
+                refresh_time = other_refresh_time + self._stagger
+
+        self._refresh_times[refresh_key] = refresh_time
+
+        staggered_interval = refresh_time - now
+
+        return staggered_interval
+
+    def to_dict(self) -> dict:
+        obj = {
+            "clients": len(self._clients),
+            "max_concurrent_requests": self._max_concurrent_requests,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "rate_limiter": (
+                None if self._rate_limiter is None else self._rate_limiter.to_dict()
+            ),
+            "refresh_times": self._refresh_times,
+            "connections": self._connection_stats.to_dict(),
+        }
+
+        return obj
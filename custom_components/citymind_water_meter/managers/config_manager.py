@@ -1,38 +1,45 @@
 from copy import copy
-import json
+from datetime import datetime, timedelta
 import logging
 import sys
-from typing import Any
 
 from cryptography.fernet import InvalidToken
 
-from homeassistant.config_entries import STORAGE_VERSION, ConfigEntry
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import dispatcher_send
-from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.storage import Store
 
 from ..common.consts import (
-    CONFIGURATION_FILE,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DEFAULT_METER_CONFIG,
+    DEFAULT_MIN_UPDATE_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_REQUEST_METRICS,
     DEFAULT_USE_UNIQUE_DEVICE_NAMES,
     DOMAIN,
     INVALID_TOKEN_SECTION,
-    SIGNAL_DATA_CHANGED,
+    STORAGE_DATA_API_TOKEN,
+    STORAGE_DATA_API_TOKEN_EMAIL,
+    STORAGE_DATA_API_TOKEN_ISSUED_AT,
+    STORAGE_DATA_API_TOKEN_VALUE,
+    STORAGE_DATA_MAX_UPDATE_INTERVAL,
     STORAGE_DATA_METER_HIGH_RATE_COST,
     STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD,
     STORAGE_DATA_METER_LOW_RATE_COST,
     STORAGE_DATA_METER_SEWAGE_COST,
     STORAGE_DATA_METERS,
+    STORAGE_DATA_MIN_UPDATE_INTERVAL,
+    STORAGE_DATA_REQUEST_METRICS,
     STORAGE_DATA_USE_UNIQUE_DEVICE_NAMES,
 )
 from ..common.entity_descriptions import IntegrationEntityDescription
 from ..models.analytics_periods import AnalyticPeriodsData
 from ..models.config_data import ConfigData
+from ..models.tariff import Tariff
+from .config_store import ConfigStore
+from .password_manager import PasswordManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,11 +48,14 @@ class ConfigManager:
     _data: dict | None
     _config_data: ConfigData
 
-    _store: Store | None
+    _config_store: ConfigStore | None
     _translations: dict | None
     _password: str | None
     _entry_title: str
     _entry_id: str
+    _api_token: str | None
+    _api_token_issued_at: datetime | None
+    _revision: int
 
     _is_set_up_mode: bool
     _is_initialized: bool
@@ -58,14 +68,15 @@ class ConfigManager:
         self._entry_id = None if entry is None else entry.entry_id
         self._entry_title = DEFAULT_NAME if entry is None else entry.title
 
-        self._local_async_dispatcher_send = None
-
         self._config_data = ConfigData()
 
         self._data = None
 
-        self._store = None
+        self._config_store = None
         self._translations = None
+        self._api_token = None
+        self._api_token_issued_at = None
+        self._revision = 0
 
         self._is_set_up_mode = entry is None
         self._is_initialized = False
@@ -73,9 +84,7 @@ class ConfigManager:
         self.analytic_periods = AnalyticPeriodsData()
 
         if hass is not None:
-            self._store = Store(
-                hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
-            )
+            self._config_store = ConfigStore.get_instance(hass)
 
     @property
     def is_initialized(self) -> bool:
@@ -83,6 +92,13 @@ class ConfigManager:
 
         return is_initialized
 
+    @property
+    def revision(self) -> int:
+        """Incremented on every change requiring data to be processed again."""
+        revision = self._revision
+
+        return revision
+
     @property
     def entry_id(self) -> str:
         entry_id = self._entry_id
@@ -115,18 +131,60 @@ class ConfigManager:
 
         return result
 
+    @property
+    def request_metrics(self) -> bool:
+        result = self._data.get(STORAGE_DATA_REQUEST_METRICS, DEFAULT_REQUEST_METRICS)
+
+        return result
+
+    @property
+    def min_update_interval(self) -> timedelta:
+        minutes = self._data.get(
+            STORAGE_DATA_MIN_UPDATE_INTERVAL,
+            DEFAULT_MIN_UPDATE_INTERVAL.total_seconds() / 60,
+        )
+
+        result = timedelta(minutes=minutes)
+
+        return result
+
+    @property
+    def max_update_interval(self) -> timedelta:
+        minutes = self._data.get(
+            STORAGE_DATA_MAX_UPDATE_INTERVAL,
+            DEFAULT_MAX_UPDATE_INTERVAL.total_seconds() / 60,
+        )
+
+        result = max(timedelta(minutes=minutes), self.min_update_interval)
+
+        return result
+
     @property
     def config_data(self) -> ConfigData:
         config_data = self._config_data
 
         return config_data
 
+    @property
+    def api_token(self) -> str | None:
+        api_token = self._api_token
+
+        return api_token
+
+    @property
+    def api_token_issued_at(self) -> datetime | None:
+        api_token_issued_at = self._api_token_issued_at
+
+        return api_token_issued_at
+
     async def initialize(self, entry_config: dict):
         try:
             await self._load()
 
             self._config_data.update(entry_config)
 
+            await self._load_api_token()
+
             if self._hass is None:
                 self._translations = {}
 
@@ -195,10 +253,58 @@ class ConfigManager:
         data = self._config_data.to_dict()
 
         for key in self._data:
-            data[key] = self._data[key]
+            if key != STORAGE_DATA_API_TOKEN:
+                data[key] = self._data[key]
 
         return data
 
+    async def _load_api_token(self):
+        self._api_token = None
+        self._api_token_issued_at = None
+
+        token_data = self._data.get(STORAGE_DATA_API_TOKEN)
+
+        if token_data is None:
+            return
+
+        email = token_data.get(STORAGE_DATA_API_TOKEN_EMAIL)
+
+        if email != self._config_data.email:
+            _LOGGER.debug("Stored API token belongs to another user, ignoring it")
+            return
+
+        try:
+            token = await PasswordManager.decrypt_value(
+                self._hass,
+                token_data.get(STORAGE_DATA_API_TOKEN_VALUE),
+                self._entry_id,
+            )
+            issued_at = token_data.get(STORAGE_DATA_API_TOKEN_ISSUED_AT)
+
+            self._api_token = token
+            self._api_token_issued_at = (
+                None if issued_at is None else datetime.fromisoformat(issued_at)
+            )
+
+        except InvalidToken:
+            _LOGGER.debug("Failed to decrypt stored API token, ignoring it")
+
+    async def set_api_token(self, token: str, issued_at: datetime):
+        self._api_token = token
+        self._api_token_issued_at = issued_at
+
+        token_encrypted = await PasswordManager.encrypt_value(
+            self._hass, token, self._entry_id
+        )
+
+        self._data[STORAGE_DATA_API_TOKEN] = {
+            STORAGE_DATA_API_TOKEN_VALUE: token_encrypted,
+            STORAGE_DATA_API_TOKEN_ISSUED_AT: issued_at.isoformat(),
+            STORAGE_DATA_API_TOKEN_EMAIL: self._config_data.email,
+        }
+
+        self._save()
+
     def _get_meter_config(self, meter_id: str, key: str) -> int:
         meter_config = self.meters.get(meter_id, {})
         value = meter_config.get(key, 0)
@@ -227,12 +333,16 @@ class ConfigManager:
 
         return result
 
+    def get_tariff(self, meter_id: str) -> Tariff:
+        result = Tariff.from_config(self.meters.get(meter_id, {}))
+
+        return result
+
     async def _load(self):
         self._data = None
 
         await self._load_config_from_file()
 
-        _LOGGER.info(f"loaded: {self._data}")
         should_save = False
 
         if self._data is None:
@@ -240,7 +350,6 @@ class ConfigManager:
             self._data = {}
 
         default_configuration = self._get_defaults()
-        _LOGGER.debug(f"Default configuration: {default_configuration}")
 
         for key in default_configuration:
             value = default_configuration[key]
@@ -250,9 +359,14 @@ class ConfigManager:
                 should_save = True
                 self._data[key] = value
 
+        for key in [CONF_PASSWORD, CONF_USERNAME]:
+            if key in self._data:
+                should_save = True
+                self._data.pop(key)
+
         if should_save:
             _LOGGER.debug("Updating configuration")
-            await self._save()
+            self._save()
 
     @staticmethod
     def _get_defaults() -> dict:
@@ -264,79 +378,76 @@ class ConfigManager:
         return data
 
     async def _load_config_from_file(self):
-        if self._store is not None:
-            store_data = await self._store.async_load()
-
-            if store_data is not None:
-                self._data = store_data.get(self._entry_id)
+        """Entry data is the shared in-memory copy, not stored in set up mode."""
+        if self._config_store is not None and self._entry_id is not None:
+            store_data = await self._config_store.async_load()
 
-    async def remove(self, entry_id: str):
-        if self._store is None:
-            return
-
-        store_data = await self._store.async_load()
+            self._data = store_data.get(self._entry_id)
 
-        if store_data is not None and entry_id in store_data:
-            data = {key: store_data[key] for key in store_data}
-            data.pop(entry_id)
+            if self._data is None:
+                self._data = {}
 
-            await self._store.async_save(data)
+                store_data[self._entry_id] = self._data
 
-    async def _save(self):
-        if self._store is None:
+    async def remove(self, entry_id: str):
+        if self._config_store is None:
             return
 
-        should_save = False
-        store_data = await self._store.async_load()
+        store_data = await self._config_store.async_load()
 
-        if store_data is None:
-            store_data = {}
+        if entry_id in store_data:
+            store_data.pop(entry_id)
 
-        entry_data = store_data.get(self._entry_id, {})
+            await self._config_store.async_save()
 
-        _LOGGER.debug(
-            f"Storing config data: {json.dumps(self._data)}, "
-            f"Exiting: {json.dumps(entry_data)}"
-        )
-
-        for key in self._data:
-            stored_value = entry_data.get(key)
+    async def flush(self):
+        """Write pending changes, called on unload."""
+        if self._config_store is not None:
+            await self._config_store.async_flush()
 
-            if key in [CONF_PASSWORD, CONF_USERNAME]:
-                entry_data.pop(key)
+    def _save(self):
+        """Schedule a delayed write, changes within the delay are coalesced."""
+        if self._config_store is None or self._entry_id is None:
+            return
 
-                if stored_value is not None:
-                    should_save = True
+        self._config_store.async_delay_save()
 
-            else:
-                current_value = self._data.get(key)
+    async def set_use_unique_device_names(self, value: bool) -> None:
+        self._data[STORAGE_DATA_USE_UNIQUE_DEVICE_NAMES] = value
+        self._revision += 1
 
-                if stored_value != current_value:
-                    should_save = True
+        self._save()
 
-                    entry_data[key] = self._data[key]
+    async def set_request_metrics(self, value: bool) -> None:
+        self._data[STORAGE_DATA_REQUEST_METRICS] = value
 
-        if should_save and self._entry_id is not None:
-            store_data[self._entry_id] = entry_data
+        self._save()
 
-            await self._store.async_save(store_data)
+    async def set_min_update_interval(self, value: float) -> None:
+        self._data[STORAGE_DATA_MIN_UPDATE_INTERVAL] = value
 
-    async def set_use_unique_device_names(self, value: bool) -> None:
-        self._data[STORAGE_DATA_USE_UNIQUE_DEVICE_NAMES] = value
+        self._save()
 
-        await self._save()
+    async def set_max_update_interval(self, value: float) -> None:
+        self._data[STORAGE_DATA_MAX_UPDATE_INTERVAL] = value
 
-        self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
+        self._save()
 
     async def _set_meter_config(self, meter_id: str, key: str, value: float) -> None:
-        if meter_id not in self.meters:
-            self._data[STORAGE_DATA_METERS][meter_id] = copy(DEFAULT_METER_CONFIG)
+        await self.set_meters_config([meter_id], {key: value})
 
-        self._data[STORAGE_DATA_METERS][meter_id][key] = value
+    async def set_meters_config(self, meter_ids: list[str], values: dict) -> None:
+        """Update tariffs of many meters, written once.
 
-        await self._save()
+        Cost data is re-derived by the coordinator, no reprocessing is required.
+        """
+        for meter_id in meter_ids:
+            if meter_id not in self.meters:
+                self._data[STORAGE_DATA_METERS][meter_id] = copy(DEFAULT_METER_CONFIG)
 
-        self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
+            self._data[STORAGE_DATA_METERS][meter_id].update(values)
+
+        self._save()
 
     async def set_low_rate_consumption_threshold(
         self, meter_id: str, value: float
@@ -353,13 +464,3 @@ class ConfigManager:
 
     async def set_sewage_cost(self, meter_id: str, value: float) -> None:
         await self._set_meter_config(meter_id, STORAGE_DATA_METER_SEWAGE_COST, value)
-
-    def set_local_async_dispatcher_send(self, callback):
-        self._local_async_dispatcher_send = callback
-
-    def _async_dispatcher_send(self, signal: str, *args: Any) -> None:
-        if self._hass is None:
-            self._local_async_dispatcher_send(signal, None, *args)
-
-        else:
-            dispatcher_send(self._hass, signal, self._entry_id, *args)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from copy import deepcopy
+import json
+import logging
+
+from homeassistant.config_entries import STORAGE_VERSION
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import Store
+
+from ..common.consts import (
+    CONFIGURATION_FILE,
+    CONFIGURATION_SAVE_DELAY,
+    DATA_CONFIG_STORE,
+    DOMAIN,
+    STORAGE_DATA_KEY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConfigStore:
+    """Configuration file shared by all config entries and the password manager.
+
+    File is loaded once, the in-memory copy is authoritative. Changes are
+    written with a delay, changes within the delay result in a single write.
+    """
+
+    _store: Store
+    _data: dict | None
+    _load_lock: asyncio.Lock
+    _is_pending: bool
+
+    def __init__(self, hass: HomeAssistant):
+        self._store = Store(
+            hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
+        )
+
+        self._data = None
+        self._load_lock = asyncio.Lock()
+        self._is_pending = False
+
+    @staticmethod
+    def get_instance(hass: HomeAssistant) -> ConfigStore:
+        """Domain wide store, created by the first one asking for it."""
+        domain_data = hass.data.setdefault(DOMAIN, {})
+
+        config_store = domain_data.get(DATA_CONFIG_STORE)
+
+        if config_store is None:
+            config_store = ConfigStore(hass)
+
+            domain_data[DATA_CONFIG_STORE] = config_store
+
+        return config_store
+
+    @property
+    def is_pending(self) -> bool:
+        is_pending = self._is_pending
+
+        return is_pending
+
+    async def async_load(self) -> dict:
+        """In-memory data, changes to it are persisted by the next save."""
+        async with self._load_lock:
+            if self._data is None:
+                data = await self._store.async_load()
+
+                self._data = {} if data is None else data
+
+        return self._data
+
+    @callback
+    def async_delay_save(self):
+        self._is_pending = True
+
+        self._store.async_delay_save(self._get_data, CONFIGURATION_SAVE_DELAY)
+
+    async def async_save(self):
+        """Write now, replaces a pending delayed write."""
+        await self._store.async_save(self._get_data())
+
+    async def async_flush(self):
+        if self._is_pending:
+            await self.async_save()
+
+    def _get_data(self) -> dict:
+        """Copy of the data, it is serialized after the event loop moves on."""
+        self._is_pending = False
+
+        data = deepcopy(self._data)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            debug_data = {key: data[key] for key in data if key != STORAGE_DATA_KEY}
+
+            _LOGGER.debug(
+                f"Storing configuration: {json.dumps(debug_data, cls=JSONEncoder)}"
+            )
+
+        return data
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsCacheMissParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """Connection pool usage of a session, collected through aiohttp tracing."""
+
+    _trace_config: TraceConfig
+    _requests: int
+    _failed_requests: int
+    _connections_created: int
+    _connections_reused: int
+    _dns_cache_hits: int
+    _dns_cache_misses: int
+
+    def __init__(self):
+        self._requests = 0
+        self._failed_requests = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+        trace_config = TraceConfig()
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+
+        self._trace_config = trace_config
+
+    @property
+    def trace_config(self) -> TraceConfig:
+        trace_config = self._trace_config
+
+        return trace_config
+
+    @property
+    def connections_created(self) -> int:
+        connections_created = self._connections_created
+
+        return connections_created
+
+    @property
+    def connections_reused(self) -> int:
+        connections_reused = self._connections_reused
+
+        return connections_reused
+
+    async def _on_request_end(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceRequestEndParams,
+    ):
+        self._requests += 1
+
+    async def _on_request_exception(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceRequestExceptionParams,
+    ):
+        self._failed_requests += 1
+
+    async def _on_connection_create_end(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceConnectionCreateEndParams,
+    ):
+        self._connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceConnectionReuseconnParams,
+    ):
+        self._connections_reused += 1
+
+    async def _on_dns_cache_hit(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceDnsCacheHitParams,
+    ):
+        self._dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        self,
+        _session: ClientSession,
+        _context: SimpleNamespace,
+        _params: TraceDnsCacheMissParams,
+    ):
+        self._dns_cache_misses += 1
+
+    def to_dict(self) -> dict:
+        connections = self._connections_created + self._connections_reused
+
+        obj = {
+            "requests": self._requests,
+            "failed_requests": self._failed_requests,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_ratio": (
+                None if connections == 0 else self._connections_reused / connections
+            ),
+            "dns_cache_hits": self._dns_cache_hits,
+            "dns_cache_misses": self._dns_cache_misses,
+        }
+
+        return obj
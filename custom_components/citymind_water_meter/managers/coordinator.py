@@ -1,13 +1,15 @@
-from asyncio import sleep
+from asyncio import Task, sleep
 import calendar
-from datetime import datetime
+from datetime import date, datetime
 import logging
 import sys
+import time
 from typing import Callable
 
 from homeassistant.components.homeassistant import SERVICE_RELOAD_CONFIG_ENTRY
 from homeassistant.const import ATTR_STATE
 from homeassistant.core import Event, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import (
     DeviceInfo,
     async_entries_for_config_entry as devices_by_config_entry,
@@ -29,6 +31,8 @@ from ..common.consts import (
     ACTION_ENTITY_TURN_OFF,
     ACTION_ENTITY_TURN_ON,
     ALERT_MAPPING,
+    API_DATA_SECTION_CONSUMPTION_DAILY,
+    API_DATA_SECTION_LAST_READ,
     ATTR_ACTIONS,
     ATTR_ALERT_TYPE,
     ATTR_IS_ON,
@@ -36,11 +40,12 @@ from ..common.consts import (
     DOMAIN,
     ENTITY_CONFIG_ENTRY_ID,
     HA_NAME,
-    RECONNECT_INTERVAL,
     SIGNAL_ACCOUNT_ADDED,
     SIGNAL_API_STATUS,
-    SIGNAL_DATA_CHANGED,
     SIGNAL_METER_ADDED,
+    SNAPSHOT_DATA_ACCOUNT,
+    SNAPSHOT_DATA_DATE,
+    SNAPSHOT_DATA_METERS,
     UPDATE_DATA_INTERVALS,
     WEEKEND_DAYS,
 )
@@ -49,8 +54,15 @@ from ..common.enums import EntityKeys, EntityType
 from ..data_processors.account_processor import AccountProcessor
 from ..data_processors.meter_processor import MeterProcessor
 from ..models.account_data import AccountData
+from ..models.coordinator_data import CoordinatorData
+from ..models.meter_costs import MeterCosts
+from .client_hub import ClientHub
 from .config_manager import ConfigManager
+from .poll_scheduler import PollScheduler
 from .rest_api import RestAPI
+from .snapshot_manager import SnapshotManager
+from .statistics_backfill import StatisticsBackfill
+from .tariff_engine import TariffEngine
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,7 +84,11 @@ class Coordinator(DataUpdateCoordinator):
     )
     _system_status_details: dict | None
 
+    _costs: dict[str, MeterCosts]
+
     _last_update: float
+    _catch_up_task: Task | None
+    _ingested_date: date | None
 
     def __init__(self, hass, config_manager: ConfigManager):
         """Initialize my coordinator."""
@@ -90,15 +106,35 @@ class Coordinator(DataUpdateCoordinator):
         analytic_periods = config_manager.analytic_periods
         entry_id = config_manager.entry_id
 
-        self._api = RestAPI(self.hass, config_data, analytic_periods, entry_id)
+        self._client_hub = ClientHub.get_instance(hass)
+
+        self._api = RestAPI(
+            self.hass,
+            config_data,
+            analytic_periods,
+            entry_id,
+            client_hub=self._client_hub,
+        )
+        self._api.restore_token(
+            config_manager.api_token, config_manager.api_token_issued_at
+        )
+        self._api.set_token_changed_callback(config_manager.set_api_token)
+        self._api.request_metrics.set_enabled(config_manager.request_metrics)
 
         self._config_manager = config_manager
+        self._snapshot_manager = SnapshotManager(hass, entry_id)
+        self._statistics_backfill = StatisticsBackfill(hass, self._api, entry_id)
+        self._poll_scheduler = PollScheduler()
 
         self._data_mapping = None
+        self._costs = {}
 
         self._last_update = 0
         self._is_weekend = False
 
+        self._catch_up_task = None
+        self._ingested_date = None
+
         self._can_load_components: bool = False
 
         self._account_processor = AccountProcessor(config_manager)
@@ -133,6 +169,12 @@ class Coordinator(DataUpdateCoordinator):
 
         return config_manager
 
+    @property
+    def statistics_backfill(self) -> StatisticsBackfill:
+        statistics_backfill = self._statistics_backfill
+
+        return statistics_backfill
+
     @property
     def current_update_interval(self):
         current_update_interval = UPDATE_DATA_INTERVALS[self._is_weekend]
@@ -145,15 +187,20 @@ class Coordinator(DataUpdateCoordinator):
     async def initialize(self):
         self._build_data_mapping()
 
+        is_restored = await self._restore_snapshot()
+
         entry = self.config_manager.entry
         await self.hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
         _LOGGER.info(f"Start loading {DOMAIN} integration, Entry ID: {entry.entry_id}")
 
-        await self.async_request_refresh()
+        if is_restored:
+            self._discover_devices()
 
         await self._api.initialize()
 
+        await self.async_request_refresh()
+
     def _load_signal_handlers(self):
         loop = self.hass.loop
 
@@ -161,13 +208,8 @@ class Coordinator(DataUpdateCoordinator):
         def on_api_status_changed(entry_id: str, status: ConnectivityStatus):
             loop.create_task(self._on_api_status_changed(entry_id, status)).__await__()
 
-        @callback
-        def on_data_changed(entry_id: str):
-            loop.create_task(self._on_data_changed(entry_id)).__await__()
-
         signal_handlers = {
             SIGNAL_API_STATUS: on_api_status_changed,
-            SIGNAL_DATA_CHANGED: on_data_changed,
         }
 
         _LOGGER.debug(f"Registering signals for {signal_handlers.keys()}")
@@ -186,6 +228,14 @@ class Coordinator(DataUpdateCoordinator):
             "config": config_data,
             "data": {
                 "api": self._api.data,
+                "cache": self._api.response_cache.to_dict(),
+                "retry_policy": self._api.retry_policy.to_dict(),
+                "client_hub": self._client_hub.to_dict(),
+                "request_metrics": self._api.request_metrics.to_dict(),
+                "scheduler": self._poll_scheduler.to_dict(),
+                "backfill": self._statistics_backfill.checkpoints,
+                "ingested_date": self._ingested_date,
+                "update_interval": self.update_interval,
             },
             "processors": {
                 EntityType.ACCOUNT: self._account_processor.get().to_dict(),
@@ -199,16 +249,22 @@ class Coordinator(DataUpdateCoordinator):
         if entry_id != self._config_manager.entry_id:
             return
 
-        if status == ConnectivityStatus.Connected:
-            self.config_manager.analytic_periods.update()
+        if status in [ConnectivityStatus.Failed]:
+            retry_policy = self._api.retry_policy
+            delay = retry_policy.get_delay()
 
-            await self._api.update()
+            _LOGGER.debug(f"Reconnecting in {delay}, Circuit: {retry_policy.state}")
+
+            # Publish circuit state, it changes outside of refresh cycles
+            self.async_update_listeners()
 
-        elif status in [ConnectivityStatus.Failed]:
-            await sleep(RECONNECT_INTERVAL.total_seconds())
+            await sleep(delay.total_seconds())
 
             await self._api.initialize()
 
+            if self._api.status == ConnectivityStatus.Connected:
+                await self.async_request_refresh()
+
     def _on_account_discovered(self) -> None:
         key = EntityType.ACCOUNT
 
@@ -236,50 +292,217 @@ class Coordinator(DataUpdateCoordinator):
                 meter_id,
             )
 
-    async def _on_data_changed(self, entry_id: str):
-        if entry_id != self._config_manager.entry_id:
+    def _process_data(self) -> CoordinatorData:
+        api_data = self._api.data
+        revisions = self._api.revisions
+        changed_items = set()
+
+        for processor_type in self._processors:
+            processor = self._processors[processor_type]
+            processor.update(api_data, revisions)
+
+            for item_id in processor.changed_items:
+                changed_items.add((processor_type, item_id))
+
+        self._discover_devices()
+
+        if changed_items:
+            self._snapshot_manager.save(self._get_snapshot_data)
+
+        meters = {
+            meter_id: self._meter_processor.get_data(meter_id)
+            for meter_id in self._meter_processor.get_meters()
+        }
+
+        changed_meter_ids = [
+            item_id
+            for entity_type, item_id in changed_items
+            if entity_type == EntityType.METER
+        ]
+
+        if changed_meter_ids:
+            self._update_costs(changed_meter_ids)
+
+        data = CoordinatorData(
+            self._account_processor.get(), meters, changed_items, self._costs
+        )
+
+        return data
+
+    def _update_costs(self, meter_ids: list[str] | None = None):
+        """Calculate costs of meters (all by default) in a single batch.
+
+        Costs of other meters are kept, calculated once per change of the meter.
+        """
+        available_meter_ids = self._meter_processor.get_meters()
+
+        if meter_ids is None:
+            meter_ids = available_meter_ids
+
+        consumption = {
+            meter_id: self._meter_processor.get_data(meter_id).monthly_consumption
+            for meter_id in meter_ids
+        }
+        tariffs = {
+            meter_id: self._config_manager.get_tariff(meter_id)
+            for meter_id in meter_ids
+        }
+
+        costs = {
+            meter_id: self._costs[meter_id]
+            for meter_id in available_meter_ids
+            if meter_id in self._costs
+        }
+
+        costs.update(TariffEngine.calculate(consumption, tariffs))
+
+        self._costs = costs
+
+    def is_changed(self, entity_type: EntityType, item_id: str | None = None) -> bool:
+        """Whether item changed by the last refresh."""
+        is_changed = self.data is not None and self.data.is_changed(
+            entity_type, item_id
+        )
+
+        return is_changed
+
+    def _discover_devices(self):
+        account = self._account_processor.get()
+
+        if account is None:
             return
 
-        api_connected = self._api.status == ConnectivityStatus.Connected
+        account_device = self._account_processor.get_device_info()
+        account_identifiers = account_device.get("identifiers")
+        # Extract the device identifier from the identifiers set
+        account_device_id = (
+            list(account_identifiers)[0][1] if account_identifiers else None
+        )
 
-        if api_connected:
-            self._account_processor.update(self._api.data)
+        self._meter_processor.set_account_device_id(account_device_id)
 
-            account = self._account_processor.get()
-            account_device = self._account_processor.get_device_info()
-            account_identifiers = account_device.get("identifiers")
-            # Extract the device identifier from the identifiers set
-            account_device_id = (
-                list(account_identifiers)[0][1] if account_identifiers else None
-            )
+        self._on_account_discovered()
+
+        meters = self._meter_processor.get_meters()
+
+        for meter_id in meters:
+            self._on_meter_discovered(meter_id)
+
+    async def _restore_snapshot(self) -> bool:
+        is_restored = False
+
+        snapshot = await self._snapshot_manager.load()
+        today_iso = self.config_manager.analytic_periods.today_iso
+
+        if snapshot is None:
+            _LOGGER.debug("No snapshot available")
+
+        elif snapshot.get(SNAPSHOT_DATA_DATE) != today_iso:
+            _LOGGER.debug("Snapshot is outdated, waiting for live data")
+
+        else:
+            account_data = snapshot.get(SNAPSHOT_DATA_ACCOUNT)
+            meters_data = snapshot.get(SNAPSHOT_DATA_METERS, [])
+
+            if account_data is not None:
+                self._account_processor.restore(account_data)
+                self._meter_processor.restore(meters_data)
+                self._update_costs()
+
+                is_restored = True
+
+                _LOGGER.info(
+                    f"Restored snapshot of account and {len(meters_data)} meters"
+                )
+
+        return is_restored
+
+    def _get_snapshot_data(self) -> dict:
+        account = self._account_processor.get()
+
+        data = {
+            SNAPSHOT_DATA_DATE: self.config_manager.analytic_periods.today_iso,
+            SNAPSHOT_DATA_ACCOUNT: None if account is None else account.to_dict(),
+            SNAPSHOT_DATA_METERS: self._meter_processor.get_all(),
+        }
+
+        return data
+
+    def _publish_account_config(self):
+        """Update account entities after a configuration change, without fetching."""
+        if self.data is None:
+            return
+
+        changed_items = {(EntityType.ACCOUNT, None)}
+
+        self.data = CoordinatorData(
+            self.data.account, self.data.meters, changed_items, self._costs
+        )
+
+        self.async_update_listeners()
+
+    async def backfill_statistics(
+        self, start_date: date, meter_ids: list[str] | None = None
+    ) -> dict:
+        """Import consumption history since start date as long-term statistics."""
+        if meter_ids is None:
+            meter_ids = self._meter_processor.get_meters()
+
+        result = await self._statistics_backfill.run(meter_ids, start_date)
+
+        return result
+
+    async def set_tariffs(
+        self, tariffs: dict[str, float], meter_ids: list[str] | None = None
+    ) -> dict:
+        """Apply tariffs to meters (all by default), without fetching data."""
+        available_meter_ids = self._meter_processor.get_meters()
+
+        if meter_ids is None:
+            meter_ids = available_meter_ids
+
+        unknown_meter_ids = [
+            meter_id for meter_id in meter_ids if meter_id not in available_meter_ids
+        ]
+
+        if unknown_meter_ids:
+            raise HomeAssistantError(f"Unknown meters: {', '.join(unknown_meter_ids)}")
+
+        _LOGGER.debug(f"Set tariffs, Meters: {meter_ids}, Tariffs: {tariffs}")
+
+        await self._config_manager.set_meters_config(meter_ids, tariffs)
+
+        self._publish_meter_config(meter_ids)
+
+        result = {"meters": meter_ids, "tariffs": tariffs}
 
-            self._on_account_discovered()
+        return result
 
-            meter_processors: list[MeterProcessor] = [
-                self._processors[processor_type]
-                for processor_type in self._processors
-                if processor_type == EntityType.METER
-            ]
+    def _publish_meter_config(self, meter_ids: list[str]):
+        """Re-derive data of meters from processed data and update their entities."""
+        self._meter_processor.reload_meter_config(meter_ids)
+        self._update_costs(meter_ids)
 
-            for meter_processor in meter_processors:
-                meter_processor.set_account_device_id(account_device_id)
-                meter_processor.update(self._api.data)
+        if self.data is None:
+            return
 
-            if account is None:
-                return
+        changed_items = {(EntityType.METER, meter_id) for meter_id in meter_ids}
 
-            meters = self._meter_processor.get_meters()
+        self.data = CoordinatorData(
+            self.data.account, self.data.meters, changed_items, self._costs
+        )
 
-            for meter_id in meters:
-                self._on_meter_discovered(meter_id)
+        self.async_update_listeners()
 
-    async def _async_update_data(self):
+    async def _async_update_data(self) -> CoordinatorData:
         """
-        Fetch parameters from API endpoint.
+        Fetch parameters from API endpoint, process and publish them.
 
-        This is the place to pre-process the parameters to lookup tables
-        so entities can quickly look up their parameters.
+        Processors run once per fetch, listeners are called by the coordinator
+        after the returned data is set.
         """
+        started_at = time.perf_counter()
+
         try:
             _LOGGER.debug("Updating data")
 
@@ -289,11 +512,77 @@ class Coordinator(DataUpdateCoordinator):
 
             self._validate_weekday()
 
-            return {}
-
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
 
+        if self._api.status != ConnectivityStatus.Connected:
+            raise UpdateFailed(f"API is not connected, Status: {self._api.status}")
+
+        data = self._process_data()
+
+        self._update_poll_schedule()
+        self._schedule_catch_up()
+
+        if self._api.request_metrics.is_enabled:
+            self._api.request_metrics.record_refresh(time.perf_counter() - started_at)
+
+        return data
+
+    def _schedule_catch_up(self):
+        """Import days missed while offline into statistics, in the background."""
+        yesterday = self.config_manager.analytic_periods.yesterday.date()
+
+        is_running = self._catch_up_task is not None and not self._catch_up_task.done()
+
+        if is_running or self._ingested_date == yesterday:
+            return
+
+        self._catch_up_task = self.config_manager.entry.async_create_background_task(
+            self.hass, self._catch_up(yesterday), f"{DOMAIN} statistics catch up"
+        )
+
+    async def _catch_up(self, end_date: date):
+        try:
+            meter_ids = self._meter_processor.get_meters()
+            daily_data = self._api.data.get(API_DATA_SECTION_CONSUMPTION_DAILY)
+
+            result = await self._statistics_backfill.catch_up(
+                meter_ids, end_date, daily_data
+            )
+
+            if result["completed"]:
+                self._ingested_date = end_date
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to catch up statistics, Error: {ex}, Line: {line_number}"
+            )
+
+    def _update_poll_schedule(self):
+        now = datetime.now()
+        revision = self._api.revisions.get((API_DATA_SECTION_LAST_READ, None))
+
+        self._poll_scheduler.update(revision, now)
+
+        update_interval = self._poll_scheduler.get_interval(
+            now,
+            self._config_manager.min_update_interval,
+            self._config_manager.max_update_interval,
+            self.current_update_interval,
+        )
+
+        update_interval = self._client_hub.stagger(
+            self._config_manager.entry_id, update_interval, now
+        )
+
+        if update_interval != self.update_interval:
+            _LOGGER.debug(f"Next update in {update_interval}")
+
+            self.update_interval = update_interval
+
     def _build_data_mapping(self):
         _LOGGER.debug("Building data mappers")
 
@@ -311,6 +600,7 @@ class Coordinator(DataUpdateCoordinator):
             EntityKeys.HIGH_RATE_TOTAL_COST: self._get_high_rate_total_cost_data,
             EntityKeys.SEWAGE_COST: self._get_sewage_cost_data,
             EntityKeys.SEWAGE_TOTAL_COST: self._get_sewage_total_cost_data,
+            EntityKeys.TOTAL_COST: self._get_total_cost_data,
             EntityKeys.LOW_RATE_CONSUMPTION_THRESHOLD: self._get_low_rate_consumption_threshold_data,
             EntityKeys.ALERTS: self._get_alerts_data,
             EntityKeys.ALERT_EXCEEDED_THRESHOLD_SMS: self._get_alert_setting_data,
@@ -320,6 +610,13 @@ class Coordinator(DataUpdateCoordinator):
             EntityKeys.ALERT_LEAK_WHILE_AWAY_SMS: self._get_alert_setting_data,
             EntityKeys.ALERT_LEAK_WHILE_AWAY_EMAIL: self._get_alert_setting_data,
             EntityKeys.USE_UNIQUE_DEVICE_NAMES: self._get_use_unique_device_names_data,
+            EntityKeys.MIN_UPDATE_INTERVAL: self._get_min_update_interval_data,
+            EntityKeys.MAX_UPDATE_INTERVAL: self._get_max_update_interval_data,
+            EntityKeys.API_CIRCUIT_STATE: self._get_api_circuit_state_data,
+            EntityKeys.REQUEST_METRICS: self._get_request_metrics_data,
+            EntityKeys.LAST_REFRESH_DURATION: self._get_last_refresh_duration_data,
+            EntityKeys.P95_REQUEST_LATENCY: self._get_p95_request_latency_data,
+            EntityKeys.REQUEST_ERRORS: self._get_request_errors_data,
         }
 
         self._data_mapping = data_mapping
@@ -452,18 +749,18 @@ class Coordinator(DataUpdateCoordinator):
     def _get_high_rate_consumption_data(
         self, _entity_description, meter_id: str
     ) -> dict | None:
-        data = self._meter_processor.get_data(meter_id)
+        costs = self._get_meter_costs(meter_id)
 
-        result = {ATTR_STATE: data.high_rate_monthly_consumption}
+        result = {ATTR_STATE: costs.high_rate_consumption}
 
         return result
 
     def _get_low_rate_consumption_data(
         self, _entity_description, meter_id: str
     ) -> dict | None:
-        data = self._meter_processor.get_data(meter_id)
+        costs = self._get_meter_costs(meter_id)
 
-        result = {ATTR_STATE: data.low_rate_monthly_consumption}
+        result = {ATTR_STATE: costs.low_rate_consumption}
 
         return result
 
@@ -484,9 +781,9 @@ class Coordinator(DataUpdateCoordinator):
     def _get_low_rate_total_cost_data(
         self, _entity_description, meter_id: str
     ) -> dict | None:
-        data = self._meter_processor.get_data(meter_id)
+        costs = self._get_meter_costs(meter_id)
 
-        result = {ATTR_STATE: data.low_rate_cost * data.low_rate_monthly_consumption}
+        result = {ATTR_STATE: costs.low_rate_cost}
 
         return result
 
@@ -507,9 +804,9 @@ class Coordinator(DataUpdateCoordinator):
     def _get_high_rate_total_cost_data(
         self, _entity_description, meter_id: str
     ) -> dict | None:
-        data = self._meter_processor.get_data(meter_id)
+        costs = self._get_meter_costs(meter_id)
 
-        result = {ATTR_STATE: data.high_rate_cost * data.high_rate_monthly_consumption}
+        result = {ATTR_STATE: costs.high_rate_cost}
 
         return result
 
@@ -528,12 +825,28 @@ class Coordinator(DataUpdateCoordinator):
     def _get_sewage_total_cost_data(
         self, _entity_description, meter_id: str
     ) -> dict | None:
-        data = self._meter_processor.get_data(meter_id)
+        costs = self._get_meter_costs(meter_id)
 
-        result = {ATTR_STATE: data.sewage_cost * data.monthly_consumption}
+        result = {ATTR_STATE: costs.sewage_cost}
 
         return result
 
+    def _get_total_cost_data(self, _entity_description, meter_id: str) -> dict | None:
+        costs = self._get_meter_costs(meter_id)
+
+        result = {ATTR_STATE: costs.total_cost}
+
+        return result
+
+    def _get_meter_costs(self, meter_id: str) -> MeterCosts:
+        """Costs calculated by the last update, empty until calculated."""
+        costs = self._costs.get(meter_id)
+
+        if costs is None:
+            costs = MeterCosts(meter_id)
+
+        return costs
+
     def _get_low_rate_consumption_threshold_data(
         self, _entity_description, meter_id: str
     ) -> dict | None:
@@ -568,6 +881,63 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    def _get_min_update_interval_data(self, _entity_description) -> dict | None:
+        update_interval = self._config_manager.min_update_interval
+
+        result = {
+            ATTR_STATE: update_interval.total_seconds() / 60,
+            ATTR_ACTIONS: {
+                ACTION_ENTITY_SET_NATIVE_VALUE: self._set_min_update_interval,
+            },
+        }
+
+        return result
+
+    def _get_max_update_interval_data(self, _entity_description) -> dict | None:
+        update_interval = self._config_manager.max_update_interval
+
+        result = {
+            ATTR_STATE: update_interval.total_seconds() / 60,
+            ATTR_ACTIONS: {
+                ACTION_ENTITY_SET_NATIVE_VALUE: self._set_max_update_interval,
+            },
+        }
+
+        return result
+
+    def _get_api_circuit_state_data(self, _entity_description) -> dict | None:
+        result = {ATTR_STATE: self._api.retry_policy.state}
+
+        return result
+
+    def _get_request_metrics_data(self, _entity_description) -> dict | None:
+        is_on = self._config_manager.request_metrics
+
+        result = {
+            ATTR_IS_ON: is_on,
+            ATTR_ACTIONS: {
+                ACTION_ENTITY_TURN_ON: self._set_request_metrics_enabled,
+                ACTION_ENTITY_TURN_OFF: self._set_request_metrics_disabled,
+            },
+        }
+
+        return result
+
+    def _get_last_refresh_duration_data(self, _entity_description) -> dict | None:
+        result = {ATTR_STATE: self._api.request_metrics.last_refresh_duration}
+
+        return result
+
+    def _get_p95_request_latency_data(self, _entity_description) -> dict | None:
+        result = {ATTR_STATE: self._api.request_metrics.p95_latency}
+
+        return result
+
+    def _get_request_errors_data(self, _entity_description) -> dict | None:
+        result = {ATTR_STATE: self._api.request_metrics.errors}
+
+        return result
+
     def _get_alert_setting_data(self, entity_description) -> dict | None:
         account = self._account_processor.get()
         is_on = account.alert_settings.get(entity_description.key, False)
@@ -594,7 +964,7 @@ class Coordinator(DataUpdateCoordinator):
         )
         await self._config_manager.set_low_rate_consumption_threshold(meter_id, value)
 
-        await self.async_request_refresh()
+        self._publish_meter_config([meter_id])
 
     async def _set_low_rate_cost(
         self, _entity_description, meter_id: str, value: float
@@ -602,7 +972,7 @@ class Coordinator(DataUpdateCoordinator):
         _LOGGER.debug(f"Set low rate cost, Meter: {meter_id}, Value: {value}")
         await self._config_manager.set_low_rate_cost(meter_id, value)
 
-        await self.async_request_refresh()
+        self._publish_meter_config([meter_id])
 
     async def _set_high_rate_cost(
         self, _entity_description, meter_id: str, value: float
@@ -610,13 +980,27 @@ class Coordinator(DataUpdateCoordinator):
         _LOGGER.debug(f"Set high rate cost, Meter: {meter_id}, Value: {value}")
         await self._config_manager.set_high_rate_cost(meter_id, value)
 
-        await self.async_request_refresh()
+        self._publish_meter_config([meter_id])
 
     async def _set_sewage_cost(self, _entity_description, meter_id: str, value: float):
         _LOGGER.debug(f"Set sewage cost, Meter: {meter_id}, Value: {value}")
         await self._config_manager.set_sewage_cost(meter_id, value)
 
-        await self.async_request_refresh()
+        self._publish_meter_config([meter_id])
+
+    async def _set_min_update_interval(self, _entity_description, value: float):
+        _LOGGER.debug(f"Set minimum update interval, Value: {value}")
+        await self._config_manager.set_min_update_interval(value)
+
+        self._update_poll_schedule()
+        self._publish_account_config()
+
+    async def _set_max_update_interval(self, _entity_description, value: float):
+        _LOGGER.debug(f"Set maximum update interval, Value: {value}")
+        await self._config_manager.set_max_update_interval(value)
+
+        self._update_poll_schedule()
+        self._publish_account_config()
 
     async def _set_use_unique_device_names_enabled(self, _entity_description):
         await self._set_use_unique_device_names_state(True)
@@ -631,6 +1015,21 @@ class Coordinator(DataUpdateCoordinator):
 
         await self._remove_and_refresh()
 
+    async def _set_request_metrics_enabled(self, _entity_description):
+        await self._set_request_metrics_state(True)
+
+    async def _set_request_metrics_disabled(self, _entity_description):
+        await self._set_request_metrics_state(False)
+
+    async def _set_request_metrics_state(self, enabled: bool):
+        _LOGGER.debug(f"Set request metrics state, Value: {enabled}")
+
+        await self._config_manager.set_request_metrics(enabled)
+
+        self._api.request_metrics.set_enabled(enabled)
+
+        self._publish_account_config()
+
     async def _set_alert_setting_enabled(self, entity_description):
         await self._set_alert_setting_state(entity_description, True)
 
@@ -666,8 +1065,6 @@ class Coordinator(DataUpdateCoordinator):
         if was_changed:
             self._is_weekend = is_weekend
 
-            self.update_interval = self.current_update_interval
-
     async def _remove_and_refresh(self):
         entity_registry = async_get_entity_registry(self.hass)
         device_registry = async_get_device_registry(self.hass)
@@ -70,6 +70,7 @@ class IntegrationFlowManager:
                 api = RestAPI(self._hass, config_data)
 
                 await api.validate()
+                await api.terminate()
 
                 if api.status == ConnectivityStatus.Connected:
                     _LOGGER.debug("User inputs are valid")
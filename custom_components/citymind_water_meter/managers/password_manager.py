@@ -1,61 +1,97 @@
+from __future__ import annotations
+
+import asyncio
 import logging
 import sys
 
 from cryptography.fernet import Fernet, InvalidToken
 
-from homeassistant.config_entries import STORAGE_VERSION
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.storage import Store
 
-from ..common.consts import CONFIGURATION_FILE, INVALID_TOKEN_SECTION, STORAGE_DATA_KEY
+from ..common.consts import (
+    DATA_PASSWORD_MANAGER,
+    DOMAIN,
+    INVALID_TOKEN_SECTION,
+    STORAGE_DATA_KEY,
+)
+from .config_store import ConfigStore
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class PasswordManager:
+    """Encryption key of the domain, loaded once and shared by all entries.
+
+    Key is written only when created or migrated from an entry configuration.
+    """
+
     _encryption_key: str | None
     _crypto: Fernet | None
-    _entry_id: str
+    _config_store: ConfigStore | None
+    _load_lock: asyncio.Lock
 
-    def __init__(self, hass: HomeAssistant | None, entry_id: str = ""):
+    def __init__(self, hass: HomeAssistant | None):
         self._hass = hass
-        self._entry_id = entry_id
 
         self._encryption_key = None
         self._crypto = None
+        self._load_lock = asyncio.Lock()
+
+        self._config_store = None if hass is None else ConfigStore.get_instance(hass)
 
+    @staticmethod
+    def get_instance(hass: HomeAssistant | None) -> PasswordManager:
+        """Domain wide instance, without Home Assistant a new one (not stored)."""
         if hass is None:
-            self._store = None
+            return PasswordManager(hass)
+
+        domain_data = hass.data.setdefault(DOMAIN, {})
+
+        password_manager = domain_data.get(DATA_PASSWORD_MANAGER)
+
+        if password_manager is None:
+            password_manager = PasswordManager(hass)
 
-        else:
-            self._store = Store(
-                hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
-            )
+            domain_data[DATA_PASSWORD_MANAGER] = password_manager
 
-    async def initialize(self):
-        try:
-            await self._load_encryption_key()
+        return password_manager
 
-        except InvalidToken:
-            _LOGGER.error(
-                f"Invalid encryption key, Please follow instructions in {INVALID_TOKEN_SECTION}"
-            )
+    async def initialize(self, entry_id: str = ""):
+        """Load the key once, entry ID is used to migrate a key of the entry."""
+        async with self._load_lock:
+            if self._crypto is not None:
+                return
 
-        except Exception as ex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
+            try:
+                await self._load_encryption_key(entry_id)
 
-            _LOGGER.error(
-                f"Failed to initialize configuration manager, Error: {ex}, Line: {line_number}"
-            )
+            except InvalidToken:
+                _LOGGER.error(
+                    f"Invalid encryption key, Please follow instructions in {INVALID_TOKEN_SECTION}"
+                )
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(
+                    f"Failed to initialize configuration manager, Error: {ex}, Line: {line_number}"
+                )
 
     @staticmethod
-    async def decrypt(hass: HomeAssistant, data: dict, entry_id: str = "") -> None:
-        instance = PasswordManager(hass, entry_id)
+    async def _get_initialized_instance(
+        hass: HomeAssistant | None, entry_id: str
+    ) -> PasswordManager:
+        instance = PasswordManager.get_instance(hass)
+
+        await instance.initialize(entry_id)
 
-        await instance.initialize()
+        return instance
+
+    @staticmethod
+    async def decrypt(hass: HomeAssistant, data: dict, entry_id: str = "") -> None:
+        instance = await PasswordManager._get_initialized_instance(hass, entry_id)
 
         password = data.get(CONF_PASSWORD)
         password_decrypted = instance._decrypt(password)
@@ -63,9 +99,7 @@ class PasswordManager:
 
     @staticmethod
     async def encrypt(hass: HomeAssistant, data: dict, entry_id: str = "") -> None:
-        instance = PasswordManager(hass, entry_id)
-
-        await instance.initialize()
+        instance = await PasswordManager._get_initialized_instance(hass, entry_id)
 
         if CONF_PASSWORD in data:
             password = data.get(CONF_PASSWORD)
@@ -73,48 +107,63 @@ class PasswordManager:
 
             data[CONF_PASSWORD] = password_encrypted
 
-    async def _load_encryption_key(self):
+    @staticmethod
+    async def encrypt_value(
+        hass: HomeAssistant, value: str | None, entry_id: str = ""
+    ) -> str | None:
+        instance = await PasswordManager._get_initialized_instance(hass, entry_id)
+
+        value_encrypted = instance._encrypt(value)
+
+        return value_encrypted
+
+    @staticmethod
+    async def decrypt_value(
+        hass: HomeAssistant, value: str | None, entry_id: str = ""
+    ) -> str | None:
+        instance = await PasswordManager._get_initialized_instance(hass, entry_id)
+
+        value_decrypted = instance._decrypt(value)
+
+        return value_decrypted
+
+    async def _load_encryption_key(self, entry_id: str):
         store_data = None
+        should_save = False
 
-        if self._store is not None:
-            store_data = await self._store.async_load()
+        if self._config_store is not None:
+            store_data = await self._config_store.async_load()
 
         if store_data is not None:
             if STORAGE_DATA_KEY in store_data:
                 self._encryption_key = store_data.get(STORAGE_DATA_KEY)
 
             else:
-                for store_data_key in store_data:
-                    if store_data_key == self._entry_id:
-                        entry_configuration = store_data[store_data_key]
+                entry_configuration = store_data.get(entry_id)
 
-                        if STORAGE_DATA_KEY in entry_configuration:
-                            self._encryption_key = entry_configuration.get(
-                                STORAGE_DATA_KEY
-                            )
+                if entry_configuration and STORAGE_DATA_KEY in entry_configuration:
+                    self._encryption_key = entry_configuration.pop(STORAGE_DATA_KEY)
 
-                            entry_configuration.pop(STORAGE_DATA_KEY)
+                    should_save = True
 
         if self._encryption_key is None:
             self._encryption_key = Fernet.generate_key().decode("utf-8")
 
-        await self._save()
+            should_save = True
 
-        self._crypto = Fernet(self._encryption_key.encode())
+        if should_save:
+            await self._save(store_data)
 
-    async def _save(self):
-        if self._store is None:
-            return
-
-        store_data = await self._store.async_load()
+        self._crypto = Fernet(self._encryption_key.encode())
 
+    async def _save(self, store_data: dict | None):
+        """Key is written right away, losing it makes stored secrets unreadable."""
         if store_data is None:
-            store_data = {}
+            return
 
-        if store_data.get(STORAGE_DATA_KEY) != self._encryption_key:
-            store_data[STORAGE_DATA_KEY] = self._encryption_key
+        store_data[STORAGE_DATA_KEY] = self._encryption_key
 
-            await self._store.async_save(store_data)
+        await self._config_store.async_save()
 
     def _encrypt(self, data: str) -> str:
         if data is not None:
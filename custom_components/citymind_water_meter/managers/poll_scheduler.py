@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+import logging
+import statistics
+
+from ..common.consts import LAST_READ_CADENCE_SAMPLES, LAST_READ_CADENCE_WINDOW_RATIO
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """Learns the cadence of last read changes to pick the next poll interval.
+
+    Polls at the floor interval around the expected next read, sleeps until
+    that window otherwise and backs off while a read is overdue.
+    """
+
+    _revision: int | None
+    _last_change: datetime | None
+    _samples: deque[float]
+
+    def __init__(self, max_samples: int = LAST_READ_CADENCE_SAMPLES):
+        self._revision = None
+        self._last_change = None
+        self._samples = deque(maxlen=max_samples)
+
+    @property
+    def cadence(self) -> timedelta | None:
+        """Median time between last read changes, None until learned."""
+        if not self._samples:
+            return None
+
+        cadence = timedelta(seconds=statistics.median(self._samples))
+
+        return cadence
+
+    @property
+    def expected_read(self) -> datetime | None:
+        cadence = self.cadence
+
+        if cadence is None or self._last_change is None:
+            return None
+
+        expected_read = self._last_change + cadence
+
+        return expected_read
+
+    def update(self, revision: int | None, now: datetime):
+        """Record last read revision observed at a poll."""
+        if revision is None or revision == self._revision:
+            return
+
+        is_first_revision = self._revision is None
+        self._revision = revision
+
+        # First observation after start is not a change time, only anchor later ones
+        if is_first_revision:
+            return
+
+        if self._last_change is not None:
+            sample = (now - self._last_change).total_seconds()
+
+            self._samples.append(sample)
+
+            _LOGGER.debug(f"Last read changed after {sample:.0f}s")
+
+        self._last_change = now
+
+    def get_interval(
+        self,
+        now: datetime,
+        floor: timedelta,
+        ceiling: timedelta,
+        default: timedelta,
+    ) -> timedelta:
+        expected_read = self.expected_read
+
+        if expected_read is None:
+            interval = default
+
+        else:
+            window = max(floor, self.cadence * LAST_READ_CADENCE_WINDOW_RATIO)
+            window_start = expected_read - window
+
+            if now < window_start:
+                interval = window_start - now
+
+            elif now <= expected_read + window:
+                interval = floor
+
+            else:
+                interval = (now - expected_read) / 2
+
+        interval = min(max(interval, floor), ceiling)
+
+        return interval
+
+    def to_dict(self) -> dict:
+        cadence = self.cadence
+
+        obj = {
+            "cadence": None if cadence is None else cadence.total_seconds(),
+            "samples": list(self._samples),
+            "last_change": self._last_change,
+            "expected_read": self.expected_read,
+        }
+
+        return obj
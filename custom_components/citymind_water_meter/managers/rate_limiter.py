@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import heapq
+import itertools
+import logging
+import time
+
+from ..common.consts import API_RATE_BURST, API_RATE_LIMIT
+from ..common.enums import RequestPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket limiting the request rate against the portal API.
+
+    Requests take a token, tokens refill at the configured rate up to the
+    burst size. Waiting requests are served by priority (user writes before
+    login before polling), then in arrival order.
+    """
+
+    _rate: float
+    _burst: int
+    _time: Callable[[], float]
+    _tokens: float
+    _updated_at: float
+    _waiters: list[tuple[int, int, asyncio.Future]]
+    _sequence: itertools.count
+    _timer: asyncio.TimerHandle | None
+    _wait_stats: dict[RequestPriority, dict[str, float]]
+
+    def __init__(
+        self,
+        rate: float = API_RATE_LIMIT,
+        burst: int = API_RATE_BURST,
+        time_func: Callable[[], float] = time.monotonic,
+    ):
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._time = time_func
+        self._tokens = float(self._burst)
+        self._updated_at = time_func()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._timer = None
+        self._wait_stats = {
+            priority: {"requests": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for priority in RequestPriority
+        }
+
+    @property
+    def queue_length(self) -> int:
+        queue_length = len([item for item in self._waiters if not item[2].done()])
+
+        return queue_length
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.POLLING):
+        """Wait for a token, returns immediately if available and nobody waits."""
+        started_at = self._time()
+        wait = 0
+
+        self._refill()
+
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+
+        else:
+            future = asyncio.get_running_loop().create_future()
+
+            heapq.heappush(
+                self._waiters, (priority.value, next(self._sequence), future)
+            )
+
+            self._dispatch()
+
+            # Cancelled waiter stays queued as done future, skipped by dispatch
+            await future
+
+            wait = self._time() - started_at
+
+        self._record_wait(priority, wait)
+
+    def _refill(self):
+        now = self._time()
+
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    def _dispatch(self):
+        """Hand tokens to waiters by priority, schedule next run for the rest."""
+        self._refill()
+
+        while self._waiters and self._tokens >= 1:
+            _priority, _sequence, future = heapq.heappop(self._waiters)
+
+            if future.done():
+                continue
+
+            self._tokens -= 1
+
+            future.set_result(None)
+
+        if self._waiters and self._timer is None:
+            delay = (1 - self._tokens) / self._rate
+
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+
+        self._dispatch()
+
+    def _record_wait(self, priority: RequestPriority, wait: float):
+        wait_stats = self._wait_stats[priority]
+
+        wait_stats["requests"] += 1
+
+        if wait > 0:
+            wait_stats["waited"] += 1
+            wait_stats["total_wait"] += wait
+            wait_stats["max_wait"] = max(wait_stats["max_wait"], wait)
+
+    def to_dict(self) -> dict:
+        obj = {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": self._tokens,
+            "queue_length": self.queue_length,
+            "wait": {
+                priority.name.lower(): {
+                    **wait_stats,
+                    "mean_wait": (
+                        wait_stats["total_wait"] / wait_stats["requests"]
+                        if wait_stats["requests"]
+                        else 0
+                    ),
+                }
+                for priority, wait_stats in self._wait_stats.items()
+            },
+        }
+
+        return obj
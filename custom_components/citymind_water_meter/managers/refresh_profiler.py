@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import cProfile
+from datetime import datetime
+import logging
+import pstats
+import time
+
+from homeassistant.core import HomeAssistant
+
+from ..common.consts import (
+    DOMAIN,
+    PROFILE_CATEGORIES,
+    PROFILE_FILE,
+    PROFILE_NETWORK_WAIT_FUNCTIONS,
+)
+from .coordinator import Coordinator
+
+try:
+    import yappi
+
+except ImportError:
+    yappi = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RefreshProfiler:
+    """Runs a single refresh cycle (fetch, process, publish) under a profiler.
+
+    Uses yappi (wall clock, coroutine aware) when requested and installed,
+    cProfile otherwise. Stats are written to the config directory.
+    """
+
+    _hass: HomeAssistant
+    _coordinator: Coordinator
+
+    def __init__(self, hass: HomeAssistant, coordinator: Coordinator):
+        self._hass = hass
+        self._coordinator = coordinator
+
+    @staticmethod
+    def is_yappi_available() -> bool:
+        return yappi is not None
+
+    async def profile(self, top: int, use_yappi: bool = False) -> dict:
+        entry_id = self._coordinator.config_manager.entry_id
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+
+        file_name = PROFILE_FILE.format(entry_id=entry_id, timestamp=timestamp)
+        file_path = self._hass.config.path(file_name)
+
+        if use_yappi and not self.is_yappi_available():
+            _LOGGER.warning("yappi is not installed, profiling with cProfile")
+
+            use_yappi = False
+
+        _LOGGER.info(f"Profiling refresh of {DOMAIN} entry {entry_id}")
+
+        started_at = time.perf_counter()
+
+        if use_yappi:
+            await self._profile_yappi(file_path)
+
+        else:
+            await self._profile_cprofile(file_path)
+
+        duration = time.perf_counter() - started_at
+
+        stats = await self._hass.async_add_executor_job(pstats.Stats, file_path)
+
+        result = {
+            "entry_id": entry_id,
+            "profiler": "yappi" if use_yappi else "cProfile",
+            "stats_file": file_path,
+            "duration": duration,
+            "categories": self._get_categories(stats),
+            "top": self._get_top_functions(stats, top),
+        }
+
+        return result
+
+    async def _profile_cprofile(self, file_path: str):
+        profile = cProfile.Profile()
+        profile.enable()
+
+        try:
+            await self._coordinator.async_refresh()
+
+        finally:
+            profile.disable()
+
+        await self._hass.async_add_executor_job(profile.dump_stats, file_path)
+
+    async def _profile_yappi(self, file_path: str):
+        yappi.clear_stats()
+        yappi.set_clock_type("wall")
+        yappi.start()
+
+        try:
+            await self._coordinator.async_refresh()
+
+        finally:
+            yappi.stop()
+
+        func_stats = yappi.get_func_stats()
+
+        await self._hass.async_add_executor_job(func_stats.save, file_path, "pstat")
+
+        yappi.clear_stats()
+
+    @staticmethod
+    def _get_function_name(function: tuple[str, int, str]) -> str:
+        file_name, line_number, function_name = function
+
+        function_name = (
+            function_name
+            if file_name == "~"
+            else f"{file_name}:{line_number}({function_name})"
+        )
+
+        return function_name
+
+    @staticmethod
+    def _get_categories(stats: pstats.Stats) -> dict[str, float]:
+        """Time per category, own time for network wait, cumulative otherwise."""
+        categories = {category: 0.0 for category in PROFILE_CATEGORIES}
+        network_wait = 0.0
+
+        for function, function_stats in stats.stats.items():
+            file_name, _line_number, function_name = function
+            _cc, _nc, total_time, cumulative_time, _callers = function_stats
+
+            if any(item in function_name for item in PROFILE_NETWORK_WAIT_FUNCTIONS):
+                network_wait += total_time
+
+            for category, (path, name) in PROFILE_CATEGORIES.items():
+                if file_name.endswith(path) and function_name == name:
+                    categories[category] += cumulative_time
+
+        result = {"network_wait": network_wait, **categories}
+
+        return result
+
+    def _get_top_functions(self, stats: pstats.Stats, top: int) -> list[dict]:
+        items = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+
+        result = [
+            {
+                "function": self._get_function_name(function),
+                "calls": function_stats[1],
+                "total_time": function_stats[2],
+                "cumulative_time": function_stats[3],
+            }
+            for function, function_stats in items[:top]
+        ]
+
+        return result
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import bisect
+import logging
+
+from ..common.consts import REQUEST_LATENCY_BUCKETS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EndpointMetrics:
+    """Counters and latency histogram of a single endpoint key."""
+
+    requests: int
+    errors: int
+    bytes: int
+    total_latency: float
+    max_latency: float
+    statuses: dict[str, int]
+    methods: dict[str, int]
+    histogram: list[int]
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.statuses = {}
+        self.methods = {}
+        self.histogram = [0] * (len(REQUEST_LATENCY_BUCKETS) + 1)
+
+    def to_dict(self) -> dict:
+        obj = {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "mean_latency": (
+                self.total_latency / self.requests if self.requests else None
+            ),
+            "max_latency": self.max_latency,
+            "p95_latency": get_percentile(self.histogram, 0.95),
+            "statuses": self.statuses,
+            "methods": self.methods,
+            "histogram": {
+                get_bucket_name(index): count
+                for index, count in enumerate(self.histogram)
+            },
+        }
+
+        return obj
+
+
+def get_bucket_name(index: int) -> str:
+    if index < len(REQUEST_LATENCY_BUCKETS):
+        bucket_name = f"<={REQUEST_LATENCY_BUCKETS[index]}"
+
+    else:
+        bucket_name = f">{REQUEST_LATENCY_BUCKETS[-1]}"
+
+    return bucket_name
+
+
+def get_percentile(histogram: list[int], percentile: float) -> float | None:
+    """Upper bound (seconds) of the bucket holding the percentile."""
+    total = sum(histogram)
+
+    if total == 0:
+        return None
+
+    rank = total * percentile
+    count = 0
+    result = None
+
+    for index, bucket_count in enumerate(histogram):
+        count += bucket_count
+
+        if count >= rank:
+            result = (
+                REQUEST_LATENCY_BUCKETS[index]
+                if index < len(REQUEST_LATENCY_BUCKETS)
+                else None
+            )
+
+            break
+
+    return result
+
+
+class RequestMetrics:
+    """In memory counters and latency histograms of API requests per endpoint.
+
+    Nothing is measured or recorded while disabled.
+    """
+
+    _is_enabled: bool
+    _endpoints: dict[str, EndpointMetrics]
+    _histogram: list[int]
+    _errors: int
+    _last_refresh_duration: float | None
+
+    def __init__(self, is_enabled: bool = False):
+        self._is_enabled = is_enabled
+
+        self.reset()
+
+    @property
+    def is_enabled(self) -> bool:
+        is_enabled = self._is_enabled
+
+        return is_enabled
+
+    @property
+    def errors(self) -> int | None:
+        errors = self._errors if self._is_enabled else None
+
+        return errors
+
+    @property
+    def p95_latency(self) -> float | None:
+        p95_latency = (
+            get_percentile(self._histogram, 0.95) if self._is_enabled else None
+        )
+
+        return p95_latency
+
+    @property
+    def last_refresh_duration(self) -> float | None:
+        last_refresh_duration = (
+            self._last_refresh_duration if self._is_enabled else None
+        )
+
+        return last_refresh_duration
+
+    def set_enabled(self, is_enabled: bool):
+        if is_enabled == self._is_enabled:
+            return
+
+        self._is_enabled = is_enabled
+
+        self.reset()
+
+    def reset(self):
+        self._endpoints = {}
+        self._histogram = [0] * (len(REQUEST_LATENCY_BUCKETS) + 1)
+        self._errors = 0
+        self._last_refresh_duration = None
+
+    def record(
+        self,
+        endpoint_key: str,
+        method: str,
+        status: int | None,
+        size: int | None,
+        latency: float,
+    ):
+        """Record request, status is None when no response was received."""
+        endpoint_metrics = self._endpoints.get(endpoint_key)
+
+        if endpoint_metrics is None:
+            endpoint_metrics = EndpointMetrics()
+
+            self._endpoints[endpoint_key] = endpoint_metrics
+
+        status_key = "none" if status is None else str(status)
+        bucket = bisect.bisect_left(REQUEST_LATENCY_BUCKETS, latency)
+        is_error = status is None or status >= 400
+
+        endpoint_metrics.requests += 1
+        endpoint_metrics.bytes += size or 0
+        endpoint_metrics.total_latency += latency
+        endpoint_metrics.max_latency = max(endpoint_metrics.max_latency, latency)
+        endpoint_metrics.statuses[status_key] = (
+            endpoint_metrics.statuses.get(status_key, 0) + 1
+        )
+        endpoint_metrics.methods[method] = endpoint_metrics.methods.get(method, 0) + 1
+        endpoint_metrics.histogram[bucket] += 1
+
+        self._histogram[bucket] += 1
+
+        if is_error:
+            endpoint_metrics.errors += 1
+
+            self._errors += 1
+
+    def record_refresh(self, duration: float):
+        self._last_refresh_duration = duration
+
+    def to_dict(self) -> dict:
+        obj = {
+            "enabled": self._is_enabled,
+            "errors": self._errors,
+            "p95_latency": get_percentile(self._histogram, 0.95),
+            "last_refresh_duration": self._last_refresh_duration,
+            "endpoints": {
+                endpoint_key: endpoint_metrics.to_dict()
+                for endpoint_key, endpoint_metrics in self._endpoints.items()
+            },
+        }
+
+        return obj
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from ..common.consts import API_CACHE_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    _ttls: dict[str, timedelta]
+    _entries: dict[str, tuple[str, datetime, Any]]
+    _hits: int
+    _misses: int
+
+    def __init__(self, ttls: dict[str, timedelta] | None = None):
+        self._ttls = API_CACHE_TTL if ttls is None else ttls
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+
+    def is_cacheable(self, section: str | None) -> bool:
+        is_cacheable = section in self._ttls
+
+        return is_cacheable
+
+    def get(self, section: str | None, url: str) -> Any | None:
+        result = None
+
+        if self.is_cacheable(section):
+            entry = self._entries.get(url)
+
+            if entry is not None:
+                _section, expires_at, data = entry
+
+                if expires_at > datetime.now():
+                    result = data
+
+                else:
+                    self._entries.pop(url)
+
+            if result is None:
+                self._misses += 1
+
+            else:
+                self._hits += 1
+
+                _LOGGER.debug(f"Cache hit for {section}, URL: {url}")
+
+        return result
+
+    def set(self, section: str | None, url: str, data: Any) -> None:
+        if data is not None and self.is_cacheable(section):
+            expires_at = datetime.now() + self._ttls[section]
+
+            self._entries[url] = (section, expires_at, data)
+
+    def invalidate(self, section: str | None = None) -> None:
+        urls = [
+            url
+            for url, entry in self._entries.items()
+            if section is None or entry[0] == section
+        ]
+
+        for url in urls:
+            self._entries.pop(url)
+
+        _LOGGER.debug(f"Invalidated {len(urls)} cached responses, Section: {section}")
+
+    def to_dict(self):
+        obj = {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+            "ttl": {
+                section: self._ttls[section].total_seconds() for section in self._ttls
+            },
+        }
+
+        return obj
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable
-from datetime import datetime
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+import json
 import logging
 import sys
+import time
 from typing import Any, Callable
 
-from aiohttp import ClientResponseError, ClientSession
+from aiohttp import ClientResponse, ClientResponseError, ClientSession, ClientTimeout
 from aiohttp.hdrs import METH_DELETE, METH_GET, METH_POST, METH_PUT
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.dispatcher import dispatcher_send
 
 from ..common.connectivity_status import ConnectivityStatus
@@ -21,8 +23,14 @@ from ..common.consts import (
     API_DATA_LAST_UPDATE,
     API_DATA_SECTION_ME,
     API_DATA_SECTION_METERS,
+    API_DATA_SECTION_SETTINGS,
     API_DATA_TOKEN,
+    API_ENDPOINT_CLASSES,
     API_HEADER_TOKEN,
+    API_TIMEOUTS,
+    API_TOKEN_REFRESH_INTERVAL,
+    API_URL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_NAME,
     DEVICE_ID,
     ENDPOINT_DATA_INITIALIZE,
@@ -39,17 +47,24 @@ from ..common.consts import (
     ENDPOINT_PARAMETER_TODAY,
     ENDPOINT_PARAMETER_YESTERDAY,
     ERROR_REASON_INVALID_CREDENTIALS,
+    FORMAT_DATE_ISO,
+    FORMAT_DATE_YEAR_MONTH,
     LOGIN_DEVICE_ID,
     LOGIN_EMAIL,
     LOGIN_PASSWORD,
     ME_MUNICIPAL_ID,
     METER_COUNT,
     SIGNAL_API_STATUS,
-    SIGNAL_DATA_CHANGED,
 )
-from ..common.enums import AlertChannel, AlertType
+from ..common.enums import AlertChannel, AlertType, EndpointClass
 from ..models.analytics_periods import AnalyticPeriodsData
 from ..models.config_data import ConfigData
+from ..models.exceptions import CircuitOpenError
+from .client_hub import ClientHub
+from .connection_stats import ConnectionStats
+from .request_metrics import RequestMetrics
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +83,18 @@ class RestAPI:
     _dispatched_account: bool
 
     _last_valid: datetime | None
+    _token_issued_at: datetime | None
+    _login_lock: asyncio.Lock
+    _token_changed_callback: Callable[[str, datetime], Awaitable[None]] | None
+    _max_concurrent_requests: int
+    _api_url: str
+    _response_cache: ResponseCache
+    _retry_policy: RetryPolicy
+    _timeouts: dict[EndpointClass, ClientTimeout]
+    _client_hub: ClientHub
+    _request_metrics: RequestMetrics
+    _revisions: dict[tuple[str, str | None], int]
+    _content_hashes: dict[tuple[str, str | None], int]
 
     _alert_settings_actions: dict[bool, Callable[[str, list[int]], Awaitable[dict]]]
 
@@ -77,6 +104,10 @@ class RestAPI:
         config_data: ConfigData,
         analytic_periods: AnalyticPeriodsData | None = None,
         entry_id: str | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        api_url: str = API_URL,
+        timeouts: dict[EndpointClass, ClientTimeout] | None = None,
+        client_hub: ClientHub | None = None,
     ):
         try:
             if analytic_periods is None:
@@ -99,6 +130,22 @@ class RestAPI:
             self._dispatched_devices = []
             self._dispatched_server = False
             self._last_valid = None
+            self._token_issued_at = None
+            self._login_lock = asyncio.Lock()
+            self._token_changed_callback = None
+            self._max_concurrent_requests = max(1, max_concurrent_requests)
+            self._api_url = api_url
+            self._response_cache = ResponseCache()
+            self._retry_policy = RetryPolicy()
+            self._timeouts = API_TIMEOUTS if timeouts is None else timeouts
+            self._request_metrics = RequestMetrics()
+            self._client_hub = (
+                ClientHub(self._max_concurrent_requests)
+                if client_hub is None
+                else client_hub
+            )
+            self._revisions = {}
+            self._content_hashes = {}
 
             self._alert_settings_actions = {
                 True: self._async_put,
@@ -113,6 +160,13 @@ class RestAPI:
                 f"Failed to load {DEFAULT_NAME} API, error: {ex}, line: {line_number}"
             )
 
+    @property
+    def revisions(self) -> dict[tuple[str, str | None], int]:
+        """Content revision per (section, meter ID), meter ID is None for sections."""
+        revisions = self._revisions
+
+        return revisions
+
     @property
     def is_connected(self):
         result = self._session is not None
@@ -126,13 +180,50 @@ class RestAPI:
         return status
 
     @property
-    def _is_home_assistant(self):
-        return self._hass is not None
+    def analytic_periods(self) -> AnalyticPeriodsData:
+        analytic_periods = self._analytic_periods
+
+        return analytic_periods
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        response_cache = self._response_cache
+
+        return response_cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        retry_policy = self._retry_policy
+
+        return retry_policy
+
+    @property
+    def request_metrics(self) -> RequestMetrics:
+        request_metrics = self._request_metrics
+
+        return request_metrics
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        connection_stats = self._client_hub.connection_stats
+
+        return connection_stats
 
     @property
     def token(self):
         return self.data.get(API_DATA_TOKEN)
 
+    @property
+    def is_token_expiring(self) -> bool:
+        if self._token_issued_at is None:
+            return True
+
+        token_age = datetime.now() - self._token_issued_at
+
+        is_expiring = token_age >= API_TOKEN_REFRESH_INTERVAL
+
+        return is_expiring
+
     @property
     def municipal_id(self) -> str | None:
         customer_service = self.data.get(API_DATA_SECTION_ME, {})
@@ -149,11 +240,15 @@ class RestAPI:
 
         await self._initialize_session()
 
-        await self.login()
+        if self.token is None:
+            await self.login()
+
+        else:
+            self._set_status(ConnectivityStatus.Connected, "Using stored token")
 
     async def terminate(self):
         if self._session is not None:
-            await self._session.close()
+            await self._client_hub.release(self, self._entry_id)
             self._session = None
 
     async def validate(self):
@@ -165,25 +260,55 @@ class RestAPI:
             f"Connection: {self.status}"
         )
 
+        if self.status == ConnectivityStatus.Connected and self.is_token_expiring:
+            _LOGGER.debug("Token is about to expire, refreshing it")
+
+            await self._refresh_token(self.token)
+
         if self.status == ConnectivityStatus.Connected:
             if self.municipal_id is None:
                 await self._load_data(ENDPOINT_DATA_INITIALIZE)
 
-            await self._load_data(ENDPOINT_DATA_UPDATE)
+            requests = self._get_data_requests(ENDPOINT_DATA_UPDATE)
 
             meters = self.data.get(API_DATA_SECTION_METERS, [])
 
             for meter in meters:
                 meter_id = str(meter.get(METER_COUNT))
 
-                await self._load_data(ENDPOINT_DATA_UPDATE_PER_METER, meter_id)
+                meter_requests = self._get_data_requests(
+                    ENDPOINT_DATA_UPDATE_PER_METER, meter_id
+                )
+
+                requests.extend(meter_requests)
 
-            self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
+            await self._load_requests(requests)
+
+    async def get_consumption(
+        self, section: str, meter_count: str, from_date: date, to_date: date
+    ) -> dict | list | None:
+        """Daily or monthly consumption of a meter over a date range."""
+        if self.status != ConnectivityStatus.Connected:
+            return None
+
+        endpoint = ENDPOINT_DATA_UPDATE_PER_METER.get(section)
+
+        parameters = {
+            ENDPOINT_PARAMETER_YESTERDAY: from_date.strftime(FORMAT_DATE_ISO),
+            ENDPOINT_PARAMETER_TODAY: to_date.strftime(FORMAT_DATE_ISO),
+            ENDPOINT_PARAMETER_CURRENT_MONTH: from_date.strftime(
+                FORMAT_DATE_YEAR_MONTH
+            ),
+            ENDPOINT_PARAMETER_LAST_DAY_MONTH: to_date.strftime(FORMAT_DATE_ISO),
+        }
+
+        result = await self._async_get(endpoint, meter_count, section, parameters)
+
+        return result
 
     async def login(self):
+        """Current token stays in use by other requests until the new one arrives."""
         try:
-            self.data[API_DATA_TOKEN] = None
-
             config_data = self._config_data
 
             data = {
@@ -202,10 +327,17 @@ class RestAPI:
                 if error_code == ERROR_REASON_INVALID_CREDENTIALS:
                     message = f"Failed to login, Error #{error_code}: {error_reason}"
 
+                    self.data[API_DATA_TOKEN] = None
+                    self._token_issued_at = None
+
                     self._set_status(ConnectivityStatus.InvalidCredentials, message)
 
                 if token is not None:
                     self.data[API_DATA_TOKEN] = token
+                    self._token_issued_at = datetime.now()
+
+                    if self._token_changed_callback is not None:
+                        await self._token_changed_callback(token, self._token_issued_at)
 
                     self._set_status(ConnectivityStatus.Connected)
 
@@ -217,13 +349,20 @@ class RestAPI:
 
             self._set_status(ConnectivityStatus.Failed, message)
 
+    async def _refresh_token(self, failed_token: str | None) -> bool:
+        """Login again unless another request already replaced the failed token."""
+        async with self._login_lock:
+            if self.token == failed_token:
+                await self.login()
+
+        is_refreshed = self.token is not None and self.token != failed_token
+
+        return is_refreshed
+
     async def _initialize_session(self):
+        """Use pooled session of the hub, reconnects keep the pooled connections."""
         try:
-            if self._is_home_assistant:
-                self._session = async_create_clientsession(hass=self._hass)
-
-            else:
-                self._session = ClientSession()
+            self._session = self._client_hub.get_session(self)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -258,6 +397,15 @@ class RestAPI:
 
             _LOGGER.log(log_level, log_message)
 
+    def restore_token(self, token: str | None, issued_at: datetime | None):
+        self.data[API_DATA_TOKEN] = token
+        self._token_issued_at = issued_at
+
+    def set_token_changed_callback(
+        self, callback: Callable[[str, datetime], Awaitable[None]]
+    ):
+        self._token_changed_callback = callback
+
     def set_local_async_dispatcher_send(self, callback):
         self._local_async_dispatcher_send = callback
 
@@ -269,8 +417,13 @@ class RestAPI:
             dispatcher_send(self._hass, signal, self._entry_id, *args)
 
     def _build_endpoint(
-        self, endpoint, meter_count: str | None = None, alert_type: str | None = None
+        self,
+        endpoint,
+        meter_count: str | None = None,
+        alert_type: str | None = None,
+        parameters: dict | None = None,
     ):
+        """Format endpoint, parameters override the analytic periods dates."""
         data = {
             ENDPOINT_PARAMETER_METER_ID: meter_count,
             ENDPOINT_PARAMETER_ALERT_TYPE: alert_type,
@@ -281,18 +434,27 @@ class RestAPI:
             ENDPOINT_PARAMETER_CURRENT_MONTH: self._analytic_periods.current_month_iso,
         }
 
+        if parameters is not None:
+            data.update(parameters)
+
         url = endpoint.format(**data)
 
+        if self._api_url != API_URL:
+            url = url.replace(API_URL, self._api_url, 1)
+
         return url
 
     async def _async_post(self, endpoint, request_data: dict):
         result = None
+        is_probe = False
 
         try:
             url = self._build_endpoint(endpoint)
 
-            async with self._session.post(
-                url, json=request_data, ssl=False
+            is_probe = self._validate_circuit(url)
+
+            async with self._request(
+                METH_POST, url, EndpointClass.LOGIN, json=request_data
             ) as response:
                 _LOGGER.debug(f"Status of {url}: {response.status}")
 
@@ -300,6 +462,16 @@ class RestAPI:
 
                 response.raise_for_status()
 
+            self._retry_policy.record_success()
+
+        except asyncio.CancelledError:
+            self._handle_cancelled(is_probe)
+
+            raise
+
+        except CircuitOpenError as coex:
+            self._handle_circuit_open(coex, METH_POST)
+
         except ClientResponseError as crex:
             self._handle_client_error(endpoint, METH_POST, crex)
 
@@ -311,22 +483,40 @@ class RestAPI:
 
         return result
 
-    async def _async_get(self, endpoint: str, meter_count: str | None = None):
+    async def _async_get(
+        self,
+        endpoint: str,
+        meter_count: str | None = None,
+        section: str | None = None,
+        parameters: dict | None = None,
+    ):
+        """Send GET request, responses of requests with parameters are not cached."""
         result = None
 
         try:
-            url = self._build_endpoint(endpoint, meter_count=meter_count)
+            url = self._build_endpoint(
+                endpoint, meter_count=meter_count, parameters=parameters
+            )
 
-            headers = {API_HEADER_TOKEN: self.token}
+            is_cached = parameters is None
 
-            async with self._session.get(url, headers=headers, ssl=False) as response:
-                _LOGGER.debug(f"Status of {url}: {response.status}")
+            if is_cached:
+                cached_result = self._response_cache.get(section, url)
 
-                response.raise_for_status()
+                if cached_result is not None:
+                    return cached_result
 
-                result = await response.json()
+            endpoint_class = API_ENDPOINT_CLASSES.get(section, EndpointClass.ACCOUNT)
 
-                self.data[API_DATA_LAST_UPDATE] = datetime.now()
+            result = await self._async_send(
+                METH_GET, url, endpoint_class, endpoint_key=section
+            )
+
+            if is_cached:
+                self._response_cache.set(section, url, result)
+
+        except CircuitOpenError as coex:
+            self._handle_circuit_open(coex, METH_GET)
 
         except ClientResponseError as crex:
             self._handle_client_error(endpoint, METH_GET, crex)
@@ -343,18 +533,12 @@ class RestAPI:
         result = None
 
         try:
-            headers = {API_HEADER_TOKEN: self.token}
-
-            async with self._session.put(
-                url, headers=headers, json=data, ssl=False
-            ) as response:
-                _LOGGER.debug(f"Status of {url}: {response.status}")
-
-                response.raise_for_status()
+            result = await self._async_send(
+                METH_PUT, url, EndpointClass.SETTINGS_UPDATE, data
+            )
 
-                result = await response.json()
-
-                self.data[API_DATA_LAST_UPDATE] = datetime.now()
+        except CircuitOpenError as coex:
+            self._handle_circuit_open(coex, METH_PUT)
 
         except ClientResponseError as crex:
             self._handle_client_error(url, METH_PUT, crex)
@@ -371,10 +555,42 @@ class RestAPI:
         result = None
 
         try:
-            headers = {API_HEADER_TOKEN: self.token}
+            result = await self._async_send(
+                METH_DELETE, url, EndpointClass.SETTINGS_UPDATE, data
+            )
+
+        except CircuitOpenError as coex:
+            self._handle_circuit_open(coex, METH_DELETE)
+
+        except ClientResponseError as crex:
+            self._handle_client_error(url, METH_DELETE, crex)
+
+        except TimeoutError:
+            self._handle_server_timeout(url, METH_DELETE)
+
+        except Exception as ex:
+            self._handle_general_request_failure(url, METH_DELETE, ex)
+
+        return result
 
-            async with self._session.delete(
-                url, headers=headers, json=data, ssl=False
+    async def _async_send(
+        self,
+        method: str,
+        url: str,
+        endpoint_class: EndpointClass,
+        data: list[int] | None = None,
+        endpoint_key: str | None = None,
+        can_retry=True,
+    ):
+        """Send authenticated request, replays it once after re-login on HTTP 401."""
+        token = self.token
+        headers = {API_HEADER_TOKEN: token}
+
+        is_probe = self._validate_circuit(url)
+
+        try:
+            async with self._request(
+                method, url, endpoint_class, endpoint_key, headers=headers, json=data
             ) as response:
                 _LOGGER.debug(f"Status of {url}: {response.status}, Data: {data}")
 
@@ -384,66 +600,220 @@ class RestAPI:
 
                 self.data[API_DATA_LAST_UPDATE] = datetime.now()
 
+            self._retry_policy.record_success()
+
+        except asyncio.CancelledError:
+            self._handle_cancelled(is_probe)
+
+            raise
+
         except ClientResponseError as crex:
-            self._handle_client_error(url, METH_DELETE, crex)
+            if crex.status != 401 or not can_retry:
+                raise
 
-        except TimeoutError:
-            self._handle_server_timeout(url, METH_DELETE)
+            # Server is reachable, lets login pass while half-open probing
+            self._retry_policy.record_error(crex)
 
-        except Exception as ex:
-            self._handle_general_request_failure(url, METH_DELETE, ex)
+            is_refreshed = await self._refresh_token(token)
+
+            if not is_refreshed:
+                raise
+
+            _LOGGER.debug(f"Token refreshed, replaying {method} request to {url}")
+
+            result = await self._async_send(
+                method, url, endpoint_class, data, endpoint_key, False
+            )
 
         return result
 
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        endpoint_class: EndpointClass,
+        endpoint_key: str | None = None,
+        **kwargs,
+    ) -> AsyncIterator[ClientResponse]:
+        """Send request holding a hub slot, records metrics if enabled."""
+        timeout = self._timeouts[endpoint_class]
+
+        async with self._client_hub.request_slot(endpoint_class):
+            if not self._request_metrics.is_enabled:
+                async with self._session.request(
+                    method, url, timeout=timeout, **kwargs
+                ) as response:
+                    yield response
+
+                return
+
+            started_at = time.perf_counter()
+            status = None
+            size = None
+
+            try:
+                async with self._session.request(
+                    method, url, timeout=timeout, **kwargs
+                ) as response:
+                    status = response.status
+
+                    yield response
+
+                    size = len(await response.read())
+
+            finally:
+                self._request_metrics.record(
+                    endpoint_key or endpoint_class,
+                    method,
+                    status,
+                    size,
+                    time.perf_counter() - started_at,
+                )
+
     async def _load_data(self, endpoints: dict, meter_count: str | None = None):
-        if self.status == ConnectivityStatus.Connected:
-            for endpoint_key in endpoints:
-                if self.status == ConnectivityStatus.Connected:
-                    endpoint = endpoints.get(endpoint_key)
+        requests = self._get_data_requests(endpoints, meter_count)
+
+        await self._load_requests(requests)
+
+    @staticmethod
+    def _get_data_requests(
+        endpoints: dict, meter_count: str | None = None
+    ) -> list[tuple[str, str, str | None]]:
+        requests = [
+            (endpoint_key, endpoints.get(endpoint_key), meter_count)
+            for endpoint_key in endpoints
+        ]
+
+        return requests
+
+    async def _load_requests(self, requests: list[tuple[str, str, str | None]]):
+        """Fetch all requests concurrently, merge results in request order."""
+        if self.status != ConnectivityStatus.Connected:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        async def _load_request(
+            endpoint_key: str, endpoint: str, meter_count: str | None
+        ):
+            async with semaphore:
+                if self.status != ConnectivityStatus.Connected:
+                    return None
+
+                data = await self._async_get(endpoint, meter_count, endpoint_key)
+
+                return data
+
+        results = await asyncio.gather(
+            *[
+                _load_request(endpoint_key, endpoint, meter_count)
+                for endpoint_key, endpoint, meter_count in requests
+            ]
+        )
+
+        for request, data in zip(requests, results):
+            endpoint_key, _endpoint, meter_count = request
+
+            self._set_data(endpoint_key, data, meter_count)
+
+    def _set_data(self, endpoint_key: str, data, meter_count: str | None = None):
+        if data is None:
+            if meter_count is None:
+                _LOGGER.debug(f"Cannot update {endpoint_key} due to empty data")
+
+            else:
+                _LOGGER.debug(
+                    f"Cannot update {endpoint_key} for meter '{meter_count}' due to empty data"
+                )
 
-                    data = await self._async_get(endpoint, meter_count)
+        elif meter_count is None:
+            self._update_revision(endpoint_key, data, self.data.get(endpoint_key))
 
-                    if data is None:
-                        continue
+            self.data[endpoint_key] = data
 
-                    if meter_count is None:
-                        if data is None:
-                            _LOGGER.debug(
-                                f"Cannot update {endpoint_key} due to empty data"
-                            )
+        else:
+            metered_data = self.data.get(endpoint_key, {})
 
-                        else:
-                            self.data[endpoint_key] = data
+            self._update_revision(
+                endpoint_key, data, metered_data.get(meter_count), meter_count
+            )
 
-                    else:
-                        metered_data = self.data.get(endpoint_key, {})
-                        metered_data[meter_count] = data
+            metered_data[meter_count] = data
 
-                        if metered_data is None:
-                            _LOGGER.debug(
-                                f"Cannot update {endpoint_key} for meter '{meter_count}' due to empty data"
-                            )
+            self.data[endpoint_key] = metered_data
 
-                        else:
-                            self.data[endpoint_key] = metered_data
+    def _update_revision(
+        self, endpoint_key: str, data, previous_data, meter_count: str | None = None
+    ):
+        """Bump revision of section (or meter within section) if content changed."""
+        if data is previous_data:
+            return
+
+        key = (endpoint_key, meter_count)
+        content_hash = hash(json.dumps(data, sort_keys=True, default=str))
+
+        if self._content_hashes.get(key) != content_hash:
+            self._content_hashes[key] = content_hash
+            self._revisions[key] = self._revisions.get(key, 0) + 1
+
+    def _validate_circuit(self, url: str) -> bool:
+        """Raise if the circuit rejects the request, whether it is the probe."""
+        if not self._retry_policy.allow_request():
+            raise CircuitOpenError(url)
+
+        is_probe = self._retry_policy.is_probing
+
+        return is_probe
+
+    def _handle_cancelled(self, is_probe: bool):
+        if is_probe:
+            # Cancelled probe has no outcome, circuit would stay half-open
+            self._retry_policy.cancel_probe()
+
+    def _handle_circuit_open(self, coex: CircuitOpenError, method: str):
+        if self._retry_policy.is_probing:
+            # Probe outcome sets the status, skipped requests must not fail it
+            _LOGGER.debug(
+                "HTTP request was not sent, waiting for half-open probe, "
+                f"Endpoint: {coex.endpoint}, "
+                f"Method: {method}"
+            )
+
+            return
+
+        message = (
+            "HTTP request was not sent, circuit is open, "
+            f"Endpoint: {coex.endpoint}, "
+            f"Method: {method}, "
+            f"Retry in: {self._retry_policy.get_delay()}"
+        )
+
+        self._set_status(ConnectivityStatus.Failed, message)
 
     def _handle_client_error(
         self, endpoint: str, method: str, crex: ClientResponseError
     ):
+        error_class = self._retry_policy.record_error(crex)
+
         message = (
             "Failed to send HTTP request, "
             f"Endpoint: {endpoint}, "
             f"Method: {method}, "
-            f"HTTP Status: {crex.message} ({crex.status})"
+            f"HTTP Status: {crex.message} ({crex.status}), "
+            f"Error: {error_class}"
         )
 
         if crex.status == 401:
-            self._set_status(ConnectivityStatus.NotConnected)
+            if self.status == ConnectivityStatus.Connected:
+                self._set_status(ConnectivityStatus.NotConnected, message)
 
         elif crex.status > 401:
             self._set_status(ConnectivityStatus.Failed, message)
 
     def _handle_server_timeout(self, endpoint: str, method: str):
+        self._retry_policy.record_error(TimeoutError())
+
         message = (
             "Failed to send HTTP request due to timeout, "
             f"Endpoint: {endpoint}, "
@@ -458,6 +828,8 @@ class RestAPI:
         exc_type, exc_obj, tb = sys.exc_info()
         line_number = tb.tb_lineno
 
+        self._retry_policy.record_error(ex)
+
         message = (
             "Failed to send HTTP request, "
             f"Endpoint: {endpoint}, "
@@ -486,8 +858,8 @@ class RestAPI:
 
             await action(url, data)
 
+            self._response_cache.invalidate(API_DATA_SECTION_SETTINGS)
+
             await asyncio.sleep(1)
 
             await self._load_data(ENDPOINT_DATA_RELOAD)
-
-            self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
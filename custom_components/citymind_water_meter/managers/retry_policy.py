@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import random
+
+from aiohttp import ClientResponseError
+from aiohttp.hdrs import RETRY_AFTER
+
+from ..common.consts import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_TRANSIENT_ERRORS,
+)
+from ..common.enums import CircuitState, ErrorClass
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_BACKOFF_EXPONENT = 32
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and a circuit breaker for API calls.
+
+    Transient errors (timeouts, HTTP 5xx, HTTP 429 and connection errors) are
+    counted as consecutive failures, once the threshold is reached the circuit
+    opens and requests are rejected until the backoff delay passes. A single
+    half-open probe then either closes the circuit or opens it again.
+    """
+
+    _base_delay: timedelta
+    _max_delay: timedelta
+    _failure_threshold: int
+    _random: Callable[[], float]
+
+    _state: CircuitState
+    _failures: int
+    _last_error: ErrorClass | None
+    _retry_after: timedelta | None
+    _open_until: datetime | None
+    _is_probing: bool
+
+    def __init__(
+        self,
+        base_delay: timedelta = RETRY_BASE_DELAY,
+        max_delay: timedelta = RETRY_MAX_DELAY,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        random_func: Callable[[], float] = random.random,
+    ):
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._failure_threshold = max(1, failure_threshold)
+        self._random = random_func
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._last_error = None
+        self._retry_after = None
+        self._open_until = None
+        self._is_probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        state = self._state
+
+        return state
+
+    @property
+    def failures(self) -> int:
+        """Consecutive transient failures."""
+        failures = self._failures
+
+        return failures
+
+    @property
+    def is_probing(self) -> bool:
+        """Half-open probe request is in flight, its result decides the state."""
+        is_probing = self._is_probing
+
+        return is_probing
+
+    @property
+    def last_error(self) -> ErrorClass | None:
+        last_error = self._last_error
+
+        return last_error
+
+    @staticmethod
+    def classify(ex: Exception) -> ErrorClass:
+        if isinstance(ex, ClientResponseError):
+            if ex.status == 401:
+                error_class = ErrorClass.UNAUTHORIZED
+
+            elif ex.status == 429:
+                error_class = ErrorClass.RATE_LIMITED
+
+            elif ex.status >= 500:
+                error_class = ErrorClass.SERVER_ERROR
+
+            else:
+                error_class = ErrorClass.CLIENT_ERROR
+
+        elif isinstance(ex, TimeoutError):
+            error_class = ErrorClass.TIMEOUT
+
+        else:
+            error_class = ErrorClass.CONNECTION
+
+        return error_class
+
+    @staticmethod
+    def get_retry_after(ex: Exception) -> timedelta | None:
+        """Parse Retry-After header (seconds or HTTP date) of a failed response."""
+        headers = getattr(ex, "headers", None)
+        value = None if headers is None else headers.get(RETRY_AFTER)
+
+        if value is None:
+            return None
+
+        try:
+            retry_after = timedelta(seconds=float(value))
+
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+
+            except (TypeError, ValueError):
+                _LOGGER.debug(f"Ignoring invalid Retry-After header: {value}")
+
+                return None
+
+            retry_after = retry_at - datetime.now(timezone.utc)
+
+        retry_after = max(retry_after, timedelta(0))
+
+        return retry_after
+
+    def allow_request(self, now: datetime | None = None) -> bool:
+        """Whether a request can be sent, lets a single probe through half-open."""
+        if self._state == CircuitState.OPEN:
+            if (now or datetime.now()) < self._open_until:
+                return False
+
+            self._set_state(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.HALF_OPEN:
+            if self._is_probing:
+                return False
+
+            self._is_probing = True
+
+        return True
+
+    def record_success(self):
+        self._failures = 0
+        self._retry_after = None
+        self._is_probing = False
+
+        self._set_state(CircuitState.CLOSED)
+
+    def cancel_probe(self):
+        """Probe ended without a result (cancelled), next request probes again."""
+        self._is_probing = False
+
+    def record_error(self, ex: Exception, now: datetime | None = None) -> ErrorClass:
+        error_class = self.classify(ex)
+
+        self._last_error = error_class
+
+        if error_class not in RETRY_TRANSIENT_ERRORS:
+            # Server responded, it is reachable, 401 is handled by login
+            self.record_success()
+
+        else:
+            self._failures += 1
+            self._retry_after = self.get_retry_after(ex)
+            self._is_probing = False
+
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self._failure_threshold
+            ):
+                self._open_until = (now or datetime.now()) + self._get_backoff()
+
+                self._set_state(CircuitState.OPEN)
+
+        return error_class
+
+    def get_delay(self, now: datetime | None = None) -> timedelta:
+        """Delay before the next attempt, remaining open time if circuit is open."""
+        if self._state == CircuitState.OPEN:
+            delay = max(self._open_until - (now or datetime.now()), timedelta(0))
+
+        else:
+            delay = self._get_backoff()
+
+        return delay
+
+    def _get_backoff(self) -> timedelta:
+        """Full jitter, random delay up to the exponential backoff ceiling."""
+        exponent = min(max(self._failures - 1, 0), MAX_BACKOFF_EXPONENT)
+
+        ceiling = min(
+            self._max_delay.total_seconds(),
+            self._base_delay.total_seconds() * 2**exponent,
+        )
+
+        delay = timedelta(seconds=ceiling * self._random())
+
+        if self._retry_after is not None:
+            delay = max(delay, self._retry_after)
+
+        return delay
+
+    def _set_state(self, state: CircuitState):
+        if state == self._state:
+            return
+
+        _LOGGER.info(
+            f"Circuit state changed {self._state} --> {state}, "
+            f"Consecutive failures: {self._failures}"
+        )
+
+        self._state = state
+
+        if state != CircuitState.OPEN:
+            self._open_until = None
+
+    def to_dict(self) -> dict:
+        obj = {
+            "state": self._state,
+            "failures": self._failures,
+            "failure_threshold": self._failure_threshold,
+            "last_error": self._last_error,
+            "retry_after": (
+                None if self._retry_after is None else self._retry_after.total_seconds()
+            ),
+            "open_until": self._open_until,
+        }
+
+        return obj
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+import sys
+from typing import Callable
+
+from homeassistant.config_entries import STORAGE_VERSION
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import Store
+
+from ..common.consts import SNAPSHOT_FILE, SNAPSHOT_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotManager:
+    """Keeps the last processed data on disk to restore entities on startup."""
+
+    _store: Store | None
+
+    def __init__(self, hass: HomeAssistant | None, entry_id: str):
+        self._hass = hass
+
+        if hass is None:
+            self._store = None
+
+        else:
+            self._store = Store(
+                hass,
+                STORAGE_VERSION,
+                SNAPSHOT_FILE.format(entry_id=entry_id),
+                encoder=JSONEncoder,
+            )
+
+    async def load(self) -> dict | None:
+        data = None
+
+        if self._store is not None:
+            try:
+                data = await self._store.async_load()
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.warning(
+                    f"Failed to load snapshot, Error: {ex}, Line: {line_number}"
+                )
+
+        return data
+
+    def save(self, data_func: Callable[[], dict]) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(data_func, SNAPSHOT_SAVE_DELAY)
+
+    async def remove(self) -> None:
+        if self._store is not None:
+            await self._store.async_remove()
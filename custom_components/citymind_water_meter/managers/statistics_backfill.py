@@ -0,0 +1,501 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+import logging
+import sys
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import STORAGE_VERSION
+from homeassistant.const import UnitOfVolume
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from ..common.consts import (
+    API_DATA_SECTION_CONSUMPTION_DAILY,
+    API_DATA_SECTION_CONSUMPTION_MONTHLY,
+    BACKFILL_BATCH_SIZE,
+    BACKFILL_CHECKPOINT_FIRST,
+    BACKFILL_CHECKPOINT_LAST,
+    BACKFILL_CHECKPOINT_SUM,
+    BACKFILL_FILE,
+    BACKFILL_MAX_CONCURRENT_REQUESTS,
+    BACKFILL_PAGE_DAYS,
+    BACKFILL_PAGE_MONTHS,
+    BACKFILL_PERIODS,
+    BACKFILL_SAVE_DELAY,
+    DOMAIN,
+    FORMAT_DATE_ISO,
+    FORMAT_DATE_YEAR_MONTH,
+    STATISTIC_ID_CONSUMPTION,
+    STATISTIC_NAME_CONSUMPTION,
+)
+from ..data_processors.meter_processor import MeterProcessor
+from .rest_api import RestAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StatisticsBackfill:
+    """Pages consumption history into recorder external statistics.
+
+    Date ranges are split into pages (31 days of daily, 12 months of monthly
+    consumption), pages of a meter are fetched concurrently (bounded for all
+    meters) and written in order, in batches. First and last written date and
+    the running sum are checkpointed per meter and period, re-runs continue
+    after the last date with data. Catch up imports the daily gap since the
+    checkpoint after downtime.
+    """
+
+    _hass: HomeAssistant | None
+    _api: RestAPI
+    _store: Store | None
+    _checkpoints: dict[str, dict[str, dict]] | None
+    _max_concurrent_requests: int
+    _semaphore: asyncio.Semaphore
+    _batch_size: int
+    _lock: asyncio.Lock
+
+    def __init__(
+        self,
+        hass: HomeAssistant | None,
+        api: RestAPI,
+        entry_id: str,
+        max_concurrent_requests: int = BACKFILL_MAX_CONCURRENT_REQUESTS,
+        batch_size: int = BACKFILL_BATCH_SIZE,
+    ):
+        self._hass = hass
+        self._api = api
+        self._checkpoints = None
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        self._batch_size = max(1, batch_size)
+        self._lock = asyncio.Lock()
+
+        if hass is None:
+            self._store = None
+
+        else:
+            self._store = Store(
+                hass, STORAGE_VERSION, BACKFILL_FILE.format(entry_id=entry_id)
+            )
+
+    @property
+    def checkpoints(self) -> dict[str, dict[str, dict]]:
+        """Checkpoint per meter ID and period, {first, last, sum}."""
+        checkpoints = {} if self._checkpoints is None else self._checkpoints
+
+        return checkpoints
+
+    async def load(self):
+        if self._checkpoints is not None:
+            return
+
+        data = None
+
+        if self._store is not None:
+            try:
+                data = await self._store.async_load()
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.warning(
+                    f"Failed to load backfill checkpoints, "
+                    f"Error: {ex}, Line: {line_number}"
+                )
+
+        self._checkpoints = {} if data is None else data
+
+    @staticmethod
+    async def async_remove(hass: HomeAssistant, entry_id: str):
+        """Remove checkpoints of a removed entry, its coordinator is unloaded."""
+        store = Store(hass, STORAGE_VERSION, BACKFILL_FILE.format(entry_id=entry_id))
+
+        await store.async_remove()
+
+    async def run(
+        self, meter_ids: list[str], start_date: date, end_date: date | None = None
+    ) -> dict:
+        """Backfill daily and monthly consumption of meters since start date.
+
+        End date defaults to yesterday of the refresh periods, as catch up,
+        monthly statistics end with the last complete month. Runs of the same
+        entry are serialized.
+        """
+        if end_date is None:
+            end_date = self._api.analytic_periods.yesterday.date()
+
+        jobs = [
+            (meter_id, section, start_date, end_date, False, None)
+            for meter_id in meter_ids
+            for section in BACKFILL_PERIODS
+        ]
+
+        result = await self._run(jobs)
+
+        _LOGGER.info(
+            f"Backfill of {len(meter_ids)} meters since {start_date} done, "
+            f"Requests: {result['requests']}, Statistics: {result['statistics']}, "
+            f"Completed: {result['completed']}"
+        )
+
+        return result
+
+    async def catch_up(
+        self, meter_ids: list[str], end_date: date, daily_data: dict | None = None
+    ) -> dict:
+        """Import daily consumption missing since the last ingested date.
+
+        Missing span of a meter is requested at once (single widened request),
+        when only the end date is missing it is taken from the refresh data
+        (daily section by meter ID) without a request. Meters without
+        checkpoint start at the end date.
+        """
+        if daily_data is None:
+            daily_data = {}
+
+        jobs = [
+            (
+                meter_id,
+                API_DATA_SECTION_CONSUMPTION_DAILY,
+                None,
+                end_date,
+                True,
+                daily_data.get(meter_id),
+            )
+            for meter_id in meter_ids
+        ]
+
+        result = await self._run(jobs)
+
+        if result["statistics"] > 0 or not result["completed"]:
+            _LOGGER.info(
+                f"Catch up of {len(meter_ids)} meters until {end_date} done, "
+                f"Requests: {result['requests']}, "
+                f"Statistics: {result['statistics']}, "
+                f"Completed: {result['completed']}"
+            )
+
+        return result
+
+    async def _run(self, jobs: list[tuple]) -> dict:
+        async with self._lock:
+            await self.load()
+
+            results = await asyncio.gather(*[self._backfill(*job) for job in jobs])
+
+            if self._store is not None:
+                await self._store.async_save(self._get_store_data())
+
+        result = {
+            "meters": len({item["meter_id"] for item in results}),
+            "requests": sum(item["requests"] for item in results),
+            "statistics": sum(item["statistics"] for item in results),
+            "completed": all(item["completed"] for item in results),
+            "items": results,
+        }
+
+        return result
+
+    async def _backfill(
+        self,
+        meter_id: str,
+        section: str,
+        start_date: date | None,
+        end_date: date,
+        is_widened: bool = False,
+        local_response: dict | list | None = None,
+    ) -> dict:
+        """Import consumption of a meter after its checkpoint until end date.
+
+        Without start date the checkpoint is used as is, widened imports
+        request the whole span at once instead of paging it.
+        """
+        period = BACKFILL_PERIODS[section]
+        is_monthly = section == API_DATA_SECTION_CONSUMPTION_MONTHLY
+
+        if is_monthly:
+            end_date = (end_date + timedelta(days=1)).replace(day=1) - timedelta(days=1)
+
+            if start_date is not None:
+                start_date = start_date.replace(day=1)
+
+        previous_checkpoint = self.checkpoints.get(meter_id, {}).get(period)
+        checkpoint = self._get_checkpoint(
+            meter_id, period, start_date or end_date, start_date is None, is_monthly
+        )
+
+        if previous_checkpoint is not None and (
+            previous_checkpoint[BACKFILL_CHECKPOINT_FIRST]
+            != checkpoint[BACKFILL_CHECKPOINT_FIRST]
+        ):
+            # Starting over, sums of already imported statistics are rewritten
+            end_date = max(
+                end_date,
+                date.fromisoformat(previous_checkpoint[BACKFILL_CHECKPOINT_LAST]),
+            )
+        from_date = self._get_next(
+            date.fromisoformat(checkpoint[BACKFILL_CHECKPOINT_LAST]), is_monthly
+        )
+
+        if not is_widened:
+            pages = self._get_pages(from_date, end_date, is_monthly)
+
+        elif from_date <= end_date:
+            pages = [(from_date, end_date)]
+
+        else:
+            pages = []
+
+        metadata = self._get_metadata(meter_id, period)
+
+        result = {
+            "meter_id": meter_id,
+            "period": period,
+            "from": from_date,
+            "to": end_date,
+            "requests": 0,
+            "statistics": 0,
+            "completed": True,
+        }
+
+        rows: list[StatisticData] = []
+
+        if pages == [(end_date, end_date)] and self._has_value(
+            local_response, meter_id, end_date, is_monthly
+        ):
+            self._load_page(
+                meter_id, pages[0], local_response, is_monthly, checkpoint, rows
+            )
+
+            pages = []
+
+        for index in range(0, len(pages), self._max_concurrent_requests):
+            window = pages[index : index + self._max_concurrent_requests]
+
+            responses = await asyncio.gather(
+                *[self._fetch(section, meter_id, page) for page in window]
+            )
+
+            result["requests"] += len(window)
+
+            for page, response in zip(window, responses):
+                if response is None:
+                    _LOGGER.warning(
+                        f"Backfill of meter {meter_id} ({period}) stopped at "
+                        f"{page[0]}, will continue from there on next run"
+                    )
+
+                    result["completed"] = False
+
+                    break
+
+                self._load_page(meter_id, page, response, is_monthly, checkpoint, rows)
+
+            if not result["completed"]:
+                break
+
+            if len(rows) >= self._batch_size:
+                result["statistics"] += self._write(
+                    meter_id, period, metadata, checkpoint, rows
+                )
+
+                rows = []
+
+        result["statistics"] += self._write(
+            meter_id, period, metadata, checkpoint, rows
+        )
+
+        return result
+
+    async def _fetch(
+        self, section: str, meter_id: str, page: tuple[date, date]
+    ) -> dict | list | None:
+        async with self._semaphore:
+            from_date, to_date = page
+
+            response = await self._api.get_consumption(
+                section, meter_id, from_date, to_date
+            )
+
+            return response
+
+    def _load_page(
+        self,
+        meter_id: str,
+        page: tuple[date, date],
+        response: dict | list,
+        is_monthly: bool,
+        checkpoint: dict,
+        rows: list[StatisticData],
+    ):
+        """Append page rows, checkpoint moves to the last day with data.
+
+        Later days without data are requested again on the next run, data of
+        recent days may be published late.
+        """
+        from_date, to_date = page
+        date_format = FORMAT_DATE_YEAR_MONTH if is_monthly else FORMAT_DATE_ISO
+        date_length = len(from_date.strftime(date_format))
+
+        values = MeterProcessor.parse_consumption(response, meter_id, date_length)
+
+        current_date = from_date
+        total = checkpoint[BACKFILL_CHECKPOINT_SUM]
+
+        while current_date <= to_date:
+            value = values.get(current_date.strftime(date_format))
+
+            if value is not None:
+                total += float(value)
+
+                rows.append(
+                    StatisticData(
+                        start=dt_util.start_of_local_day(current_date),
+                        state=float(value),
+                        sum=total,
+                    )
+                )
+
+                checkpoint[BACKFILL_CHECKPOINT_LAST] = current_date.isoformat()
+
+            current_date = self._get_next(current_date, is_monthly)
+
+        checkpoint[BACKFILL_CHECKPOINT_SUM] = total
+
+    def _write(
+        self,
+        meter_id: str,
+        period: str,
+        metadata: StatisticMetaData,
+        checkpoint: dict,
+        rows: list[StatisticData],
+    ) -> int:
+        """Import rows in a single batch, then move the checkpoint."""
+        if rows and self._hass is not None:
+            async_add_external_statistics(self._hass, metadata, rows)
+
+        self._checkpoints.setdefault(meter_id, {})[period] = dict(checkpoint)
+
+        if self._store is not None:
+            self._store.async_delay_save(self._get_store_data, BACKFILL_SAVE_DELAY)
+
+        return len(rows)
+
+    def _get_store_data(self) -> dict:
+        data = self.checkpoints
+
+        return data
+
+    def _get_checkpoint(
+        self,
+        meter_id: str,
+        period: str,
+        start_date: date,
+        is_continued: bool,
+        is_monthly: bool,
+    ) -> dict:
+        """Copy of the checkpoint, new one starts at start date.
+
+        Unless continued, a start date before the checkpoint starts over.
+        """
+        checkpoint = self.checkpoints.get(meter_id, {}).get(period)
+
+        is_outdated = checkpoint is not None and (
+            not is_continued
+            and start_date < date.fromisoformat(checkpoint[BACKFILL_CHECKPOINT_FIRST])
+        )
+
+        if checkpoint is None or is_outdated:
+            before_start = self._get_previous(start_date, is_monthly)
+
+            checkpoint = {
+                BACKFILL_CHECKPOINT_FIRST: start_date.isoformat(),
+                BACKFILL_CHECKPOINT_LAST: before_start.isoformat(),
+                BACKFILL_CHECKPOINT_SUM: 0.0,
+            }
+
+        return dict(checkpoint)
+
+    @staticmethod
+    def _has_value(
+        response: dict | list | None, meter_id: str, day: date, is_monthly: bool
+    ) -> bool:
+        if response is None:
+            return False
+
+        date_format = FORMAT_DATE_YEAR_MONTH if is_monthly else FORMAT_DATE_ISO
+        date_key = day.strftime(date_format)
+
+        values = MeterProcessor.parse_consumption(response, meter_id, len(date_key))
+
+        has_value = values.get(date_key) is not None
+
+        return has_value
+
+    def _get_pages(
+        self, from_date: date, end_date: date, is_monthly: bool
+    ) -> list[tuple[date, date]]:
+        pages = []
+
+        while from_date <= end_date:
+            if is_monthly:
+                next_page = from_date
+                for _ in range(BACKFILL_PAGE_MONTHS):
+                    next_page = self._get_next(next_page, True)
+
+            else:
+                next_page = from_date + timedelta(days=BACKFILL_PAGE_DAYS)
+
+            to_date = min(next_page - timedelta(days=1), end_date)
+
+            pages.append((from_date, to_date))
+
+            from_date = next_page
+
+        return pages
+
+    @staticmethod
+    def _get_next(current_date: date, is_monthly: bool) -> date:
+        if is_monthly:
+            next_date = (current_date.replace(day=1) + timedelta(days=32)).replace(
+                day=1
+            )
+
+        else:
+            next_date = current_date + timedelta(days=1)
+
+        return next_date
+
+    @staticmethod
+    def _get_previous(current_date: date, is_monthly: bool) -> date:
+        if is_monthly:
+            previous_date = (current_date.replace(day=1) - timedelta(days=1)).replace(
+                day=1
+            )
+
+        else:
+            previous_date = current_date - timedelta(days=1)
+
+        return previous_date
+
+    @staticmethod
+    def _get_metadata(meter_id: str, period: str) -> StatisticMetaData:
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=STATISTIC_NAME_CONSUMPTION.format(
+                meter_id=meter_id, period=period.capitalize()
+            ),
+            source=DOMAIN,
+            statistic_id=STATISTIC_ID_CONSUMPTION.format(
+                meter_id=meter_id, period=period
+            ),
+            unit_of_measurement=UnitOfVolume.CUBIC_METERS,
+        )
+
+        return metadata
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import math
+
+from ..models.meter_costs import MeterCosts
+from ..models.tariff import Tariff
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TariffEngine:
+    """Calculates monthly costs of all meters in a single batched pass.
+
+    Meters are laid out as columns (consumption, tier bounds and costs), every
+    tier is calculated for all meters at once. Tariffs with less tiers are
+    padded with empty tiers.
+    """
+
+    @staticmethod
+    def calculate(
+        consumption: dict[str, float | None], tariffs: dict[str, Tariff]
+    ) -> dict[str, MeterCosts]:
+        meter_ids = list(consumption.keys())
+
+        if not meter_ids:
+            return {}
+
+        meter_tariffs = [tariffs[meter_id] for meter_id in meter_ids]
+        consumption_column = [
+            0 if consumption[meter_id] is None else consumption[meter_id]
+            for meter_id in meter_ids
+        ]
+
+        tiers_count = max(len(tariff.tiers) for tariff in meter_tariffs)
+
+        limit_columns = TariffEngine._get_tier_columns(
+            [tariff.get_limits() for tariff in meter_tariffs], tiers_count, math.inf
+        )
+        cost_columns = TariffEngine._get_tier_columns(
+            [[cost for _limit, cost in tariff.tiers] for tariff in meter_tariffs],
+            tiers_count,
+            0,
+        )
+
+        tier_consumption_columns = []
+        tier_cost_columns = []
+        lower_column = [0.0] * len(meter_ids)
+
+        for limit_column, cost_column in zip(limit_columns, cost_columns):
+            upper_column = [
+                min(value, limit)
+                for value, limit in zip(consumption_column, limit_column)
+            ]
+            tier_consumption_column = [
+                max(upper - lower, 0)
+                for upper, lower in zip(upper_column, lower_column)
+            ]
+            tier_cost_column = [
+                value * cost
+                for value, cost in zip(tier_consumption_column, cost_column)
+            ]
+
+            tier_consumption_columns.append(tier_consumption_column)
+            tier_cost_columns.append(tier_cost_column)
+
+            lower_column = [
+                max(upper, lower) for upper, lower in zip(upper_column, lower_column)
+            ]
+
+        sewage_cost_column = [
+            value * tariff.sewage_cost
+            for value, tariff in zip(consumption_column, meter_tariffs)
+        ]
+        fixed_charge_column = [tariff.fixed_charge for tariff in meter_tariffs]
+        subtotal_column = [
+            sum(tier_costs) + sewage_cost + fixed_charge
+            for tier_costs, sewage_cost, fixed_charge in zip(
+                zip(*tier_cost_columns), sewage_cost_column, fixed_charge_column
+            )
+        ]
+        vat_cost_column = [
+            subtotal * tariff.vat / 100
+            for subtotal, tariff in zip(subtotal_column, meter_tariffs)
+        ]
+
+        result = {}
+
+        for index, meter_id in enumerate(meter_ids):
+            tiers_used = len(meter_tariffs[index].tiers)
+
+            costs = MeterCosts(meter_id)
+            costs.tier_consumption = [
+                column[index] for column in tier_consumption_columns[:tiers_used]
+            ]
+            costs.tier_costs = [
+                column[index] for column in tier_cost_columns[:tiers_used]
+            ]
+            costs.sewage_cost = sewage_cost_column[index]
+            costs.fixed_charge = fixed_charge_column[index]
+            costs.vat_cost = vat_cost_column[index]
+            costs.total_cost = subtotal_column[index] + vat_cost_column[index]
+
+            result[meter_id] = costs
+
+        return result
+
+    @staticmethod
+    def _get_tier_columns(
+        rows: list[list[float]], tiers_count: int, padding: float
+    ) -> list[list[float]]:
+        """Per meter rows to per tier columns, short rows are padded."""
+        padded_rows = [row + [padding] * (tiers_count - len(row)) for row in rows]
+
+        columns = [list(column) for column in zip(*padded_rows)]
+
+        return columns
@@ -58,6 +58,30 @@ class AccountData:
 
         return obj
 
+    @staticmethod
+    def from_dict(obj: dict) -> AccountData:
+        account = AccountData()
+
+        account.account_number = obj.get("account_number")
+        account.first_name = obj.get("first_name")
+        account.last_name = obj.get("last_name")
+        account.municipal_id = obj.get("municipal_id")
+        account.municipal_name = obj.get("municipal_name")
+        account.municipal_phone = obj.get("municipal_phone")
+        account.municipal_email = obj.get("municipal_email")
+        account.vacations = obj.get("vacations")
+        account.alerts = obj.get("alerts")
+        account.messages = obj.get("messages")
+
+        alert_settings = obj.get("alert_settings")
+
+        if alert_settings is not None:
+            account.alert_settings = {
+                EntityKeys(key): alert_settings[key] for key in alert_settings
+            }
+
+        return account
+
     def __repr__(self):
         to_string = json.dumps(self.to_dict(), default=str)
 
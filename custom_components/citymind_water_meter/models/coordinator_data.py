@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime
+import json
+
+from custom_components.citymind_water_meter.common.enums import EntityType
+
+from .account_data import AccountData
+from .meter_costs import MeterCosts
+from .meter_data import MeterData
+
+
+class CoordinatorData:
+    """Result of a single fetch, process and publish cycle."""
+
+    account: AccountData | None
+    meters: dict[str, MeterData]
+    changed_items: set[tuple[EntityType, str | None]]
+    costs: dict[str, MeterCosts]
+    updated_at: datetime
+
+    def __init__(
+        self,
+        account: AccountData | None,
+        meters: dict[str, MeterData],
+        changed_items: set[tuple[EntityType, str | None]],
+        costs: dict[str, MeterCosts] | None = None,
+    ):
+        self.account = account
+        self.meters = meters
+        self.changed_items = changed_items
+        self.costs = {} if costs is None else costs
+        self.updated_at = datetime.now()
+
+    def is_changed(self, entity_type: EntityType, item_id: str | None = None) -> bool:
+        is_changed = (entity_type, item_id) in self.changed_items
+
+        return is_changed
+
+    def to_dict(self):
+        obj = {
+            "account": None if self.account is None else self.account.to_dict(),
+            "meters": [self.meters[meter_id].to_dict() for meter_id in self.meters],
+            "changed_items": [
+                f"{entity_type} {item_id}" if item_id else str(entity_type)
+                for entity_type, item_id in self.changed_items
+            ],
+            "costs": [self.costs[meter_id].to_dict() for meter_id in self.costs],
+            "updated_at": self.updated_at,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = json.dumps(self.to_dict(), default=str)
+
+        return to_string
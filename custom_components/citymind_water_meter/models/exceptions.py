@@ -47,3 +47,12 @@ class LoginException(HomeAssistantError):
     @property
     def status_code(self):
         return self._status_code
+
+
+class CircuitOpenError(HomeAssistantError):
+    endpoint: str
+
+    def __init__(self, endpoint: str):
+        super().__init__(f"Circuit is open, request to '{endpoint}' was not sent")
+
+        self.endpoint = endpoint
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+
+class MeterCosts:
+    """Monthly consumption and costs of a meter, per tier and in total."""
+
+    meter_id: str
+    tier_consumption: list[float]
+    tier_costs: list[float]
+    sewage_cost: float
+    fixed_charge: float
+    vat_cost: float
+    total_cost: float
+
+    def __init__(self, meter_id: str):
+        self.meter_id = meter_id
+        self.tier_consumption = []
+        self.tier_costs = []
+        self.sewage_cost = 0
+        self.fixed_charge = 0
+        self.vat_cost = 0
+        self.total_cost = 0
+
+    @property
+    def low_rate_consumption(self) -> float:
+        value = sum(self.tier_consumption[:1])
+
+        return value
+
+    @property
+    def high_rate_consumption(self) -> float:
+        value = sum(self.tier_consumption[1:])
+
+        return value
+
+    @property
+    def low_rate_cost(self) -> float:
+        value = sum(self.tier_costs[:1])
+
+        return value
+
+    @property
+    def high_rate_cost(self) -> float:
+        value = sum(self.tier_costs[1:])
+
+        return value
+
+    def to_dict(self):
+        obj = {
+            "meter_id": self.meter_id,
+            "tier_consumption": self.tier_consumption,
+            "tier_costs": self.tier_costs,
+            "sewage_cost": self.sewage_cost,
+            "fixed_charge": self.fixed_charge,
+            "vat_cost": self.vat_cost,
+            "total_cost": self.total_cost,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = json.dumps(self.to_dict(), default=str)
+
+        return to_string
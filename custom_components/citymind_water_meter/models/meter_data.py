@@ -45,24 +45,6 @@ class MeterData:
 
         return name
 
-    @property
-    def high_rate_monthly_consumption(self) -> float:
-        value = 0
-
-        if self.monthly_consumption > self.low_rate_consumption_threshold:
-            value = self.monthly_consumption - self.low_rate_consumption_threshold
-
-        return value
-
-    @property
-    def low_rate_monthly_consumption(self) -> float:
-        value = self.monthly_consumption
-
-        if self.monthly_consumption > self.low_rate_consumption_threshold:
-            value = self.low_rate_consumption_threshold
-
-        return value
-
     def to_dict(self):
         obj = {
             "meter_id": self.meter_id,
@@ -81,6 +63,24 @@ class MeterData:
 
         return obj
 
+    @staticmethod
+    def from_dict(obj: dict) -> MeterData:
+        meter = MeterData(obj.get("meter_id"))
+
+        meter.meter_serial_number = obj.get("meter_serial_number")
+        meter.address = obj.get("address")
+        meter.last_read = obj.get("last_read")
+        meter.today_consumption = obj.get("today_consumption")
+        meter.yesterday_consumption = obj.get("yesterday_consumption")
+        meter.monthly_consumption = obj.get("monthly_consumption")
+        meter.consumption_forecast = obj.get("consumption_forecast")
+        meter.low_rate_consumption_threshold = obj.get("low_rate_consumption_threshold")
+        meter.low_rate_cost = obj.get("low_rate_cost")
+        meter.high_rate_cost = obj.get("high_rate_cost")
+        meter.sewage_cost = obj.get("sewage_cost")
+
+        return meter
+
     def __repr__(self):
         to_string = json.dumps(self.to_dict(), default=str)
 
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import math
+
+from ..common.consts import (
+    DEFAULT_FIXED_CHARGE,
+    DEFAULT_HOUSEHOLD_SIZE,
+    DEFAULT_VAT,
+    METER_CONFIG_MIN_VALUES,
+    STORAGE_DATA_METER_FIXED_CHARGE,
+    STORAGE_DATA_METER_HIGH_RATE_COST,
+    STORAGE_DATA_METER_HOUSEHOLD_SIZE,
+    STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD,
+    STORAGE_DATA_METER_LOW_RATE_COST,
+    STORAGE_DATA_METER_SEWAGE_COST,
+    STORAGE_DATA_METER_TIERS,
+    STORAGE_DATA_METER_VAT,
+    TARIFF_TIER_COST,
+    TARIFF_TIER_LIMIT,
+)
+
+
+class Tariff:
+    """Monthly tariff of a meter.
+
+    Tiers are (limit, cost per m³) ordered by limit, limit is the monthly
+    consumption per resident up to which the tier applies, last tier is unbounded.
+    """
+
+    tiers: list[tuple[float, float]]
+    sewage_cost: float
+    fixed_charge: float
+    vat: float
+    household_size: float
+
+    def __init__(self):
+        self.tiers = []
+        self.sewage_cost = 0
+        self.fixed_charge = DEFAULT_FIXED_CHARGE
+        self.vat = DEFAULT_VAT
+        self.household_size = DEFAULT_HOUSEHOLD_SIZE
+
+    def get_limits(self) -> list[float]:
+        """Upper bound of every tier for the household, last one is infinite."""
+        limits = [limit * self.household_size for limit, _cost in self.tiers[:-1]]
+        limits.append(math.inf)
+
+        return limits
+
+    def to_dict(self):
+        obj = {
+            STORAGE_DATA_METER_TIERS: [
+                {
+                    TARIFF_TIER_LIMIT: None if math.isinf(limit) else limit,
+                    TARIFF_TIER_COST: cost,
+                }
+                for limit, cost in self.tiers
+            ],
+            STORAGE_DATA_METER_SEWAGE_COST: self.sewage_cost,
+            STORAGE_DATA_METER_FIXED_CHARGE: self.fixed_charge,
+            STORAGE_DATA_METER_VAT: self.vat,
+            STORAGE_DATA_METER_HOUSEHOLD_SIZE: self.household_size,
+        }
+
+        return obj
+
+    @staticmethod
+    def from_config(meter_config: dict) -> Tariff:
+        """Tariff of meter configuration.
+
+        Without tiers, low / high rate costs and threshold are used as 2 tiers.
+        """
+        tariff = Tariff()
+
+        tiers = meter_config.get(STORAGE_DATA_METER_TIERS)
+
+        if tiers:
+            tiers = sorted(
+                tiers,
+                key=lambda tier: (
+                    math.inf
+                    if tier.get(TARIFF_TIER_LIMIT) is None
+                    else tier.get(TARIFF_TIER_LIMIT)
+                ),
+            )
+
+            tariff.tiers = [
+                (
+                    (
+                        math.inf
+                        if tier.get(TARIFF_TIER_LIMIT) is None
+                        else tier.get(TARIFF_TIER_LIMIT)
+                    ),
+                    tier.get(TARIFF_TIER_COST, 0),
+                )
+                for tier in tiers
+            ]
+
+        else:
+            tariff.tiers = [
+                (
+                    meter_config.get(
+                        STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD, 0
+                    ),
+                    meter_config.get(STORAGE_DATA_METER_LOW_RATE_COST, 0),
+                ),
+                (math.inf, meter_config.get(STORAGE_DATA_METER_HIGH_RATE_COST, 0)),
+            ]
+
+        tariff.sewage_cost = meter_config.get(STORAGE_DATA_METER_SEWAGE_COST, 0)
+        tariff.fixed_charge = meter_config.get(
+            STORAGE_DATA_METER_FIXED_CHARGE, DEFAULT_FIXED_CHARGE
+        )
+        tariff.vat = meter_config.get(STORAGE_DATA_METER_VAT, DEFAULT_VAT)
+        household_size = meter_config.get(
+            STORAGE_DATA_METER_HOUSEHOLD_SIZE, DEFAULT_HOUSEHOLD_SIZE
+        )
+
+        # Empty household would zero every tier limit, stored before it was validated
+        if household_size < METER_CONFIG_MIN_VALUES[STORAGE_DATA_METER_HOUSEHOLD_SIZE]:
+            household_size = DEFAULT_HOUSEHOLD_SIZE
+
+        tariff.household_size = household_size
+
+        return tariff
+
+    def __repr__(self):
+        to_string = json.dumps(self.to_dict(), default=str)
+
+        return to_string
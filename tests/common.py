@@ -0,0 +1,99 @@
+"""Helpers setting up the integration in Home Assistant against the fake API."""
+from __future__ import annotations
+
+from functools import partial
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.citymind_water_meter.common.consts import DATA_CLIENT_HUB, DOMAIN
+from custom_components.citymind_water_meter.managers.client_hub import ClientHub
+from custom_components.citymind_water_meter.managers.coordinator import Coordinator
+from custom_components.citymind_water_meter.managers.password_manager import (
+    PasswordManager,
+)
+from custom_components.citymind_water_meter.managers.rest_api import RestAPI
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import slugify
+
+from .fake_api import FAKE_EMAIL, FAKE_PASSWORD, FakeReadYourMeterServer
+
+
+async def setup_integration(
+    hass: HomeAssistant, server: FakeReadYourMeterServer
+) -> Coordinator:
+    """Set up entry, first refresh is awaited as part of the setup.
+
+    Domain client hub is created without rate limit, unless already set up.
+    """
+    hass.data.setdefault(DOMAIN, {}).setdefault(DATA_CLIENT_HUB, ClientHub(rate=None))
+
+    data = {CONF_EMAIL: FAKE_EMAIL, CONF_PASSWORD: FAKE_PASSWORD}
+
+    await PasswordManager.encrypt(hass, data)
+
+    entry = MockConfigEntry(domain=DOMAIN, data=data, title="CityMind")
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.citymind_water_meter.managers.coordinator.RestAPI",
+        partial(RestAPI, api_url=server.url),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    await hass.async_block_till_done()
+
+    coordinator: Coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return coordinator
+
+
+async def teardown_integration(hass: HomeAssistant, coordinator: Coordinator):
+    entry = coordinator.config_manager.entry
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await coordinator.api.terminate()
+    await hass.async_block_till_done()
+
+
+async def restart_integration(
+    hass: HomeAssistant, server: FakeReadYourMeterServer, coordinator: Coordinator
+) -> Coordinator:
+    """Unload the entry and set it up again, as after a Home Assistant restart."""
+    entry = coordinator.config_manager.entry
+
+    await teardown_integration(hass, coordinator)
+
+    with patch(
+        "custom_components.citymind_water_meter.managers.coordinator.RestAPI",
+        partial(RestAPI, api_url=server.url),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    await hass.async_block_till_done()
+
+    return coordinator
+
+
+def get_entity_id(
+    hass: HomeAssistant, platform: Platform, key: str, meter_id: str | None = None
+) -> str | None:
+    """Entity ID of an entity description key, account entities have no meter ID."""
+    unique_id_parts = [DOMAIN, platform, key, meter_id]
+
+    unique_id = slugify(
+        "_".join(
+            unique_id_part
+            for unique_id_part in unique_id_parts
+            if unique_id_part is not None
+        )
+    )
+
+    entity_registry = er.async_get(hass)
+    entity_id = entity_registry.async_get_entity_id(platform, DOMAIN, unique_id)
+
+    return entity_id
@@ -0,0 +1,156 @@
+"""Fixtures for offline tests against the local fake portal API."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable
+import json
+import platform
+
+import pytest
+
+from custom_components.citymind_water_meter.common.consts import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.citymind_water_meter.managers.client_hub import ClientHub
+from custom_components.citymind_water_meter.managers.config_manager import ConfigManager
+from custom_components.citymind_water_meter.managers.rest_api import RestAPI
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+
+from .fake_api import FAKE_EMAIL, FAKE_PASSWORD, FakeReadYourMeterServer
+
+BENCHMARK_RESULTS_FILE = "benchmark-results.json"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="run refresh pipeline benchmarks (tests marked with perf)",
+    )
+    parser.addoption(
+        "--benchmark-results-file",
+        default=BENCHMARK_RESULTS_FILE,
+        help="JSON file to store benchmark results in",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "perf: refresh pipeline benchmark, requires --run-benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip_perf = pytest.mark.skip(reason="benchmarks require --run-benchmarks")
+
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request) -> list[dict]:
+    """Collect benchmark results, written as JSON at the end of the session."""
+    results: list[dict] = []
+
+    yield results
+
+    if results:
+        file_path = request.config.getoption("--benchmark-results-file")
+
+        content = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(content, file, indent=2)
+
+
+@pytest.fixture
+async def fake_api_factory(socket_enabled) -> AsyncGenerator[
+    Callable[..., FakeReadYourMeterServer], None
+]:
+    """Start fake portal servers on demand, stop them at teardown."""
+    servers: list[FakeReadYourMeterServer] = []
+
+    async def _create(**kwargs) -> FakeReadYourMeterServer:
+        server = FakeReadYourMeterServer(**kwargs)
+
+        await server.start()
+
+        servers.append(server)
+
+        return server
+
+    yield _create
+
+    for server in servers:
+        await server.stop()
+
+
+@pytest.fixture
+async def fake_api(fake_api_factory) -> FakeReadYourMeterServer:
+    server = await fake_api_factory(meters=3)
+
+    return server
+
+
+@pytest.fixture
+async def config_manager() -> ConfigManager:
+    config_manager = ConfigManager(None, None)
+
+    await config_manager.initialize(
+        {CONF_EMAIL: FAKE_EMAIL, CONF_PASSWORD: FAKE_PASSWORD}
+    )
+
+    return config_manager
+
+
+@pytest.fixture
+async def api_factory(
+    config_manager: ConfigManager,
+) -> AsyncGenerator[Callable[..., RestAPI], None]:
+    """Create standalone (no Home Assistant) RestAPI instances for a server.
+
+    Unless a client hub is passed, requests are not rate limited so tests and
+    benchmarks measure the refresh pipeline only.
+    """
+    apis: list[RestAPI] = []
+
+    def _create(server: FakeReadYourMeterServer, **kwargs) -> RestAPI:
+        kwargs.setdefault(
+            "client_hub", ClientHub(DEFAULT_MAX_CONCURRENT_REQUESTS, rate=None)
+        )
+
+        api = RestAPI(
+            None,
+            config_manager.config_data,
+            config_manager.analytic_periods,
+            api_url=server.url,
+            **kwargs,
+        )
+
+        api.set_local_async_dispatcher_send(lambda *_args: None)
+
+        apis.append(api)
+
+        return api
+
+    yield _create
+
+    for api in apis:
+        await api.terminate()
+
+
+@pytest.fixture
+async def api(api_factory, fake_api) -> RestAPI:
+    api = api_factory(fake_api)
+
+    await api.initialize()
+
+    return api
@@ -0,0 +1,361 @@
+"""Local stand-in for the Read Your Meter Pro portal API."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+import random
+
+from aiohttp import hdrs, web
+from aiohttp.test_utils import TestServer
+
+from custom_components.citymind_water_meter.common.consts import (
+    API_DATA_ERROR_CODE,
+    API_DATA_ERROR_REASON,
+    API_DATA_TOKEN,
+    API_HEADER_TOKEN,
+    CONSUMPTION_DATA,
+    CONSUMPTION_DATE,
+    CONSUMPTION_FORECAST_ESTIMATED_CONSUMPTION,
+    CONSUMPTION_METER_COUNT,
+    CONSUMPTION_VALUE,
+    CUSTOMER_SERVICE_DESCRIPTION,
+    CUSTOMER_SERVICE_EMAIL,
+    CUSTOMER_SERVICE_PHONE_MUNICIPAL_ID,
+    CUSTOMER_SERVICE_PHONE_NUMBER,
+    ERROR_REASON_INVALID_CREDENTIALS,
+    FORMAT_DATE_ISO,
+    LAST_READ_METER_COUNT,
+    LAST_READ_VALUE,
+    LOGIN_EMAIL,
+    LOGIN_PASSWORD,
+    ME_ACCOUNT_NUMBER,
+    ME_FIRST_NAME,
+    ME_LAST_NAME,
+    ME_MUNICIPAL_ID,
+    METER_COUNT,
+    METER_FULL_ADDRESS,
+    METER_SERIAL_NUMBER,
+    SETTINGS_ALERT_TYPE_ID,
+    SETTINGS_MEDIA_TYPE_ID,
+)
+from custom_components.citymind_water_meter.common.enums import AlertChannel, AlertType
+
+FAKE_EMAIL = "user@example.com"
+FAKE_PASSWORD = "password"
+FAKE_ACCOUNT_NUMBER = 123456
+FAKE_MUNICIPAL_ID = 42
+FAKE_FIRST_METER_COUNT = 1000
+
+
+class FakeReadYourMeterServer:
+    """aiohttp application serving synthetic portal data.
+
+    Meter count, latency, random error rate (status and Retry-After), token
+    expiry (HTTP 401), hanging requests (timeouts) and the number of days
+    returned by the daily consumption endpoint (history length) can be
+    configured per instance, data_until holds back daily consumption of later
+    days (not published yet).
+    """
+
+    def __init__(
+        self,
+        meters: int = 1,
+        latency: float = 0,
+        error_rate: float = 0,
+        error_status: int = 500,
+        retry_after: int | None = None,
+        timeout_rate: float = 0,
+        timeout_delay: float = 30,
+        history_days: int = 0,
+        seed: int = 0,
+    ):
+        self.meters = meters
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.timeout_rate = timeout_rate
+        self.timeout_delay = timeout_delay
+        self.history_days = history_days
+        self.data_until: date | None = None
+
+        self.requests: list[tuple[str, str]] = []
+        self.logins = 0
+        self.alert_settings = {
+            (AlertType.LEAK.value, AlertChannel.EMAIL.value),
+            (AlertType.LEAK.value, AlertChannel.SMS.value),
+        }
+
+        self._random = random.Random(seed)
+        self._tokens: set[str] = set()
+        self._server: TestServer | None = None
+
+    @property
+    def url(self) -> str:
+        return str(self._server.make_url("")).rstrip("/")
+
+    @property
+    def meter_ids(self) -> list[str]:
+        return [
+            str(FAKE_FIRST_METER_COUNT + index) for index in range(self.meters)
+        ]
+
+    def count_requests(self, path_fragment: str = "", method: str = "GET") -> int:
+        return len(
+            [
+                path
+                for request_method, path in self.requests
+                if request_method == method and path_fragment in path
+            ]
+        )
+
+    def expire_tokens(self):
+        """Invalidate all issued tokens, next authenticated call gets HTTP 401."""
+        self._tokens.clear()
+
+    async def start(self):
+        self._server = TestServer(self._create_app())
+
+        await self._server.start_server()
+
+    async def stop(self):
+        if self._server is not None:
+            await self._server.close()
+
+            self._server = None
+
+    @staticmethod
+    def get_consumption(meter_id: str, day: date) -> float:
+        value = (int(meter_id) % 7 + day.toordinal() % 5) / 10
+
+        return round(value, 3)
+
+    def get_last_read(self, meter_id: str) -> float:
+        value = 100 + int(meter_id) % 100 + date.today().toordinal() % 10
+
+        return float(value)
+
+    def _create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+
+        app.router.add_post("/consumer/login", self._login)
+        app.router.add_get("/consumer/me", self._me)
+        app.router.add_get("/consumer/meters", self._meters)
+        app.router.add_get(
+            "/municipals/municipalCustomerService", self._customer_service
+        )
+        app.router.add_get("/consumption/last-read", self._last_read)
+        app.router.add_get("/consumer/vacations", self._empty_list)
+        app.router.add_get("/consumer/myalerts", self._empty_list)
+        app.router.add_get("/consumer/myalerts/settings", self._settings)
+        app.router.add_put(
+            "/consumer/myalerts/settings/{alert_type}", self._enable_alert
+        )
+        app.router.add_delete(
+            "/consumer/myalerts/settings/{alert_type}", self._disable_alert
+        )
+        app.router.add_get(
+            "/municipality/{municipality_id}/messages", self._empty_list
+        )
+        app.router.add_get(
+            "/consumption/daily/{meter_id}/{from_date}/{to_date}", self._daily
+        )
+        app.router.add_get(
+            "/v1.1/consumption/monthly/{meter_id}/{from_date}/{to_date}",
+            self._monthly,
+        )
+        app.router.add_get("/consumption/forecast/{meter_id}", self._forecast)
+
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests.append((request.method, request.path))
+
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        if self.timeout_rate > 0 and self._random.random() < self.timeout_rate:
+            await asyncio.sleep(self.timeout_delay)
+
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            headers = (
+                None
+                if self.retry_after is None
+                else {hdrs.RETRY_AFTER: str(self.retry_after)}
+            )
+
+            return web.json_response(
+                {"error": "injected"}, status=self.error_status, headers=headers
+            )
+
+        is_login = request.path == "/consumer/login"
+
+        if not is_login and request.headers.get(API_HEADER_TOKEN) not in self._tokens:
+            return web.json_response({"error": "Unauthorized"}, status=401)
+
+        response = await handler(request)
+
+        return response
+
+    async def _login(self, request: web.Request):
+        data = await request.json()
+
+        if (
+            data.get(LOGIN_EMAIL) != FAKE_EMAIL
+            or data.get(LOGIN_PASSWORD) != FAKE_PASSWORD
+        ):
+            payload = {
+                API_DATA_ERROR_CODE: ERROR_REASON_INVALID_CREDENTIALS,
+                API_DATA_ERROR_REASON: "Invalid credentials",
+            }
+
+            return web.json_response(payload, status=401)
+
+        self.logins += 1
+
+        token = f"token-{self.logins}"
+        self._tokens.add(token)
+
+        return web.json_response({API_DATA_TOKEN: token})
+
+    async def _me(self, _request: web.Request):
+        payload = {
+            ME_FIRST_NAME: "Israel",
+            ME_LAST_NAME: "Israeli",
+            ME_ACCOUNT_NUMBER: str(FAKE_ACCOUNT_NUMBER),
+            ME_MUNICIPAL_ID: FAKE_MUNICIPAL_ID,
+        }
+
+        return web.json_response(payload)
+
+    async def _meters(self, _request: web.Request):
+        payload = [
+            {
+                METER_COUNT: int(meter_id),
+                METER_SERIAL_NUMBER: f"SN{meter_id}",
+                METER_FULL_ADDRESS: f"Street {meter_id}",
+            }
+            for meter_id in self.meter_ids
+        ]
+
+        return web.json_response(payload)
+
+    async def _customer_service(self, _request: web.Request):
+        payload = {
+            CUSTOMER_SERVICE_PHONE_NUMBER: "*1234",
+            CUSTOMER_SERVICE_DESCRIPTION: "Water Corp",
+            CUSTOMER_SERVICE_PHONE_MUNICIPAL_ID: FAKE_MUNICIPAL_ID,
+            CUSTOMER_SERVICE_EMAIL: "service@example.com",
+        }
+
+        return web.json_response(payload)
+
+    async def _last_read(self, _request: web.Request):
+        payload = [
+            {
+                LAST_READ_METER_COUNT: int(meter_id),
+                LAST_READ_VALUE: self.get_last_read(meter_id),
+            }
+            for meter_id in self.meter_ids
+        ]
+
+        return web.json_response(payload)
+
+    async def _empty_list(self, _request: web.Request):
+        return web.json_response([])
+
+    async def _settings(self, _request: web.Request):
+        payload = [
+            {SETTINGS_ALERT_TYPE_ID: alert_type, SETTINGS_MEDIA_TYPE_ID: media_type}
+            for alert_type, media_type in sorted(self.alert_settings)
+        ]
+
+        return web.json_response(payload)
+
+    async def _enable_alert(self, request: web.Request):
+        alert_type = int(request.match_info["alert_type"])
+
+        for media_type in await request.json():
+            self.alert_settings.add((alert_type, media_type))
+
+        return web.json_response({})
+
+    async def _disable_alert(self, request: web.Request):
+        alert_type = int(request.match_info["alert_type"])
+
+        for media_type in await request.json():
+            self.alert_settings.discard((alert_type, media_type))
+
+        return web.json_response({})
+
+    async def _daily(self, request: web.Request):
+        meter_id = request.match_info["meter_id"]
+        from_date = self._parse_date(request.match_info["from_date"])
+        to_date = self._parse_date(request.match_info["to_date"])
+
+        if self.history_days > 0:
+            history_start = to_date - timedelta(days=self.history_days - 1)
+            from_date = min(from_date, history_start)
+
+        payload = []
+        day = from_date
+
+        if self.data_until is not None:
+            to_date = min(to_date, self.data_until)
+
+        while day <= to_date:
+            payload.append(
+                {
+                    CONSUMPTION_METER_COUNT: int(meter_id),
+                    CONSUMPTION_DATE: f"{day.strftime(FORMAT_DATE_ISO)}T00:00:00",
+                    CONSUMPTION_VALUE: self.get_consumption(meter_id, day),
+                }
+            )
+
+            day += timedelta(days=1)
+
+        return web.json_response(payload)
+
+    async def _monthly(self, request: web.Request):
+        meter_id = request.match_info["meter_id"]
+        from_date = self._parse_date(request.match_info["from_date"])
+        to_date = self._parse_date(request.match_info["to_date"])
+
+        items = []
+        month = from_date.replace(day=1)
+
+        while month <= to_date:
+            next_month = (month + timedelta(days=32)).replace(day=1)
+            last_day = min(next_month - timedelta(days=1), date.today())
+
+            value = sum(
+                self.get_consumption(meter_id, month + timedelta(days=offset))
+                for offset in range((last_day - month).days + 1)
+            )
+
+            items.append(
+                {
+                    CONSUMPTION_METER_COUNT: int(meter_id),
+                    CONSUMPTION_DATE: month.strftime("%Y-%m"),
+                    CONSUMPTION_VALUE: round(value, 3),
+                }
+            )
+
+            month = next_month
+
+        return web.json_response({CONSUMPTION_DATA: items})
+
+    async def _forecast(self, request: web.Request):
+        meter_id = request.match_info["meter_id"]
+
+        payload = {CONSUMPTION_FORECAST_ESTIMATED_CONSUMPTION: int(meter_id) % 10 + 5}
+
+        return web.json_response(payload)
+
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        if len(value) == 7:
+            value = f"{value}-01"
+
+        return datetime.strptime(value, FORMAT_DATE_ISO).date()
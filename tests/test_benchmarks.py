@@ -0,0 +1,249 @@
+"""Refresh pipeline benchmarks against the local fake portal API.
+
+Skipped by default, run with:
+
+    pytest tests/test_benchmarks.py --run-benchmarks [--benchmark-results-file=x.json]
+
+Each stage is timed (wall and CPU) over a few iterations, peak memory is traced
+in one additional iteration so tracing overhead does not skew the timings.
+CPU time of RestAPI.update includes the fake server, it runs in the same process.
+"""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import inspect
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+from custom_components.citymind_water_meter.common.consts import DOMAIN
+from custom_components.citymind_water_meter.common.entity_descriptions import (
+    ENTITY_DESCRIPTIONS,
+)
+from custom_components.citymind_water_meter.common.enums import EntityType
+from custom_components.citymind_water_meter.data_processors.account_processor import (
+    AccountProcessor,
+)
+from custom_components.citymind_water_meter.data_processors.meter_processor import (
+    MeterProcessor,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from .common import setup_integration, teardown_integration
+
+pytestmark = pytest.mark.perf
+
+METER_COUNTS = [1, 10, 100, 1000]
+HISTORY_DAYS = [2, 31, 365]
+ITERATIONS = 3
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    return True
+
+
+async def measure(
+    func: Callable[[], Awaitable | None],
+    iterations: int = ITERATIONS,
+    before: Callable[[], None] | None = None,
+) -> dict:
+    async def _run():
+        if before is not None:
+            before()
+
+        result = func()
+
+        if inspect.isawaitable(result):
+            await result
+
+    wall_times = []
+    cpu_times = []
+
+    for _ in range(iterations):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        await _run()
+
+        cpu_times.append(time.process_time() - cpu_start)
+        wall_times.append(time.perf_counter() - wall_start)
+
+    tracemalloc.start()
+
+    try:
+        await _run()
+
+        _current, memory_peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    result = {
+        "iterations": iterations,
+        "wall_mean": statistics.mean(wall_times),
+        "wall_min": min(wall_times),
+        "wall_max": max(wall_times),
+        "cpu_mean": statistics.mean(cpu_times),
+        "memory_peak": memory_peak,
+    }
+
+    return result
+
+
+def add_result(results: list[dict], stage: str, meters: int, **kwargs):
+    result = {"stage": stage, "meters": meters}
+    result.update(kwargs)
+
+    results.append(result)
+
+
+@pytest.mark.parametrize("history_days", HISTORY_DAYS)
+@pytest.mark.parametrize("meters", METER_COUNTS)
+async def test_benchmark_api_and_processors(
+    meters: int,
+    history_days: int,
+    fake_api_factory,
+    api_factory,
+    config_manager,
+    benchmark_results,
+):
+    server = await fake_api_factory(meters=meters, history_days=history_days)
+    api = api_factory(server)
+
+    await api.initialize()
+
+    api_result = await measure(api.update, before=api.response_cache.invalidate)
+
+    add_result(
+        benchmark_results,
+        "RestAPI.update",
+        meters,
+        history_days=history_days,
+        requests=len(server.requests),
+        **api_result,
+    )
+
+    account_processor = AccountProcessor(config_manager)
+    meter_processor = MeterProcessor(config_manager)
+
+    for stage, processor in [
+        ("AccountProcessor._process_api_data", account_processor),
+        ("MeterProcessor._process_api_data", meter_processor),
+    ]:
+        processor_result = await measure(lambda: processor.update(api.data))
+
+        add_result(
+            benchmark_results,
+            stage,
+            meters,
+            history_days=history_days,
+            **processor_result,
+        )
+
+    incremental_result = await measure(
+        lambda: meter_processor.update(api.data, api.revisions)
+    )
+
+    add_result(
+        benchmark_results,
+        "MeterProcessor.update (unchanged sections)",
+        meters,
+        history_days=history_days,
+        **incremental_result,
+    )
+
+    assert len(meter_processor.get_meters()) == meters
+
+
+@pytest.mark.parametrize("meters", METER_COUNTS)
+async def test_benchmark_coordinator_and_entities(
+    meters: int,
+    recorder_mock,
+    hass: HomeAssistant,
+    enable_custom_integrations,
+    fake_api_factory,
+    benchmark_results,
+):
+    server = await fake_api_factory(meters=meters)
+
+    setup_start = time.perf_counter()
+
+    coordinator = await setup_integration(hass, server)
+
+    add_result(
+        benchmark_results,
+        "integration setup",
+        meters,
+        wall_mean=time.perf_counter() - setup_start,
+    )
+
+    items = [
+        (entity_description, meter_id)
+        for entity_description in ENTITY_DESCRIPTIONS
+        if entity_description.entity_type == EntityType.METER
+        for meter_id in server.meter_ids
+    ] + [
+        (entity_description, None)
+        for entity_description in ENTITY_DESCRIPTIONS
+        if entity_description.entity_type == EntityType.ACCOUNT
+    ]
+
+    def _get_all_data():
+        for entity_description, item_id in items:
+            coordinator.get_data(entity_description, item_id)
+
+    get_data_result = await measure(_get_all_data)
+
+    add_result(
+        benchmark_results,
+        "Coordinator.get_data",
+        meters,
+        calls=len(items),
+        **get_data_result,
+    )
+
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+
+    def _reset_entities():
+        for entity in entities:
+            entity._data = {}
+
+    def _update_entities():
+        for entity in entities:
+            entity._handle_coordinator_update()
+
+    def _load_entities():
+        for entity in entities:
+            entity._load_coordinator_data()
+
+    unchanged_result = await measure(_update_entities)
+    changed_result = await measure(_load_entities, before=_reset_entities)
+
+    add_result(
+        benchmark_results,
+        "IntegrationBaseEntity._handle_coordinator_update",
+        meters,
+        entities=len(entities),
+        **unchanged_result,
+    )
+    add_result(
+        benchmark_results,
+        "IntegrationBaseEntity._load_coordinator_data",
+        meters,
+        entities=len(entities),
+        **changed_result,
+    )
+
+    enabled_items = [item for item in items if item[0].entity_registry_enabled_default]
+
+    assert len(entities) >= len(enabled_items)
+
+    await teardown_integration(hass, coordinator)
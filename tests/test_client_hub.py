@@ -0,0 +1,73 @@
+"""ClientHub tests, shared session, budget and staggering across entries."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.citymind_water_meter.common.consts import (
+    DATA_CLIENT_HUB,
+    DOMAIN,
+    HUB_MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.citymind_water_meter.managers.client_hub import ClientHub
+from homeassistant.core import HomeAssistant
+
+from .common import setup_integration, teardown_integration
+
+STAGGER = timedelta(seconds=15)
+INTERVAL = timedelta(minutes=10)
+NOW = datetime(2024, 1, 1, 12)
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Coordinator refresh and delayed store writes are scheduled on purpose."""
+    return True
+
+
+def test_stagger_spreads_refresh_times():
+    client_hub = ClientHub(stagger=STAGGER)
+
+    assert client_hub.stagger("first", INTERVAL, NOW) == INTERVAL
+    assert client_hub.stagger("second", INTERVAL, NOW) == INTERVAL + STAGGER
+    assert (
+        client_hub.stagger("third", INTERVAL + timedelta(seconds=5), NOW)
+        == INTERVAL + STAGGER * 2
+    )
+
+    # Rescheduling an entry ignores its own previous refresh time
+    assert client_hub.stagger("first", INTERVAL, NOW) == INTERVAL
+
+
+async def test_entries_share_session_and_budget(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    first_server = await fake_api_factory(meters=10, latency=0.01)
+    second_server = await fake_api_factory(meters=10, latency=0.01)
+
+    first = await setup_integration(hass, first_server)
+    second = await setup_integration(hass, second_server)
+
+    client_hub: ClientHub = hass.data[DOMAIN][DATA_CLIENT_HUB]
+
+    assert client_hub.clients == 2
+    assert first.api.connection_stats is second.api.connection_stats
+    assert first.update_interval != second.update_interval
+
+    await first.async_refresh()
+    await second.async_refresh()
+
+    assert 0 < client_hub.peak_in_flight <= HUB_MAX_CONCURRENT_REQUESTS
+
+    await teardown_integration(hass, first)
+
+    assert client_hub.clients == 1
+
+    await second.async_refresh()
+
+    assert second.last_update_success
+
+    await teardown_integration(hass, second)
+
+    assert client_hub.clients == 0
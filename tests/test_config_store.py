@@ -0,0 +1,26 @@
+"""ConfigStore tests, delayed writes of the shared configuration file."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.citymind_water_meter.managers.config_store import ConfigStore
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+
+async def test_delayed_write_is_not_changed_by_later_changes(hass: HomeAssistant):
+    config_store = ConfigStore.get_instance(hass)
+
+    data = await config_store.async_load()
+    data["entry"] = {"value": 1}
+
+    with patch.object(Store, "async_delay_save") as async_delay_save:
+        config_store.async_delay_save()
+
+    data_func = async_delay_save.call_args.args[0]
+    written_data = data_func()
+
+    data["entry"]["value"] = 2
+
+    assert written_data == {"entry": {"value": 1}}
+    assert not config_store.is_pending
@@ -0,0 +1,498 @@
+"""Coordinator tests, integration set up in Home Assistant against the fake API."""
+from __future__ import annotations
+
+from datetime import timedelta
+import os
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.citymind_water_meter.common.connectivity_status import (
+    ConnectivityStatus,
+)
+from custom_components.citymind_water_meter.common.consts import (
+    BACKFILL_FILE,
+    CONFIGURATION_FILE,
+    DOMAIN,
+    SERVICE_ATTR_METER_IDS,
+    SERVICE_ATTR_TOP,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_SET_TARIFFS,
+    SNAPSHOT_FILE,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_DATA_MAX_UPDATE_INTERVAL,
+    STORAGE_DATA_METER_HIGH_RATE_COST,
+    STORAGE_DATA_METER_SEWAGE_COST,
+    STORAGE_DATA_METER_TIERS,
+    STORAGE_DATA_METER_VAT,
+    STORAGE_DATA_METERS,
+    TARIFF_TIER_COST,
+    TARIFF_TIER_LIMIT,
+)
+from custom_components.citymind_water_meter.common.entity_descriptions import (
+    ENTITY_DESCRIPTIONS,
+)
+from custom_components.citymind_water_meter.common.enums import EntityKeys, EntityType
+from custom_components.citymind_water_meter.managers.config_store import ConfigStore
+from homeassistant.components.number import ATTR_VALUE, SERVICE_SET_VALUE
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+    Platform,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import REQUEST_REFRESH_DEFAULT_COOLDOWN
+import homeassistant.util.dt as dt_util
+
+from .common import (
+    get_entity_id,
+    restart_integration,
+    setup_integration,
+    teardown_integration,
+)
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Coordinator refresh and delayed store writes are scheduled on purpose."""
+    return True
+
+
+async def test_setup_creates_meters(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=2)
+
+    coordinator = await setup_integration(hass, server)
+
+    assert coordinator.config_manager.entry.state == ConfigEntryState.LOADED
+    assert coordinator.api.status == ConnectivityStatus.Connected
+    assert coordinator.account is not None
+
+    for meter_id in server.meter_ids:
+        meter_description = next(
+            entity_description
+            for entity_description in ENTITY_DESCRIPTIONS
+            if entity_description.key == EntityKeys.LAST_READ
+        )
+
+        data = coordinator.get_data(meter_description, meter_id)
+
+        assert data["state"] == server.get_last_read(meter_id)
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_get_data_for_every_entity(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    meter_id = server.meter_ids[0]
+
+    for entity_description in ENTITY_DESCRIPTIONS:
+        item_id = (
+            meter_id if entity_description.entity_type == EntityType.METER else None
+        )
+
+        data = coordinator.get_data(entity_description, item_id)
+
+        assert data is not None, entity_description.key
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_entities_have_states(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+
+    states = hass.states.async_all()
+    last_read_states = [
+        state for state in states if state.entity_id.endswith("_last_read")
+    ]
+
+    assert len(last_read_states) == 1
+    assert float(last_read_states[0].state) == server.get_last_read(
+        server.meter_ids[0]
+    )
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_api_token_reused_after_restart(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+
+    assert server.logins == 1
+
+    coordinator = await restart_integration(hass, server, coordinator)
+
+    assert coordinator.api.status == ConnectivityStatus.Connected
+    assert server.logins == 1
+
+    await teardown_integration(hass, coordinator)
+
+
+@pytest.mark.parametrize("expected_lingering_tasks", [True])
+async def test_snapshot_restored_after_restart(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+    meter_id = server.meter_ids[0]
+
+    coordinator = await setup_integration(hass, server)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    server.error_rate = 1
+
+    coordinator = await restart_integration(hass, server, coordinator)
+
+    meter_description = next(
+        entity_description
+        for entity_description in ENTITY_DESCRIPTIONS
+        if entity_description.key == EntityKeys.LAST_READ
+    )
+
+    data = coordinator.get_data(meter_description, meter_id)
+
+    assert coordinator.account is not None
+    assert data["state"] == server.get_last_read(meter_id)
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_remove_entry_removes_stored_data(
+    recorder_mock,
+    hass: HomeAssistant,
+    hass_storage,
+    enable_custom_integrations,
+    fake_api_factory,
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    entry_id = coordinator.config_manager.entry_id
+    config_store = ConfigStore.get_instance(hass)
+    snapshot_key = SNAPSHOT_FILE.format(entry_id=entry_id)
+    backfill_key = BACKFILL_FILE.format(entry_id=entry_id)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert snapshot_key in hass_storage
+    assert backfill_key in hass_storage
+    assert entry_id in await config_store.async_load()
+
+    assert await hass.config_entries.async_remove(entry_id)
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY * 2)
+    )
+    await hass.async_block_till_done()
+
+    assert snapshot_key not in hass_storage
+    assert backfill_key not in hass_storage
+    assert entry_id not in await config_store.async_load()
+    assert entry_id not in hass_storage[CONFIGURATION_FILE]["data"]
+
+
+async def test_refresh_publishes_snapshot(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=2)
+
+    coordinator = await setup_integration(hass, server)
+
+    data = coordinator.data
+
+    assert list(data.meters.keys()) == server.meter_ids
+    assert data.is_changed(EntityType.ACCOUNT)
+    assert data.is_changed(EntityType.METER, server.meter_ids[0])
+
+    assert server.count_requests("/consumption/last-read") == 1
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data is not data
+    assert coordinator.data.changed_items == set()
+    assert server.count_requests("/consumption/last-read") == 2
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_profile_refresh_service(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    requests = server.count_requests()
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        {SERVICE_ATTR_TOP: 5},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["entry_id"] == coordinator.config_manager.entry_id
+    assert result["profiler"] == "cProfile"
+    assert os.path.isfile(result["stats_file"])
+    assert len(result["top"]) == 5
+    assert set(result["categories"]) == {
+        "network_wait",
+        "json_decode",
+        "processors",
+        "entity_state_writes",
+    }
+    assert result["categories"]["processors"] > 0
+    assert server.count_requests() > requests
+
+    os.remove(result["stats_file"])
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_configuration_changes_are_written_once(
+    recorder_mock,
+    hass: HomeAssistant,
+    hass_storage,
+    enable_custom_integrations,
+    fake_api_factory,
+):
+    server = await fake_api_factory(meters=2)
+
+    coordinator = await setup_integration(hass, server)
+    config_manager = coordinator.config_manager
+    config_store = ConfigStore.get_instance(hass)
+    entry_id = config_manager.entry_id
+
+    await config_store.async_flush()
+
+    with patch.object(
+        ConfigStore, "_get_data", autospec=True, side_effect=ConfigStore._get_data
+    ) as get_data:
+        for meter_id in server.meter_ids:
+            await config_manager.set_low_rate_cost(meter_id, 5)
+            await config_manager.set_high_rate_cost(meter_id, 8)
+
+        await config_manager.set_max_update_interval(30)
+
+        assert config_store.is_pending
+        assert get_data.call_count == 0
+
+        await teardown_integration(hass, coordinator)
+
+        assert not config_store.is_pending
+        assert get_data.call_count == 1
+
+    stored_data = hass_storage[CONFIGURATION_FILE]["data"][entry_id]
+
+    assert stored_data[STORAGE_DATA_MAX_UPDATE_INTERVAL] == 30
+
+    for meter_id in server.meter_ids:
+        meter_config = stored_data[STORAGE_DATA_METERS][meter_id]
+
+        assert meter_config[STORAGE_DATA_METER_HIGH_RATE_COST] == 8
+
+
+async def test_set_tariffs_service(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=3)
+
+    coordinator = await setup_integration(hass, server)
+    meter_ids = server.meter_ids[:2]
+    other_meter_id = server.meter_ids[2]
+    requests = server.count_requests()
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_TARIFFS,
+        {
+            SERVICE_ATTR_METER_IDS: meter_ids,
+            STORAGE_DATA_METER_HIGH_RATE_COST: 20,
+            STORAGE_DATA_METER_SEWAGE_COST: 2.5,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["meters"] == meter_ids
+    assert server.count_requests() == requests
+
+    for meter_id in meter_ids:
+        meter = coordinator.data.meters[meter_id]
+
+        assert meter.high_rate_cost == 20
+        assert meter.sewage_cost == 2.5
+        assert coordinator.data.is_changed(EntityType.METER, meter_id)
+
+    assert coordinator.data.meters[other_meter_id].sewage_cost == 0
+    assert not coordinator.data.is_changed(EntityType.METER, other_meter_id)
+
+    sewage_total_costs = [
+        float(state.state)
+        for state in hass.states.async_all("sensor")
+        if state.entity_id.endswith("_sewage_cost")
+    ]
+    expected_sewage_total_costs = [0] + [
+        coordinator.data.meters[meter_id].monthly_consumption * 2.5
+        for meter_id in meter_ids
+    ]
+
+    assert sorted(sewage_total_costs) == pytest.approx(
+        sorted(expected_sewage_total_costs)
+    )
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_tariff_change_is_applied_locally(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=2)
+
+    coordinator = await setup_integration(hass, server)
+    meter_id, other_meter_id = server.meter_ids
+
+    # Refresh requested during setup runs after the cooldown
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=REQUEST_REFRESH_DEFAULT_COOLDOWN + 1)
+    )
+    await hass.async_block_till_done()
+
+    requests = server.count_requests()
+
+    entity_id = get_entity_id(
+        hass, Platform.NUMBER, EntityKeys.HIGH_RATE_COST, meter_id
+    )
+
+    await hass.services.async_call(
+        Platform.NUMBER,
+        SERVICE_SET_VALUE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: 18},
+        blocking=True,
+    )
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=REQUEST_REFRESH_DEFAULT_COOLDOWN * 3),
+    )
+    await hass.async_block_till_done()
+
+    meter = coordinator.data.meters[meter_id]
+
+    assert server.count_requests() == requests
+    assert float(hass.states.get(entity_id).state) == 18
+    assert meter.high_rate_cost == 18
+    assert coordinator.data.changed_items == {(EntityType.METER, meter_id)}
+    assert coordinator.config_manager.get_high_rate_cost(meter_id) == 18
+    assert coordinator.config_manager.get_high_rate_cost(other_meter_id) == 0
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_update_interval_change_is_applied_locally(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    revision = coordinator.config_manager.revision
+    entity_id = get_entity_id(hass, Platform.NUMBER, EntityKeys.MAX_UPDATE_INTERVAL)
+
+    await hass.services.async_call(
+        Platform.NUMBER,
+        SERVICE_SET_VALUE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: 120},
+        blocking=True,
+    )
+
+    assert float(hass.states.get(entity_id).state) == 120
+    assert coordinator.config_manager.max_update_interval == timedelta(minutes=120)
+    assert coordinator.config_manager.revision == revision
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_request_metrics_switch_is_turned_on(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    entity_id = get_entity_id(hass, Platform.SWITCH, EntityKeys.REQUEST_METRICS)
+
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    await hass.services.async_call(
+        Platform.SWITCH, SERVICE_TURN_ON, {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+
+    assert coordinator.api.request_metrics.is_enabled
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    await coordinator.async_refresh()
+
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_set_tiers_service_updates_monthly_cost(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    meter_id = server.meter_ids[0]
+    monthly_consumption = coordinator.data.meters[meter_id].monthly_consumption
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_TARIFFS,
+        {
+            STORAGE_DATA_METER_TIERS: [
+                {TARIFF_TIER_LIMIT: 1, TARIFF_TIER_COST: 5},
+                {TARIFF_TIER_COST: 10},
+            ],
+            STORAGE_DATA_METER_VAT: 10,
+        },
+        blocking=True,
+    )
+
+    costs = coordinator.data.costs[meter_id]
+    expected_total_cost = (
+        min(monthly_consumption, 1) * 5 + max(monthly_consumption - 1, 0) * 10
+    ) * 1.1
+
+    monthly_cost_states = [
+        float(state.state)
+        for state in hass.states.async_all("sensor")
+        if state.entity_id.endswith("_monthly_cost")
+    ]
+
+    assert costs.total_cost == pytest.approx(expected_total_cost)
+    assert monthly_cost_states == pytest.approx([expected_total_cost])
+
+    await teardown_integration(hass, coordinator)
@@ -0,0 +1,55 @@
+"""PasswordManager tests, shared key, single load and key migration."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from cryptography.fernet import Fernet
+
+from custom_components.citymind_water_meter.common.consts import (
+    CONFIGURATION_FILE,
+    STORAGE_DATA_KEY,
+)
+from custom_components.citymind_water_meter.managers.config_store import ConfigStore
+from custom_components.citymind_water_meter.managers.password_manager import (
+    PasswordManager,
+)
+from homeassistant.config_entries import STORAGE_VERSION
+from homeassistant.core import HomeAssistant
+
+
+async def test_key_is_created_once(hass: HomeAssistant, hass_storage):
+    with patch.object(
+        ConfigStore, "async_save", autospec=True, side_effect=ConfigStore.async_save
+    ) as async_save, patch(
+        "custom_components.citymind_water_meter.managers.password_manager.Fernet",
+        wraps=Fernet,
+    ) as fernet:
+        encrypted = await PasswordManager.encrypt_value(hass, "secret")
+
+        for entry_id in ["", "entry_1", "entry_2"]:
+            decrypted = await PasswordManager.decrypt_value(hass, encrypted, entry_id)
+
+            assert decrypted == "secret"
+
+    assert async_save.call_count == 1
+    assert fernet.call_count == 1
+    assert STORAGE_DATA_KEY in hass_storage[CONFIGURATION_FILE]["data"]
+
+
+async def test_key_of_entry_is_migrated(hass: HomeAssistant, hass_storage):
+    key = Fernet.generate_key().decode("utf-8")
+    encrypted = Fernet(key.encode()).encrypt(b"secret").decode()
+
+    hass_storage[CONFIGURATION_FILE] = {
+        "version": STORAGE_VERSION,
+        "key": CONFIGURATION_FILE,
+        "data": {"entry": {STORAGE_DATA_KEY: key}},
+    }
+
+    decrypted = await PasswordManager.decrypt_value(hass, encrypted, "entry")
+
+    stored_data = hass_storage[CONFIGURATION_FILE]["data"]
+
+    assert decrypted == "secret"
+    assert stored_data[STORAGE_DATA_KEY] == key
+    assert STORAGE_DATA_KEY not in stored_data["entry"]
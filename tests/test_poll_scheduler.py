@@ -0,0 +1,97 @@
+"""PollScheduler tests with a simulated meter read cadence."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from custom_components.citymind_water_meter.managers.poll_scheduler import PollScheduler
+
+FLOOR = timedelta(minutes=5)
+CEILING = timedelta(hours=3)
+DEFAULT = timedelta(minutes=10)
+CADENCE = timedelta(hours=1)
+
+
+def simulate(start: datetime, duration: timedelta, adaptive: bool):
+    """Meter reads every CADENCE, returns polls and worst detection delay.
+
+    Delay is measured once the cadence could have been learned (after 6 reads).
+    """
+    scheduler = PollScheduler()
+    now = start
+    polls = 0
+    seen_reads = 0
+    worst_delay = timedelta()
+
+    while now < start + duration:
+        polls += 1
+
+        reads = int((now - start) / CADENCE)
+
+        if reads != seen_reads and reads > 6:
+            worst_delay = max(worst_delay, now - (start + reads * CADENCE))
+
+        seen_reads = reads
+
+        scheduler.update(reads + 1, now)
+
+        if adaptive:
+            now += scheduler.get_interval(now, FLOOR, CEILING, DEFAULT)
+
+        else:
+            now += DEFAULT
+
+    return polls, worst_delay, scheduler
+
+
+def test_default_interval_until_cadence_learned():
+    scheduler = PollScheduler()
+    now = datetime(2024, 1, 1)
+
+    scheduler.update(1, now)
+
+    assert scheduler.cadence is None
+    assert scheduler.get_interval(now, FLOOR, CEILING, DEFAULT) == DEFAULT
+
+
+def test_cadence_learned_from_changes():
+    scheduler = PollScheduler()
+    now = datetime(2024, 1, 1)
+
+    for index in range(4):
+        scheduler.update(index, now + index * CADENCE)
+
+    assert scheduler.cadence == CADENCE
+    assert scheduler.expected_read == now + 4 * CADENCE
+
+
+def test_interval_is_clamped():
+    scheduler = PollScheduler()
+    now = datetime(2024, 1, 1)
+    cadence = timedelta(days=1)
+
+    for index in range(3):
+        scheduler.update(index, now + index * cadence)
+
+    last_change = now + 2 * cadence
+
+    assert scheduler.get_interval(last_change, FLOOR, CEILING, DEFAULT) == CEILING
+
+    expected_read = scheduler.expected_read
+
+    assert scheduler.get_interval(expected_read, FLOOR, CEILING, DEFAULT) == FLOOR
+
+    overdue = expected_read + timedelta(hours=20)
+
+    assert scheduler.get_interval(overdue, FLOOR, CEILING, DEFAULT) == CEILING
+
+
+def test_adaptive_polling_uses_fewer_requests():
+    start = datetime(2024, 1, 1)
+    duration = timedelta(days=1)
+
+    fixed_polls, _fixed_delay, _ = simulate(start, duration, False)
+    adaptive_polls, adaptive_delay, scheduler = simulate(start, duration, True)
+
+    assert scheduler.cadence is not None
+    assert adaptive_polls < fixed_polls / 2
+    assert adaptive_delay <= FLOOR
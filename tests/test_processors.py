@@ -0,0 +1,142 @@
+"""Processor tests against data fetched from the local fake portal API."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from custom_components.citymind_water_meter.common.enums import EntityKeys
+from custom_components.citymind_water_meter.data_processors.account_processor import (
+    AccountProcessor,
+)
+from custom_components.citymind_water_meter.data_processors.meter_processor import (
+    MeterProcessor,
+)
+
+from .fake_api import FAKE_ACCOUNT_NUMBER, FAKE_MUNICIPAL_ID, FakeReadYourMeterServer
+
+
+async def test_account_processor(api, config_manager):
+    await api.update()
+
+    processor = AccountProcessor(config_manager)
+    processor.update(api.data)
+
+    account = processor.get()
+
+    assert account.account_number == FAKE_ACCOUNT_NUMBER
+    assert account.municipal_id == FAKE_MUNICIPAL_ID
+    assert account.alerts == 0
+    assert account.alert_settings[EntityKeys.ALERT_LEAK_SMS] is True
+    assert account.alert_settings[EntityKeys.ALERT_LEAK_EMAIL] is True
+    assert account.alert_settings[EntityKeys.ALERT_EXCEEDED_THRESHOLD_SMS] is False
+
+    device_info = processor.get_device_info()
+
+    assert device_info["name"] == account.unique_name
+
+
+async def test_meter_processor(api, fake_api, config_manager):
+    await api.update()
+
+    processor = MeterProcessor(config_manager)
+    processor.update(api.data)
+
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+
+    assert processor.get_meters() == fake_api.meter_ids
+
+    for meter_id in fake_api.meter_ids:
+        meter = processor.get_data(meter_id)
+
+        assert meter.last_read == fake_api.get_last_read(meter_id)
+        assert meter.today_consumption == FakeReadYourMeterServer.get_consumption(
+            meter_id, today
+        )
+        assert meter.yesterday_consumption == (
+            FakeReadYourMeterServer.get_consumption(meter_id, yesterday)
+        )
+        assert meter.monthly_consumption is not None
+        assert meter.consumption_forecast == int(meter_id) % 10 + 5
+
+
+async def test_meter_processor_device_lookup(api, fake_api, config_manager):
+    await api.update()
+
+    processor = MeterProcessor(config_manager)
+    processor.update(api.data)
+
+    for meter_id in fake_api.meter_ids:
+        device_info = processor.get_device_info(meter_id)
+        meter = processor.get_meter(device_info["identifiers"])
+
+        assert meter["meter_id"] == meter_id
+
+
+async def test_meter_processor_long_history(
+    api_factory, fake_api_factory, config_manager
+):
+    server = await fake_api_factory(meters=2, history_days=365)
+    api = api_factory(server)
+
+    await api.initialize()
+    await api.update()
+
+    processor = MeterProcessor(config_manager)
+    processor.update(api.data)
+
+    today = date.today()
+
+    for meter_id in server.meter_ids:
+        meter = processor.get_data(meter_id)
+
+        assert meter.today_consumption == FakeReadYourMeterServer.get_consumption(
+            meter_id, today
+        )
+
+
+async def test_meter_processor_device_index_follows_naming(
+    api, fake_api, config_manager
+):
+    await api.update()
+
+    processor = MeterProcessor(config_manager)
+    processor.update(api.data)
+
+    meter_id = fake_api.meter_ids[0]
+    unique_name = processor.get_device_info(meter_id)["name"]
+
+    await config_manager.set_use_unique_device_names(False)
+
+    device_info = processor.get_device_info(meter_id)
+
+    assert unique_name == processor.get_data(meter_id).unique_name
+    assert device_info["name"] != unique_name
+    assert processor.get_meter(device_info["identifiers"])["meter_id"] == meter_id
+
+
+async def test_meter_processor_skips_unchanged_sections(api, fake_api, config_manager):
+    await api.update()
+
+    processor = MeterProcessor(config_manager)
+    processor.update(api.data, api.revisions)
+
+    assert processor.changed_items == set(fake_api.meter_ids)
+
+    await api.update()
+    processor.update(api.data, api.revisions)
+
+    assert processor.changed_items == set()
+
+    meter_id = fake_api.meter_ids[0]
+
+    await config_manager.set_sewage_cost(meter_id, 10)
+    processor.reload_meter_config([meter_id])
+    processor.update(api.data, api.revisions)
+
+    assert processor.changed_items == set()
+    assert processor.get_data(meter_id).sewage_cost == 10
+
+    await config_manager.set_use_unique_device_names(False)
+    processor.update(api.data, api.revisions)
+
+    assert processor.changed_items == set(fake_api.meter_ids)
@@ -0,0 +1,85 @@
+"""RateLimiter token bucket and priority tests."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from custom_components.citymind_water_meter.common.consts import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.citymind_water_meter.common.enums import RequestPriority
+from custom_components.citymind_water_meter.managers.client_hub import ClientHub
+from custom_components.citymind_water_meter.managers.rate_limiter import RateLimiter
+
+
+async def test_burst_then_rate():
+    rate_limiter = RateLimiter(rate=50, burst=5)
+
+    started_at = time.perf_counter()
+
+    await asyncio.gather(*[rate_limiter.acquire() for _ in range(15)])
+
+    wait_stats = rate_limiter.to_dict()["wait"]["polling"]
+
+    assert time.perf_counter() - started_at >= 10 / 50 * 0.9
+    assert wait_stats["requests"] == 15
+    assert wait_stats["waited"] == 10
+    assert wait_stats["max_wait"] > 0
+
+
+async def test_user_writes_are_served_first():
+    rate_limiter = RateLimiter(rate=20, burst=1)
+    order = []
+
+    async def _acquire(name: str, priority: RequestPriority):
+        await rate_limiter.acquire(priority)
+
+        order.append(name)
+
+    await rate_limiter.acquire()
+
+    tasks = [
+        asyncio.create_task(_acquire(f"poll-{index}", RequestPriority.POLLING))
+        for index in range(3)
+    ]
+
+    await asyncio.sleep(0)
+
+    tasks.append(asyncio.create_task(_acquire("write", RequestPriority.USER_WRITE)))
+
+    await asyncio.gather(*tasks)
+
+    assert order == ["write", "poll-0", "poll-1", "poll-2"]
+
+
+async def test_cancelled_waiter_is_skipped():
+    rate_limiter = RateLimiter(rate=20, burst=1)
+
+    await rate_limiter.acquire()
+
+    cancelled = asyncio.create_task(rate_limiter.acquire())
+    waiting = asyncio.create_task(rate_limiter.acquire())
+
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, 1)
+
+    assert rate_limiter.queue_length == 0
+
+
+async def test_api_requests_are_rate_limited(api_factory, fake_api):
+    client_hub = ClientHub(DEFAULT_MAX_CONCURRENT_REQUESTS, rate=100, burst=2)
+    api = api_factory(fake_api, client_hub=client_hub)
+
+    await api.initialize()
+    await api.update()
+
+    rate_limiter_data = client_hub.to_dict()["rate_limiter"]
+
+    assert rate_limiter_data["wait"]["login"]["requests"] == 1
+    assert rate_limiter_data["wait"]["polling"]["requests"] == (
+        fake_api.count_requests()
+    )
+    assert rate_limiter_data["wait"]["polling"]["waited"] > 0
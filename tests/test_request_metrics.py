@@ -0,0 +1,70 @@
+"""Request metrics tests, aggregation and RestAPI instrumentation."""
+from __future__ import annotations
+
+from aiohttp.hdrs import METH_GET
+
+from custom_components.citymind_water_meter.common.consts import (
+    API_DATA_SECTION_CONSUMPTION_DAILY,
+    API_DATA_SECTION_LAST_READ,
+)
+from custom_components.citymind_water_meter.common.enums import EndpointClass
+from custom_components.citymind_water_meter.managers.request_metrics import (
+    RequestMetrics,
+)
+
+
+def test_histogram_and_counters():
+    request_metrics = RequestMetrics(True)
+
+    for _ in range(19):
+        request_metrics.record("section", METH_GET, 200, 100, 0.08)
+
+    request_metrics.record("section", METH_GET, None, None, 3)
+
+    endpoint_data = request_metrics.to_dict()["endpoints"]["section"]
+
+    assert endpoint_data["requests"] == 20
+    assert endpoint_data["errors"] == 1
+    assert endpoint_data["bytes"] == 1900
+    assert endpoint_data["statuses"] == {"200": 19, "none": 1}
+    assert endpoint_data["histogram"]["<=0.1"] == 19
+    assert endpoint_data["histogram"]["<=5"] == 1
+    assert request_metrics.p95_latency == 0.1
+    assert request_metrics.errors == 1
+
+
+def test_disabled_metrics_are_empty():
+    request_metrics = RequestMetrics(True)
+
+    request_metrics.record("section", METH_GET, 500, 10, 0.2)
+    request_metrics.record_refresh(1.5)
+    request_metrics.set_enabled(False)
+
+    assert request_metrics.errors is None
+    assert request_metrics.p95_latency is None
+    assert request_metrics.last_refresh_duration is None
+    assert request_metrics.to_dict()["endpoints"] == {}
+
+
+async def test_api_requests_are_recorded(api_factory, fake_api):
+    api = api_factory(fake_api)
+    api.request_metrics.set_enabled(True)
+
+    await api.initialize()
+    await api.update()
+
+    endpoints = api.request_metrics.to_dict()["endpoints"]
+    meters = len(fake_api.meter_ids)
+
+    assert endpoints[EndpointClass.LOGIN]["methods"] == {"POST": 1}
+    assert endpoints[API_DATA_SECTION_LAST_READ]["statuses"] == {"200": 1}
+    assert endpoints[API_DATA_SECTION_LAST_READ]["bytes"] > 0
+    assert endpoints[API_DATA_SECTION_CONSUMPTION_DAILY]["requests"] == meters
+    assert api.request_metrics.errors == 0
+    assert api.request_metrics.p95_latency is not None
+
+
+async def test_api_requests_are_not_recorded_when_disabled(api, fake_api):
+    await api.update()
+
+    assert api.request_metrics.to_dict()["endpoints"] == {}
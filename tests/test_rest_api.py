@@ -0,0 +1,241 @@
+"""RestAPI tests against the local fake portal API."""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from aiohttp import ClientTimeout
+
+from custom_components.citymind_water_meter.common.connectivity_status import (
+    ConnectivityStatus,
+)
+from custom_components.citymind_water_meter.common.consts import (
+    API_DATA_SECTION_CONSUMPTION_DAILY,
+    API_DATA_SECTION_CONSUMPTION_FORECAST,
+    API_DATA_SECTION_CONSUMPTION_MONTHLY,
+    API_DATA_SECTION_LAST_READ,
+    API_DATA_SECTION_ME,
+    API_DATA_SECTION_METERS,
+    API_DATA_SECTION_SETTINGS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    SETTINGS_ALERT_TYPE_ID,
+    SETTINGS_MEDIA_TYPE_ID,
+)
+from custom_components.citymind_water_meter.common.enums import (
+    AlertChannel,
+    AlertType,
+    EndpointClass,
+    ErrorClass,
+)
+from custom_components.citymind_water_meter.managers.rest_api import RestAPI
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+
+from .fake_api import FAKE_EMAIL
+
+
+async def test_initialize_connects(api, fake_api):
+    assert api.status == ConnectivityStatus.Connected
+    assert fake_api.logins == 1
+
+
+async def test_invalid_credentials(api_factory, fake_api, config_manager):
+    config_manager.config_data.update(
+        {CONF_EMAIL: FAKE_EMAIL, CONF_PASSWORD: "wrong"}
+    )
+
+    api = api_factory(fake_api)
+
+    await api.initialize()
+
+    assert api.status == ConnectivityStatus.InvalidCredentials
+    assert api.token is None
+
+
+async def test_update_loads_all_sections(api, fake_api):
+    await api.update()
+
+    meter_ids = fake_api.meter_ids
+
+    assert api.data[API_DATA_SECTION_ME] is not None
+    assert len(api.data[API_DATA_SECTION_METERS]) == len(meter_ids)
+    assert len(api.data[API_DATA_SECTION_LAST_READ]) == len(meter_ids)
+
+    for section in [
+        API_DATA_SECTION_CONSUMPTION_DAILY,
+        API_DATA_SECTION_CONSUMPTION_MONTHLY,
+        API_DATA_SECTION_CONSUMPTION_FORECAST,
+    ]:
+        assert list(api.data[section].keys()) == meter_ids
+
+
+async def test_update_request_count(api, fake_api):
+    await api.update()
+
+    meters = len(fake_api.meter_ids)
+
+    assert fake_api.count_requests() == 3 + 4 + 3 * meters
+
+
+async def test_update_limits_concurrent_requests(api_factory, fake_api_factory):
+    server = await fake_api_factory(meters=5, latency=0.02)
+    api = api_factory(server, max_concurrent_requests=3)
+
+    await api.initialize()
+
+    in_flight = 0
+    max_in_flight = 0
+    async_get = RestAPI._async_get
+
+    async def _async_get(self, *args, **kwargs):
+        nonlocal in_flight, max_in_flight
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+
+        try:
+            return await async_get(self, *args, **kwargs)
+
+        finally:
+            in_flight -= 1
+
+    with patch.object(RestAPI, "_async_get", _async_get):
+        await api.update()
+
+    assert max_in_flight == 3
+
+
+async def test_cached_sections_not_requested_again(api, fake_api):
+    await api.update()
+    await api.update()
+
+    assert fake_api.count_requests("/consumer/vacations") == 1
+    assert fake_api.count_requests("/consumption/forecast/") == len(
+        fake_api.meter_ids
+    )
+    assert fake_api.count_requests("/consumption/last-read") == 2
+    assert api.response_cache.to_dict()["hits"] > 0
+
+
+async def test_expired_token_replays_requests(api, fake_api_factory, fake_api):
+    await api.update()
+
+    fake_api.expire_tokens()
+
+    await api.update()
+
+    assert api.status == ConnectivityStatus.Connected
+    assert fake_api.logins == 2
+    assert fake_api.count_requests("/consumption/last-read") == 3
+
+
+async def test_concurrent_401_share_single_login(api_factory, fake_api_factory):
+    server = await fake_api_factory(meters=20, latency=0.01)
+    api = api_factory(server)
+
+    await api.initialize()
+    await api.update()
+
+    server.expire_tokens()
+    api.response_cache.invalidate()
+
+    await api.update()
+
+    assert api.status == ConnectivityStatus.Connected
+    assert server.logins == 2
+
+
+async def test_token_kept_until_login_succeeds(api, fake_api):
+    token = api.token
+
+    fake_api.latency = 0.05
+
+    login = asyncio.create_task(api.login())
+
+    await asyncio.sleep(0.01)
+
+    assert api.token == token
+
+    await login
+
+    new_token = api.token
+
+    assert new_token not in [None, token]
+
+    fake_api.error_rate = 1
+
+    await api.login()
+
+    assert api.token == new_token
+
+
+async def test_server_errors_fail_status(api_factory, fake_api_factory):
+    server = await fake_api_factory(meters=2)
+    api = api_factory(server)
+
+    await api.initialize()
+
+    server.error_rate = 1
+
+    await api.update()
+
+    assert api.status == ConnectivityStatus.Failed
+
+
+async def test_set_alert_settings_reloads_settings(api, fake_api):
+    await api.update()
+
+    await api.set_alert_settings(AlertType.LEAK, AlertChannel.SMS, False)
+
+    settings = [
+        (item[SETTINGS_ALERT_TYPE_ID], item[SETTINGS_MEDIA_TYPE_ID])
+        for item in api.data[API_DATA_SECTION_SETTINGS]
+    ]
+
+    assert (AlertType.LEAK.value, AlertChannel.SMS.value) not in settings
+    assert fake_api.count_requests("/consumer/myalerts/settings") == 2
+
+
+async def test_revisions_follow_content(api, fake_api):
+    await api.update()
+
+    meter_id = fake_api.meter_ids[0]
+    revisions = dict(api.revisions)
+
+    assert revisions[(API_DATA_SECTION_LAST_READ, None)] == 1
+    assert revisions[(API_DATA_SECTION_CONSUMPTION_DAILY, meter_id)] == 1
+
+    await api.update()
+
+    assert api.revisions == revisions
+
+
+async def test_hung_request_times_out(api_factory, fake_api_factory):
+    server = await fake_api_factory(meters=2, timeout_delay=5)
+    timeout = ClientTimeout(total=0.2)
+    api = api_factory(
+        server, timeouts={endpoint_class: timeout for endpoint_class in EndpointClass}
+    )
+
+    await api.initialize()
+
+    server.timeout_rate = 1
+
+    started_at = time.perf_counter()
+
+    await api.update()
+
+    assert time.perf_counter() - started_at < 2
+    assert api.status == ConnectivityStatus.Failed
+    assert api.retry_policy.last_error == ErrorClass.TIMEOUT
+
+
+async def test_connections_are_reused(api, fake_api):
+    await api.update()
+
+    connection_stats = api.connection_stats.to_dict()
+
+    assert connection_stats["requests"] == fake_api.count_requests() + 1
+    assert 0 < api.connection_stats.connections_created
+    assert api.connection_stats.connections_created <= DEFAULT_MAX_CONCURRENT_REQUESTS
+    assert api.connection_stats.connections_reused > 0
@@ -0,0 +1,218 @@
+"""RetryPolicy backoff and circuit breaker tests."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from aiohttp import ClientResponseError
+from aiohttp.hdrs import RETRY_AFTER
+from multidict import CIMultiDict
+import pytest
+
+from custom_components.citymind_water_meter.common.connectivity_status import (
+    ConnectivityStatus,
+)
+from custom_components.citymind_water_meter.common.consts import (
+    CIRCUIT_FAILURE_THRESHOLD,
+)
+from custom_components.citymind_water_meter.common.enums import CircuitState, ErrorClass
+from custom_components.citymind_water_meter.managers.retry_policy import RetryPolicy
+
+BASE_DELAY = timedelta(seconds=10)
+MAX_DELAY = timedelta(minutes=5)
+THRESHOLD = 3
+NOW = datetime(2024, 1, 1, 12)
+
+
+def create_error(status: int, retry_after: str | None = None) -> ClientResponseError:
+    headers = CIMultiDict()
+
+    if retry_after is not None:
+        headers[RETRY_AFTER] = retry_after
+
+    error = ClientResponseError(None, (), status=status, headers=headers)
+
+    return error
+
+
+def create_policy(random_value: float = 1) -> RetryPolicy:
+    policy = RetryPolicy(BASE_DELAY, MAX_DELAY, THRESHOLD, lambda: random_value)
+
+    return policy
+
+
+def test_classify_errors():
+    assert RetryPolicy.classify(TimeoutError()) == ErrorClass.TIMEOUT
+    assert RetryPolicy.classify(create_error(503)) == ErrorClass.SERVER_ERROR
+    assert RetryPolicy.classify(create_error(429)) == ErrorClass.RATE_LIMITED
+    assert RetryPolicy.classify(create_error(401)) == ErrorClass.UNAUTHORIZED
+    assert RetryPolicy.classify(create_error(404)) == ErrorClass.CLIENT_ERROR
+    assert RetryPolicy.classify(ConnectionError()) == ErrorClass.CONNECTION
+
+
+def test_backoff_grows_exponentially_up_to_max():
+    policy = create_policy()
+    delays = []
+
+    for _ in range(THRESHOLD - 1):
+        policy.record_error(TimeoutError(), NOW)
+
+        delays.append(policy.get_delay(NOW))
+
+    assert delays == [BASE_DELAY, BASE_DELAY * 2]
+
+    policy = RetryPolicy(BASE_DELAY, MAX_DELAY, 100, lambda: 1)
+
+    for _ in range(50):
+        policy.record_error(TimeoutError(), NOW)
+
+    assert policy.get_delay(NOW) == MAX_DELAY
+
+
+def test_full_jitter_spreads_delays():
+    policy = create_policy(0.25)
+
+    policy.record_error(create_error(500), NOW)
+
+    assert policy.get_delay(NOW) == BASE_DELAY * 0.25
+
+
+def test_retry_after_is_respected():
+    policy = create_policy(0)
+
+    policy.record_error(create_error(429, "120"), NOW)
+
+    assert policy.get_delay(NOW) == timedelta(seconds=120)
+
+
+def test_non_transient_errors_reset_failures():
+    policy = create_policy()
+
+    policy.record_error(TimeoutError(), NOW)
+    policy.record_error(create_error(401), NOW)
+
+    assert policy.failures == 0
+    assert policy.last_error == ErrorClass.UNAUTHORIZED
+
+
+def test_circuit_opens_and_half_open_probe_closes_it():
+    policy = create_policy()
+
+    for _ in range(THRESHOLD):
+        assert policy.allow_request(NOW)
+
+        policy.record_error(TimeoutError(), NOW)
+
+    open_delay = BASE_DELAY * 2 ** (THRESHOLD - 1)
+
+    assert policy.state == CircuitState.OPEN
+    assert not policy.allow_request(NOW)
+    assert policy.get_delay(NOW) == open_delay
+
+    probe_time = NOW + open_delay
+
+    assert policy.allow_request(probe_time)
+    assert policy.state == CircuitState.HALF_OPEN
+    assert not policy.allow_request(probe_time)
+
+    policy.record_success()
+
+    assert policy.state == CircuitState.CLOSED
+    assert policy.allow_request(probe_time)
+
+
+def test_failed_probe_opens_circuit_with_longer_delay():
+    policy = create_policy()
+
+    for _ in range(THRESHOLD):
+        policy.record_error(TimeoutError(), NOW)
+
+    first_delay = policy.get_delay(NOW)
+    probe_time = NOW + first_delay
+
+    assert policy.allow_request(probe_time)
+
+    policy.record_error(create_error(502), probe_time)
+
+    assert policy.state == CircuitState.OPEN
+    assert policy.get_delay(probe_time) == first_delay * 2
+
+
+async def test_open_circuit_stops_requests(api_factory, fake_api_factory):
+    server = await fake_api_factory(error_rate=1, error_status=503, retry_after=30)
+    api = api_factory(server)
+
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        await api.initialize()
+
+    assert api.status == ConnectivityStatus.Failed
+    assert api.retry_policy.state == CircuitState.OPEN
+    assert api.retry_policy.last_error == ErrorClass.SERVER_ERROR
+    assert api.retry_policy.get_delay() > timedelta(seconds=29)
+    assert len(server.requests) == CIRCUIT_FAILURE_THRESHOLD
+
+    await api.initialize()
+
+    assert len(server.requests) == CIRCUIT_FAILURE_THRESHOLD
+    assert api.status == ConnectivityStatus.Failed
+
+
+async def test_requests_during_half_open_probe_keep_status(
+    api_factory, fake_api_factory
+):
+    server = await fake_api_factory()
+    api = api_factory(server)
+
+    await api.initialize()
+
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        api.retry_policy.record_error(TimeoutError(), NOW)
+
+    request_count = len(server.requests)
+
+    assert api.retry_policy.allow_request()
+    assert api.retry_policy.is_probing
+
+    await api.update()
+
+    assert len(server.requests) == request_count
+    assert api.status == ConnectivityStatus.Connected
+
+    api.retry_policy.record_success()
+
+    await api.update()
+
+    assert len(server.requests) > request_count
+    assert api.status == ConnectivityStatus.Connected
+
+
+async def test_cancelled_probe_lets_next_request_probe(api_factory, fake_api_factory):
+    server = await fake_api_factory()
+    api = api_factory(server)
+
+    await api.initialize()
+
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        api.retry_policy.record_error(TimeoutError(), NOW)
+
+    server.latency = 1
+
+    update_task = asyncio.create_task(api.update())
+
+    await asyncio.sleep(0.1)
+
+    assert api.retry_policy.is_probing
+
+    update_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await update_task
+
+    assert not api.retry_policy.is_probing
+
+    server.latency = 0
+
+    await api.update()
+
+    assert api.retry_policy.state == CircuitState.CLOSED
+    assert api.status == ConnectivityStatus.Connected
@@ -0,0 +1,237 @@
+"""Statistics backfill tests, paging, checkpoints and recorder import."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.citymind_water_meter.common.consts import (
+    API_DATA_SECTION_CONSUMPTION_DAILY,
+    BACKFILL_FILE,
+    DOMAIN,
+    SERVICE_ATTR_START_DATE,
+    SERVICE_BACKFILL_STATISTICS,
+    STATISTIC_ID_CONSUMPTION,
+)
+from custom_components.citymind_water_meter.managers.statistics_backfill import (
+    StatisticsBackfill,
+)
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import get_last_statistics
+from homeassistant.config_entries import STORAGE_VERSION
+from homeassistant.core import HomeAssistant
+
+from .common import setup_integration, teardown_integration
+
+START_DATE = date(2024, 1, 1)
+END_DATE = date(2024, 3, 10)
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Coordinator refresh and delayed store writes are scheduled on purpose."""
+    return True
+
+
+async def test_backfill_pages_and_checkpoints(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+    days = (END_DATE - START_DATE).days + 1
+
+    result = await backfill.run([meter_id], START_DATE, END_DATE)
+
+    daily, monthly = result["items"]
+    checkpoint = backfill.checkpoints[meter_id]["daily"]
+    expected_sum = sum(
+        fake_api.get_consumption(meter_id, START_DATE + timedelta(days=offset))
+        for offset in range(days)
+    )
+
+    assert result["completed"]
+    assert daily["requests"] == 3
+    assert daily["statistics"] == days
+    assert monthly["requests"] == 1
+    assert monthly["statistics"] == 2
+    assert checkpoint["last"] == END_DATE.isoformat()
+    assert checkpoint["sum"] == pytest.approx(expected_sum)
+    assert backfill.checkpoints[meter_id]["monthly"]["last"] == "2024-02-01"
+
+
+async def test_backfill_is_incremental(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+
+    await backfill.run([meter_id], START_DATE, END_DATE)
+
+    result = await backfill.run([meter_id], START_DATE, END_DATE)
+
+    assert result["requests"] == 0
+
+    result = await backfill.run([meter_id], START_DATE, END_DATE + timedelta(days=5))
+
+    daily, monthly = result["items"]
+
+    assert daily["requests"] == 1
+    assert daily["statistics"] == 5
+    assert monthly["requests"] == 0
+
+
+async def test_backfill_resumes_after_failure(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+
+    fake_api.error_rate = 1
+
+    result = await backfill.run([meter_id], START_DATE, END_DATE)
+
+    assert not result["completed"]
+    assert result["statistics"] == 0
+
+    fake_api.error_rate = 0
+
+    await api.initialize()
+
+    result = await backfill.run([meter_id], START_DATE, END_DATE)
+
+    assert result["completed"]
+    assert result["items"][0]["statistics"] == (END_DATE - START_DATE).days + 1
+
+
+async def test_backfill_ends_yesterday_of_refresh(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+
+    api.analytic_periods.yesterday = datetime.combine(END_DATE, datetime.min.time())
+
+    await backfill.run([meter_id], START_DATE)
+
+    assert backfill.checkpoints[meter_id]["daily"]["last"] == END_DATE.isoformat()
+
+
+async def test_catch_up_requests_gap_at_once(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+    gap_start = END_DATE - timedelta(days=20)
+
+    await backfill.run([meter_id], START_DATE, gap_start - timedelta(days=1))
+
+    requests = fake_api.count_requests("/consumption/daily")
+
+    result = await backfill.catch_up([meter_id], END_DATE)
+
+    assert result["requests"] == 1
+    assert result["statistics"] == 21
+    assert fake_api.count_requests(f"/{gap_start.isoformat()}/") == 1
+    assert fake_api.count_requests("/consumption/daily") == requests + 1
+    assert backfill.checkpoints[meter_id]["daily"]["first"] == START_DATE.isoformat()
+    assert backfill.checkpoints[meter_id]["daily"]["last"] == END_DATE.isoformat()
+
+
+async def test_catch_up_of_last_day_uses_refresh_data(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+    new_meter_id = fake_api.meter_ids[1]
+
+    await backfill.run([meter_id], START_DATE, END_DATE - timedelta(days=1))
+
+    daily_data = {
+        meter_id: await api.get_consumption(
+            API_DATA_SECTION_CONSUMPTION_DAILY, meter_id, END_DATE, END_DATE
+        )
+    }
+
+    result = await backfill.catch_up([meter_id, new_meter_id], END_DATE, daily_data)
+
+    meter_result, new_meter_result = result["items"]
+
+    assert meter_result["requests"] == 0
+    assert meter_result["statistics"] == 1
+    assert new_meter_result["requests"] == 1
+    assert new_meter_result["statistics"] == 1
+    assert backfill.checkpoints[new_meter_id]["daily"]["first"] == END_DATE.isoformat()
+
+
+async def test_days_without_data_are_requested_again(api, fake_api):
+    backfill = StatisticsBackfill(None, api, "entry")
+    meter_id = fake_api.meter_ids[0]
+    data_until = END_DATE - timedelta(days=2)
+
+    fake_api.data_until = data_until
+
+    result = await backfill.run([meter_id], START_DATE, END_DATE)
+
+    assert result["completed"]
+    assert backfill.checkpoints[meter_id]["daily"]["last"] == data_until.isoformat()
+
+    fake_api.data_until = None
+
+    result = await backfill.catch_up([meter_id], END_DATE)
+
+    assert result["requests"] == 1
+    assert result["statistics"] == 2
+    assert backfill.checkpoints[meter_id]["daily"]["last"] == END_DATE.isoformat()
+
+
+async def test_refresh_ingests_yesterday(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=2)
+
+    coordinator = await setup_integration(hass, server)
+    yesterday = coordinator.config_manager.analytic_periods.yesterday_iso
+
+    await hass.async_block_till_done()
+
+    checkpoints = coordinator.statistics_backfill.checkpoints
+
+    for meter_id in server.meter_ids:
+        assert checkpoints[meter_id]["daily"]["last"] == yesterday
+
+    assert server.count_requests(f"/{yesterday}/{yesterday}") == 0
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_backfill_service_imports_statistics(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, fake_api_factory
+):
+    server = await fake_api_factory(meters=1)
+
+    coordinator = await setup_integration(hass, server)
+    meter_id = server.meter_ids[0]
+    start_date = datetime.now().date() - timedelta(days=10)
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BACKFILL_STATISTICS,
+        {SERVICE_ATTR_START_DATE: start_date.isoformat()},
+        blocking=True,
+        return_response=True,
+    )
+
+    await async_wait_recording_done(hass)
+
+    statistic_id = STATISTIC_ID_CONSUMPTION.format(meter_id=meter_id, period="daily")
+    checkpoint = coordinator.statistics_backfill.checkpoints[meter_id]["daily"]
+
+    statistics = await get_instance(hass).async_add_executor_job(
+        get_last_statistics, hass, 1, statistic_id, True, {"sum"}
+    )
+
+    assert result["items"][0]["statistics"] == 10
+    assert statistics[statistic_id][0]["sum"] == pytest.approx(checkpoint["sum"])
+
+    await teardown_integration(hass, coordinator)
+
+
+async def test_remove_checkpoints_of_entry(hass: HomeAssistant, hass_storage):
+    key = BACKFILL_FILE.format(entry_id="entry")
+
+    hass_storage[key] = {"version": STORAGE_VERSION, "key": key, "data": {}}
+
+    await StatisticsBackfill.async_remove(hass, "entry")
+
+    assert key not in hass_storage
@@ -0,0 +1,109 @@
+"""TariffEngine tests, tiers, allowances, fixed charges and VAT."""
+from __future__ import annotations
+
+import pytest
+import voluptuous as vol
+
+from custom_components.citymind_water_meter import SERVICE_SET_TARIFFS_SCHEMA
+from custom_components.citymind_water_meter.common.consts import (
+    STORAGE_DATA_METER_FIXED_CHARGE,
+    STORAGE_DATA_METER_HIGH_RATE_COST,
+    STORAGE_DATA_METER_HOUSEHOLD_SIZE,
+    STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD,
+    STORAGE_DATA_METER_LOW_RATE_COST,
+    STORAGE_DATA_METER_SEWAGE_COST,
+    STORAGE_DATA_METER_TIERS,
+    STORAGE_DATA_METER_VAT,
+    TARIFF_TIER_COST,
+    TARIFF_TIER_LIMIT,
+)
+from custom_components.citymind_water_meter.managers.tariff_engine import TariffEngine
+from custom_components.citymind_water_meter.models.tariff import Tariff
+
+TWO_TIERS_CONFIG = {
+    STORAGE_DATA_METER_LOW_RATE_CONSUMPTION_THRESHOLD: 3.5,
+    STORAGE_DATA_METER_LOW_RATE_COST: 8,
+    STORAGE_DATA_METER_HIGH_RATE_COST: 14,
+    STORAGE_DATA_METER_SEWAGE_COST: 2,
+}
+
+THREE_TIERS_CONFIG = {
+    STORAGE_DATA_METER_TIERS: [
+        {TARIFF_TIER_COST: 20},
+        {TARIFF_TIER_LIMIT: 5, TARIFF_TIER_COST: 10},
+        {TARIFF_TIER_LIMIT: 2, TARIFF_TIER_COST: 5},
+    ],
+    STORAGE_DATA_METER_FIXED_CHARGE: 30,
+    STORAGE_DATA_METER_VAT: 17,
+    STORAGE_DATA_METER_HOUSEHOLD_SIZE: 2,
+}
+
+
+@pytest.mark.parametrize(
+    "consumption, low_rate_consumption, high_rate_consumption",
+    [(0, 0, 0), (2, 2, 0), (3.5, 3.5, 0), (10, 3.5, 6.5)],
+)
+def test_two_tiers(consumption, low_rate_consumption, high_rate_consumption):
+    tariff = Tariff.from_config(TWO_TIERS_CONFIG)
+
+    costs = TariffEngine.calculate({"1": consumption}, {"1": tariff})["1"]
+
+    assert costs.low_rate_consumption == pytest.approx(low_rate_consumption)
+    assert costs.high_rate_consumption == pytest.approx(high_rate_consumption)
+    assert costs.low_rate_cost == pytest.approx(low_rate_consumption * 8)
+    assert costs.high_rate_cost == pytest.approx(high_rate_consumption * 14)
+    assert costs.sewage_cost == pytest.approx(consumption * 2)
+    assert costs.total_cost == pytest.approx(
+        low_rate_consumption * 8 + high_rate_consumption * 14 + consumption * 2
+    )
+
+
+def test_tiers_with_allowance_fixed_charge_and_vat():
+    tariff = Tariff.from_config(THREE_TIERS_CONFIG)
+
+    costs = TariffEngine.calculate({"1": 14}, {"1": tariff})["1"]
+
+    # Limits per resident, 2 residents: 0-4 at 5, 4-10 at 10, above at 20
+    subtotal = 4 * 5 + 6 * 10 + 4 * 20 + 30
+
+    assert costs.tier_consumption == pytest.approx([4, 6, 4])
+    assert costs.vat_cost == pytest.approx(subtotal * 0.17)
+    assert costs.total_cost == pytest.approx(subtotal * 1.17)
+
+
+def test_meters_with_different_tariffs_in_one_batch():
+    tariffs = {
+        "1": Tariff.from_config(TWO_TIERS_CONFIG),
+        "2": Tariff.from_config(THREE_TIERS_CONFIG),
+        "3": Tariff.from_config({}),
+    }
+    consumption = {"1": 5, "2": 3, "3": None}
+
+    costs = TariffEngine.calculate(consumption, tariffs)
+
+    for meter_id in tariffs:
+        expected = TariffEngine.calculate(
+            {meter_id: consumption[meter_id]}, {meter_id: tariffs[meter_id]}
+        )[meter_id]
+
+        assert costs[meter_id].to_dict() == expected.to_dict()
+
+    assert len(costs["1"].tier_consumption) == 2
+    assert len(costs["2"].tier_consumption) == 3
+    assert costs["3"].total_cost == 0
+
+
+def test_empty_household_is_not_applied():
+    config = {**THREE_TIERS_CONFIG, STORAGE_DATA_METER_HOUSEHOLD_SIZE: 0}
+
+    tariff = Tariff.from_config(config)
+
+    assert tariff.household_size == 1
+    assert tariff.get_limits()[:2] == [2, 5]
+
+    with pytest.raises(vol.Invalid):
+        SERVICE_SET_TARIFFS_SCHEMA({STORAGE_DATA_METER_HOUSEHOLD_SIZE: 0})
+
+    service_data = SERVICE_SET_TARIFFS_SCHEMA({STORAGE_DATA_METER_HOUSEHOLD_SIZE: 1})
+
+    assert service_data[STORAGE_DATA_METER_HOUSEHOLD_SIZE] == 1